@@ -0,0 +1,283 @@
+"""
+On-disk cache of validation results for blocks of a CSV file.
+
+Sites tend to validate the same extract over and over while fixing a few rows
+or appending new ones. We split the data rows into record-aligned blocks (see
+`csv_block_boundaries`), hash each block and keep its error count and sampled
+errors in a sidecar file. A re-run only validates the blocks whose hash is not
+in the cache. When the file's size and modification time are unchanged we
+don't even hash it.
+
+Cached results are only reused for the same model (distribution, version and
+model name, see `model_identity`) and the same CSV header.
+
+The sidecar holds sampled errors, i.e. actual data values. Keep it next to the
+data and don't share it. It is plain JSON, so reading a sidecar someone else
+put there can't run code; error context values that aren't JSON (dates,
+exceptions, ...) come back as strings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import warnings
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, packages_distributions, version
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from pydantic import BaseModel
+from pydantic_core import ErrorDetails, to_jsonable_python
+
+from datavalgen.error_store import ErrorStore
+from datavalgen.read_csv import csv_block_boundaries
+
+__all__ = [
+    "CACHE_BLOCK_SIZE",
+    "CachedBlock",
+    "ValidationCache",
+    "default_cache_path",
+    "model_identity",
+]
+
+# Blocks are validated (and cached) as a whole, so this trades the cost of
+# revalidating a changed block against the size of the sidecar file.
+CACHE_BLOCK_SIZE = 8 << 20
+
+# Bump when the sidecar layout changes, old sidecars are then ignored.
+_CACHE_FORMAT = 2
+
+_HASH_READ_SIZE = 1 << 20
+
+# (start, end, content digest) of one block of data rows.
+Block = tuple[int, int, str]
+
+
+def default_cache_path(csv_path: str | Path) -> Path:
+    """
+    Sidecar path used for `csv_path` when the caller doesn't pick one.
+    """
+    return Path(f"{csv_path}.datavalgen-cache")
+
+
+def _distribution_version(module: str) -> str:
+    top_level = module.split(".", 1)[0]
+    names = packages_distributions().get(top_level, [])
+    if not names:
+        return "<no distribution>"
+    try:
+        return f"{names[0]} {version(names[0])}"
+    except PackageNotFoundError:
+        return names[0]
+
+
+def _version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "<unknown>"
+
+
+def model_identity(model: type[BaseModel]) -> str:
+    """
+    Identify a model for caching: the distribution (and version) providing
+    it, its import path, and the datavalgen and pydantic versions.
+
+    The JSON schema of the model is hashed in too, so editing a model in a
+    development install without bumping its version still invalidates the
+    cache for most changes (but not for edits to validator functions).
+    """
+    parts = [
+        _distribution_version(model.__module__),
+        f"{model.__module__}.{model.__qualname__}",
+        f"datavalgen {_version('datavalgen')}",
+        f"pydantic {_version('pydantic')}",
+    ]
+    try:
+        schema = json.dumps(model.model_json_schema(), sort_keys=True, default=str)
+    except Exception:
+        # Some types have no JSON schema; the names and versions still apply.
+        schema = ""
+    parts.append(hashlib.sha256(schema.encode()).hexdigest())
+    return "\n".join(parts)
+
+
+@dataclass(frozen=True)
+class CachedBlock:
+    """
+    Validation result for one block, with row indices relative to the start
+    of the block.
+    """
+
+    num_rows: int
+    num_errors: int
+    truncated: bool
+    errors: ErrorStore
+    # `max_errors` of the sample the errors were kept with.
+    max_errors: int | None
+
+    def covers(self, max_errors: int | None) -> bool:
+        """
+        Whether the sampled errors are enough for a run keeping `max_errors`
+        problem cells per block.
+        """
+        if not self.truncated:
+            return True
+        if self.max_errors is None or max_errors is None:
+            return self.max_errors is None
+        return self.max_errors >= max_errors
+
+
+def _block_to_json(block: CachedBlock) -> dict[str, Any]:
+    state = asdict(block)
+    state["errors"] = [
+        to_jsonable_python(error, fallback=str) for error in block.errors
+    ]
+    return state
+
+
+def _block_from_json(state: dict[str, Any]) -> CachedBlock:
+    errors: list[ErrorDetails] = []
+    for error in state["errors"]:
+        if not isinstance(error, dict) or not isinstance(error.get("loc"), list):
+            raise ValueError(f"invalid cached error {error!r}")
+        error["loc"] = tuple(error["loc"])
+        errors.append(error)  # type: ignore[arg-type]
+    return CachedBlock(
+        num_rows=int(state["num_rows"]),
+        num_errors=int(state["num_errors"]),
+        truncated=bool(state["truncated"]),
+        errors=ErrorStore(errors),
+        max_errors=None if state["max_errors"] is None else int(state["max_errors"]),
+    )
+
+
+def _hash_range(fp: BinaryIO, start: int, end: int) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    fp.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        data = fp.read(min(remaining, _HASH_READ_SIZE))
+        if not data:
+            break
+        digest.update(data)
+        remaining -= len(data)
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    Cached block results for one CSV file, loaded from and saved to a sidecar
+    file.
+
+    `key` identifies everything besides the data that the results depend on
+    (model, CSV header); a sidecar written with another key is ignored.
+    """
+
+    def __init__(self, path: str | Path, key: str) -> None:
+        self.path = Path(path)
+        self.key = key
+        # (size, mtime_ns) of the CSV when the sidecar was written.
+        self._stamp: tuple[int, int] | None = None
+        self._blocks: list[Block] = []
+        self._results: dict[str, CachedBlock] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                state = json.load(fp)
+            if (
+                not isinstance(state, dict)
+                or state.get("format") != _CACHE_FORMAT
+                or state.get("key") != self.key
+            ):
+                return
+            size, mtime_ns = state["stamp"]
+            blocks = [
+                (int(start), int(end), str(digest))
+                for start, end, digest in state["blocks"]
+            ]
+            results = {
+                str(digest): _block_from_json(block)
+                for digest, block in state["results"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            # A broken or foreign sidecar only costs us a full validation.
+            warnings.warn(
+                f"Ignoring unreadable validation cache {self.path}: {exc}",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            return
+        self._stamp = (int(size), int(mtime_ns))
+        self._blocks = blocks
+        self._results = results
+
+    def blocks(
+        self, csv_path: str | Path, block_size: int = CACHE_BLOCK_SIZE
+    ) -> list[Block]:
+        """
+        Split `csv_path` into blocks and hash them, or reuse the blocks of the
+        last run when the file's size and modification time are unchanged.
+        """
+        stat = os.stat(csv_path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if stamp == self._stamp:
+            return self._blocks
+
+        boundaries = csv_block_boundaries(csv_path, block_size)
+        with open(csv_path, "rb") as fp:
+            blocks = [
+                (start, end, _hash_range(fp, start, end))
+                for start, end in zip(boundaries[:-1], boundaries[1:])
+            ]
+        self._stamp = stamp
+        self._blocks = blocks
+        return blocks
+
+    def get(self, digest: str, max_errors: int | None) -> CachedBlock | None:
+        """
+        Return the cached result for a block, if it has enough sampled errors
+        for `max_errors`.
+        """
+        result = self._results.get(digest)
+        if result is None or not result.covers(max_errors):
+            return None
+        return result
+
+    def put(self, digest: str, result: CachedBlock) -> None:
+        self._results[digest] = result
+
+    def save(self) -> None:
+        """
+        Write the sidecar, only keeping the results of the current blocks.
+        Failing to write it is not an error, the next run is just slower.
+        """
+        digests = {digest for _start, _end, digest in self._blocks}
+        state = {
+            "format": _CACHE_FORMAT,
+            "key": self.key,
+            "stamp": self._stamp,
+            "blocks": self._blocks,
+            "results": {
+                digest: _block_to_json(result)
+                for digest, result in self._results.items()
+                if digest in digests
+            },
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(state, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            warnings.warn(
+                f"Could not write validation cache {self.path}: {exc}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
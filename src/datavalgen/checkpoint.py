@@ -0,0 +1,136 @@
+"""
+Checkpoints that let a long validation resume where it was interrupted.
+
+Tasks on very large datasets can be preempted or hit a wall-clock limit. With
+a checkpoint, the data rows are validated in record-aligned blocks (see
+`csv_block_boundaries`) and after every block we write how far we got: the
+byte offset and row offset of the next block and the running error count. A
+restarted validation of the same file with the same model skips to that
+offset and ends with exactly the same count.
+
+Checkpoints never hold data values, only offsets, the count and a fingerprint
+(a hash of the model identity, the CSV header and the file's size and
+modification time), so they are as safe to keep around as the count itself.
+Because of that they only work when errors are just counted (`max_errors=0`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import warnings
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence
+
+from pydantic import BaseModel
+
+from datavalgen.cache import model_identity
+
+__all__ = [
+    "CHECKPOINT_BLOCK_SIZE",
+    "Checkpoint",
+    "ValidationCheckpoint",
+    "checkpoint_fingerprint",
+    "default_checkpoint_dir",
+]
+
+# We checkpoint after every block, so this is the most work a restart redoes.
+CHECKPOINT_BLOCK_SIZE = 64 << 20
+
+# Bump when the checkpoint layout changes, old checkpoints are then ignored.
+_CHECKPOINT_FORMAT = 1
+
+
+def default_checkpoint_dir(output_path: str | Path) -> Path:
+    """
+    Directory next to `output_path` that holds the checkpoints of the CSVs
+    validated for it.
+    """
+    return Path(f"{output_path}.datavalgen-checkpoint")
+
+
+def checkpoint_fingerprint(
+    csv_path: str | Path, model: type[BaseModel], columns: Sequence[str]
+) -> str:
+    """
+    Hash of what a checkpoint is only valid for: the model (see
+    `model_identity`), the CSV header and the file's size and modification
+    time.
+    """
+    stat = os.stat(csv_path)
+    parts = [
+        model_identity(model),
+        repr(list(columns)),
+        str(stat.st_size),
+        str(stat.st_mtime_ns),
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """
+    How far a validation got.
+    """
+
+    # Byte offset (a record boundary) of the first data row not validated yet.
+    offset: int = 0
+    # Number of data rows before `offset`.
+    row_offset: int = 0
+    # Errors found before `offset`.
+    num_errors: int = 0
+
+
+class ValidationCheckpoint:
+    """
+    Checkpoint file of one CSV, only used while the fingerprint matches.
+    """
+
+    def __init__(self, path: str | Path, fingerprint: str) -> None:
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+
+    def load(self) -> Checkpoint | None:
+        """
+        Return the saved checkpoint, or None if there is no usable one.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                state = json.load(fp)
+            if (
+                state.get("format") != _CHECKPOINT_FORMAT
+                or state.get("fingerprint") != self.fingerprint
+            ):
+                return None
+            return Checkpoint(
+                offset=int(state["offset"]),
+                row_offset=int(state["row_offset"]),
+                num_errors=int(state["num_errors"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """
+        Write `checkpoint`, atomically. Failing to write it is not an error,
+        a restart just has more work to redo.
+        """
+        state = {
+            "format": _CHECKPOINT_FORMAT,
+            "fingerprint": self.fingerprint,
+            **asdict(checkpoint),
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(state, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            warnings.warn(
+                f"Could not write validation checkpoint {self.path}: {exc}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
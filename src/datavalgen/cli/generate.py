@@ -1,22 +1,44 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import os
 import sys
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any
 
 from datavalgen.cli.utils.print import print_factory_list
-from datavalgen.factory import BaseDataModelFactory
 from datavalgen.plugins import get_factory
+from datavalgen.write_table import WRITE_FORMATS, open_table_writer
 from datavalgen.cli.utils.docker import (
     docker_detect_missing_volume,
     docker_fix_permissions,
 )
-from pandas import DataFrame
+
+# `datavalgen validate` shares the dispatcher with this module, so we keep
+# the heavy imports out of module import time.
+if TYPE_CHECKING:
+    from datavalgen.factory import BaseDataModelFactory
+    from pandas import DataFrame
 
 __all__: list[str] = ["main"]
 
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _shard(text: str) -> tuple[int, int]:
+    """
+    Parse `i/N` (counting from 1) into zero-based `(shard, num_shards)`.
+    """
+    index, _, total = text.partition("/")
+    try:
+        shard, num_shards = int(index), int(total)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {text!r}")
+    if not 1 <= shard <= num_shards:
+        raise argparse.ArgumentTypeError(f"invalid shard {text!r}")
+    return shard - 1, num_shards
+
 
 def parse_args(argv) -> Any:
     default_datafactory: str | None = os.environ.get("DATAVALGEN_FACTORY")
@@ -50,12 +72,52 @@ def parse_args(argv) -> Any:
     p.add_argument(
         "--force", action="store_true", help="Overwrite existing output file"
     )
+    p.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="ROWS",
+        help="Generate and write ROWS rows at a time, this bounds the memory "
+        f"used (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    p.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for reproducible rows. The same seed and --chunk-size give "
+        "the same rows with any --workers or --shard (default: a random seed, "
+        "which is printed)",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes generating chunks (default: 1)",
+    )
+    p.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="i/N",
+        help="Only generate part i of N (counting from 1) of the rows, e.g. on "
+        "N nodes. Concatenated, the parts are the rows of the whole run",
+    )
+    p.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="Write every chunk to its own file in the -o directory, named "
+        "after its place in the whole run (part-000000.csv, ...)",
+    )
     p.add_argument(
         "--format",
-        choices=["csv", "parquet"],
+        choices=WRITE_FORMATS,
         default="csv",
         help="Output format if -o is given (default: csv)",
     )
+    p.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Generate column by column with NumPy, much faster for many rows "
+        "(valid rows, but different values than the default)",
+    )
     p.add_argument("--columns", help="Comma-separated subset of columns to keep")
     p.add_argument(
         "-r",
@@ -80,6 +142,31 @@ def parse_args(argv) -> Any:
     if not args.output and not args.show_df:
         p.error("Please provide either -o/--output or --show-df.")
 
+    if args.chunk_size < 1:
+        p.error("--chunk-size must be at least 1.")
+
+    if args.workers < 1:
+        p.error("--workers must be at least 1.")
+
+    if args.shard and args.seed is None:
+        p.error("--shard needs --seed, so that all shards are of the same run.")
+
+    if args.partitioned and args.show_df:
+        p.error("--partitioned needs -o/--output.")
+
+    # may be ["a=1,b=2", "c=foo"] etc.
+    args.replacements = {}
+    for spec in args.replace or []:
+        for pair in spec.split(","):
+            if "=" not in pair:
+                p.error(f"Bad --replace syntax: {pair!r} (expected COL=VAL)")
+            col, val = [s.strip() for s in pair.split("=", 1)]
+            args.replacements[col] = val
+
+    args.columns = (
+        [c.strip() for c in args.columns.split(",")] if args.columns else None
+    )
+
     return args
 
 
@@ -96,40 +183,45 @@ def main(argv: list[str] | None = None) -> None:
         distribution=distribution,
     )
 
-    df: DataFrame = factory_cls.batch_dataframe(args.num_rows)
-
-    # TODO: this replace option was a quick last-minute addition since fake
-    # data generation is very rudimentary. Improve & remove this?
-    if args.replace:
-        replacements: dict[str, str] = {}
-        for spec in args.replace:
-            # may be ["a=1,b=2", "c=foo"] etc.
-            for pair in spec.split(","):
-                # TODO: move this check to end of parse_args()
-                if "=" not in pair:
-                    sys.exit(f"Bad --replace syntax: {pair!r} (expected COL=VAL)")
-                col, val = [s.strip() for s in pair.split("=", 1)]
-                if col not in df.columns:
-                    sys.exit(f"--replace: column {col!r} not in DataFrame")
-                replacements[col] = val
-
-        for col, val in replacements.items():
-            df[col] = val
-
-    # optional column filter
-    if args.columns:
-        cols: list[str] = [c.strip() for c in args.columns.split(",")]
-        missing: set[str] = set(cols) - set(df.columns)
-        if missing:
-            sys.exit(f"Columns not in model: {', '.join(missing)}")
-        df = cast(DataFrame, df[cols])
+    # --columns and --replace are applied while generating, so dropped
+    # columns are never generated and replaced ones are constant columns
+    options: dict[str, Any] = {
+        "columnar": args.columnar,
+        "columns": args.columns,
+        "fixed": args.replacements,
+    }
+
+    from datavalgen.parallel_generation import (
+        GenerationChunk,
+        generate_chunk,
+        iter_generated_chunks,
+        new_seed,
+        partition_path,
+        plan_generation_chunks,
+        write_partitions,
+    )
+
+    seed: int = new_seed() if args.seed is None else args.seed
+    try:
+        if args.show_df:
+            # seeded like the first chunk of a run, so --seed repeats it
+            df: DataFrame = generate_chunk(
+                factory_cls, GenerationChunk(0, args.num_rows), seed=seed, **options
+            )
+        else:
+            # checks the options on one row before we touch the output
+            # (workers can't report these errors)
+            df = factory_cls.batch_dataframe(1, **options)
+    except ValueError as exc:
+        sys.exit(str(exc))
 
     if args.show_df:
         print(df)
         return
 
     out_path: Path = args.output
-    if out_path.exists() and not args.force:
+    # shards of a partitioned run share the directory
+    if out_path.exists() and not args.force and not args.partitioned:
         sys.exit(f"{out_path} exists. Use --force to overwrite.")
 
     out_path = out_path.resolve()
@@ -139,14 +231,56 @@ def main(argv: list[str] | None = None) -> None:
     if docker_detect_missing_volume(out_path):
         sys.exit(1)
 
-    if args.format == "csv":
-        df.to_csv(out_path, index=False)
+    shard, num_shards = args.shard or (0, 1)
+    chunks = plan_generation_chunks(
+        args.num_rows, chunk_size=args.chunk_size, shard=shard, num_shards=num_shards
+    )
+    num_rows = sum(chunk.num_rows for chunk in chunks)
+    options["seed"] = seed
+
+    if args.partitioned:
+        if out_path.is_file():
+            sys.exit(f"--partitioned: {out_path} is a file, not a directory.")
+        existing = [
+            path
+            for path in (partition_path(out_path, c.index, args.format) for c in chunks)
+            if path.exists()
+        ]
+        if existing and not args.force:
+            sys.exit(f"{existing[0]} exists. Use --force to overwrite.")
+
+    if args.partitioned:
+        # the workers open the writers, check for pyarrow before they start
+        if args.format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+            sys.exit("Parquet output needs 'pyarrow'.")
+        write_partitions(
+            factory_cls,
+            chunks,
+            out_path,
+            file_format=args.format,
+            workers=args.workers,
+            **options,
+        )
     else:
         try:
-            df.to_parquet(out_path, index=False)
+            writer = open_table_writer(out_path, args.format)
         except ImportError:
             sys.exit("Parquet output needs 'pyarrow'.")
+        with writer:
+            if not chunks:
+                # an empty shard, still write the header
+                writer.write(df[:0])
+            # drop every chunk once written, so only the chunks being
+            # generated are in memory
+            for chunk in iter_generated_chunks(
+                factory_cls, chunks, workers=args.workers, **options
+            ):
+                writer.write(chunk)
+                del chunk
 
     docker_fix_permissions(out_path)
 
-    print(f"Generated {args.num_rows} rows to {out_path} in {args.format} format.")
+    print(
+        f"Generated {num_rows} rows to {out_path} in {args.format} format "
+        f"(seed {seed})."
+    )
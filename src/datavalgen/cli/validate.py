@@ -4,15 +4,32 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from datavalgen.cli.utils.print import print_model_list
 from pydantic import BaseModel
 from datavalgen.plugins import get_model
 
-from datavalgen.read_csv import read_csv_columns
-from datavalgen.report_errors import format_val_errors
-from datavalgen.validate import check_column_names, check_csv_file
+from datavalgen.cache import default_cache_path
+from datavalgen.memory import parse_memory_size, peak_rss
+from datavalgen.read_csv import (
+    CSV_READERS,
+    csv_compression,
+    expand_csv_paths,
+    read_csv_columns,
+)
+from datavalgen.read_table import read_table_columns, table_format
+from datavalgen.report_errors import format_error_rate_estimate, format_val_errors
+from datavalgen.validate import (
+    ABORT_MIN_ROWS,
+    ENGINES,
+    CsvCheckResult,
+    check_column_names,
+    check_csv_file,
+    check_csv_files,
+    check_csv_rows,
+    check_table_file,
+)
 
 __all__: list[str] = ["main"]
 
@@ -28,6 +45,28 @@ def find_default_csv_path() -> Path | None:
         return candidate
 
 
+def _row_range(text: str) -> tuple[int, int]:
+    """
+    Parse `FIRST-LAST` (or a single row) into zero-based `(start, stop)`.
+    """
+    first, _, last = text.partition("-")
+    try:
+        start = int(first)
+        stop = int(last) if last else start
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FIRST-LAST, got {text!r}")
+    if start < 1 or stop < start:
+        raise argparse.ArgumentTypeError(f"invalid row range {text!r}")
+    return start - 1, stop
+
+
+def _memory_size(text: str) -> int:
+    try:
+        return parse_memory_size(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+
+
 def parse_args(argv) -> Any:
     default_model: str | None = os.environ.get("DATAVALGEN_MODEL")
 
@@ -46,7 +85,12 @@ def parse_args(argv) -> Any:
         "--data",
         default=find_default_csv_path(),
         type=Path,
-        help="Path to the CSV you want to check",
+        nargs="+",
+        help="Path to the CSV (or a Parquet/Arrow file) you want to check. "
+        "gzip, bz2, xz and zstd compressed CSVs are decompressed on the fly. "
+        "Several paths, glob patterns (quoted) or directories (all *.csv and "
+        "*.csv.gz, ... files below them) validate many files in one go, "
+        "--workers CSVs at a time",
     )
     p.add_argument(
         "--max-errors",
@@ -54,6 +98,113 @@ def parse_args(argv) -> Any:
         default=10,
         help="How many individual cell errors to show (default: 10)",
     )
+    p.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first error (same as --stop-after 1)",
+    )
+    p.add_argument(
+        "--stop-after",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Stop after N problem cells; the reported error count is then a "
+        "lower bound",
+    )
+    p.add_argument(
+        "--abort-error-rate",
+        type=float,
+        default=0.9,
+        metavar="RATE",
+        help=f"Stop early when at least this fraction of the first "
+        f"{ABORT_MIN_ROWS} rows have errors, which usually means the whole file "
+        "is off (wrong delimiter, shifted columns, ...); 0 disables this "
+        "(default: 0.9)",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to validate the CSV (default: 1)",
+    )
+    p.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="Number of threads validating chunks concurrently; only used on "
+        "free-threaded (no-GIL) Python builds (default: 1)",
+    )
+    p.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="batch",
+        help="How rows are validated: 'batch' runs every row through pydantic, "
+        "'columnar' pre-checks whole columns and only runs suspicious rows "
+        "through pydantic, 'per-field' validates each distinct value of a "
+        "column only once (default: batch)",
+    )
+    p.add_argument(
+        "--reader",
+        choices=CSV_READERS,
+        default="pandas",
+        help="CSV parser backend; 'pyarrow' parses in several threads, "
+        "'csv' streams rows with the stdlib csv module and needs little "
+        "memory (default: pandas)",
+    )
+    p.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Parse up to N chunks ahead in a reader thread while validating "
+        "(default: 0, no reader thread)",
+    )
+    p.add_argument(
+        "--memory-limit",
+        type=_memory_size,
+        default=None,
+        metavar="SIZE",
+        help="Size chunks to keep memory use around SIZE (e.g. 512M, 2G), "
+        "from the measured size of the rows, instead of a fixed number of "
+        "rows; leave some headroom below a hard container limit",
+    )
+    p.add_argument(
+        "--sample",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Only validate about N random rows (and the first chunk) and "
+        "estimate the error rate of the whole file",
+    )
+    p.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for --sample, to validate the same rows again",
+    )
+    p.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache results per block of the CSV in a sidecar file next to it "
+        "and only revalidate changed blocks on the next run. The sidecar "
+        "contains data values, do not share it",
+    )
+    p.add_argument(
+        "--rows",
+        type=_row_range,
+        default=None,
+        metavar="FIRST-LAST",
+        help="Only validate these data rows (counting from 1, the row after "
+        "the header), e.g. to recheck rows after fixing them. Uses the row "
+        "index (see --index), so it is fast anywhere in the file",
+    )
+    p.add_argument(
+        "--index",
+        action="store_true",
+        help="Report true line numbers, also with newlines inside quoted "
+        "fields or blank lines, from an index of the rows kept in a sidecar "
+        "file next to the CSV (byte offsets only, no data values)",
+    )
     p.add_argument(
         "-l",
         "--list",
@@ -80,6 +231,124 @@ def parse_args(argv) -> Any:
     return args
 
 
+def _print_check(
+    csv_check: CsvCheckResult,
+    max_errors: int,
+    line_numbers: Callable[[int], int] | None = None,
+) -> None:
+    # Errors in sampled rows are only counted, don't claim there are none.
+    if csv_check.estimate is None or csv_check.errors or not csv_check.num_errors:
+        print(
+            format_val_errors(
+                csv_check.errors,
+                max_errors,
+                truncated=csv_check.truncated,
+                line_numbers=line_numbers,
+            )
+        )
+    if csv_check.estimate is not None:
+        print(format_error_rate_estimate(csv_check.estimate))
+    if csv_check.stop_reason is not None:
+        print(f"⚠️  {csv_check.stop_reason}")
+
+
+def _print_peak_memory(memory_limit: int | None) -> None:
+    peak = peak_rss()
+    if memory_limit is None or peak is None:
+        return
+    print(
+        f"📈 Peak memory use: {peak >> 20} MiB "
+        f"(--memory-limit {memory_limit >> 20} MiB)."
+    )
+
+
+def _validate_many(
+    paths: list[Path], model: type[BaseModel], args: Any, options: dict[str, Any]
+) -> None:
+    """
+    Validate several files with one model, print a summary per file and in
+    total, and exit with 1 if any file has problems.
+
+    CSV files are validated `--workers` at a time, Parquet and Arrow files
+    one after the other with `check_table_file`.
+    """
+    tables = {path for path in paths if table_format(path) is not None}
+    if tables and args.engine == "columnar":
+        sys.exit("--engine columnar only works on CSV files.")
+
+    # Header problems are cheap to find, so we report them without
+    # scheduling the file at all.
+    column_errors: dict[Path, tuple[str, ...]] = {}
+    for path in paths:
+        try:
+            columns = (
+                read_table_columns(path)
+                if path in tables
+                else read_csv_columns(path, args.reader)
+            )
+        except ImportError as exc:
+            sys.exit(str(exc))
+        column_check = check_column_names(columns, model)
+        if column_check.errors:
+            column_errors[path] = column_check.errors
+
+    to_check = [
+        path for path in paths if path not in column_errors and path not in tables
+    ]
+    results = dict(
+        zip(
+            to_check,
+            check_csv_files(
+                to_check,
+                model,
+                workers=args.workers,
+                use_cache=args.cache,
+                **options,
+            ),
+        )
+    )
+    for path in paths:
+        if path in tables and path not in column_errors:
+            results[path] = check_table_file(
+                path,
+                model,
+                max_errors=args.max_errors,
+                engine=args.engine,
+                threads=args.threads,
+                stop_after=options["stop_after"],
+            )
+
+    num_failed = 0
+    num_errors = 0
+    for path in paths:
+        if path in column_errors:
+            num_failed += 1
+            print(f"❌ {path}: column names do not match the schema.")
+            print("\n".join(column_errors[path]))
+            continue
+        csv_check = results[path]
+        if not csv_check.num_errors:
+            print(f"✅ {path}: no errors.")
+            if csv_check.estimate is not None:
+                print(format_error_rate_estimate(csv_check.estimate))
+            continue
+        num_failed += 1
+        num_errors += csv_check.num_errors
+        print(f"❌ {path}: {csv_check.num_errors} errors.")
+        _print_check(csv_check, args.max_errors)
+
+    print(
+        f"\n{len(paths)} files checked, {num_failed} with problems, "
+        f"{num_errors} errors in total."
+    )
+    _print_peak_memory(args.memory_limit)
+    if num_errors:
+        print(
+            f'⚠️  Note: errors above contain your actual data values ("Got: .."). Do not share.'
+        )
+    sys.exit(1 if num_failed else 0)
+
+
 def main(argv: list[str] | None = None) -> None:
     """Entry-point for `datavalgen validate ...`."""
     args = parse_args(argv)
@@ -90,7 +359,48 @@ def main(argv: list[str] | None = None) -> None:
         sys.exit(0)
 
     model: type[BaseModel] = get_model(args.model, distribution=distribution)
-    column_check = check_column_names(read_csv_columns(args.data), model)
+    data = args.data if isinstance(args.data, list) else [args.data]
+    try:
+        paths = expand_csv_paths(data)
+    except FileNotFoundError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.sample is not None and any(
+        table_format(path) is None and csv_compression(path) is not None
+        for path in paths
+    ):
+        sys.exit("--sample needs uncompressed CSV files.")
+
+    options: dict[str, Any] = dict(
+        max_errors=args.max_errors,
+        engine=args.engine,
+        reader=args.reader,
+        prefetch=args.prefetch,
+        threads=args.threads,
+        stop_after=1 if args.fail_fast else args.stop_after,
+        abort_error_rate=args.abort_error_rate or None,
+        sample_rows=args.sample,
+        sample_head=True,
+        sample_seed=args.seed,
+        memory_budget=args.memory_limit,
+    )
+    if len(paths) > 1:
+        if args.rows is not None:
+            sys.exit("--rows only works on a single file.")
+        _validate_many(paths, model, args, options)
+
+    # Parquet and Arrow files are read with pyarrow instead of a CSV reader.
+    is_table = table_format(paths[0]) is not None
+    try:
+        columns = (
+            read_table_columns(paths[0])
+            if is_table
+            else read_csv_columns(paths[0], args.reader)
+        )
+    except ImportError as exc:
+        sys.exit(str(exc))
+    column_check = check_column_names(columns, model)
     if column_check.errors:
         print(
             "❌ Column names do not match the schema. Stopping any further validation."
@@ -102,14 +412,61 @@ def main(argv: list[str] | None = None) -> None:
         print("⚠️  Ignoring extra columns not used by the selected model:")
         print("\n".join(column_check.warnings))
 
-    csv_check = check_csv_file(args.data, model, max_errors=args.max_errors)
-    print(
-        format_val_errors(
-            list(csv_check.errors),
-            args.max_errors,
-            truncated=csv_check.truncated,
+    line_numbers: Callable[[int], int] | None = None
+    if args.rows is not None or args.index:
+        if is_table:
+            sys.exit("--rows and --index only work on CSV files.")
+        # needs numpy, which a plain run doesn't
+        from datavalgen.row_index import get_row_index
+
+        try:
+            row_index = get_row_index(paths[0])
+        except ValueError as exc:
+            sys.exit(str(exc))
+        line_numbers = row_index.line_number
+
+    if args.rows is not None:
+        start_row, stop_row = args.rows
+        csv_check = check_csv_rows(
+            paths[0],
+            model,
+            start_row,
+            stop_row,
+            index=row_index,
+            max_errors=args.max_errors,
+            engine=args.engine,
+            reader=args.reader,
         )
-    )
+        print(
+            f"Validated rows {start_row + 1} to {min(stop_row, len(row_index))} "
+            f"of {len(row_index)}."
+        )
+    elif is_table:
+        if args.engine == "columnar":
+            sys.exit("--engine columnar only works on CSV files.")
+        csv_check = check_table_file(
+            paths[0],
+            model,
+            max_errors=args.max_errors,
+            engine=args.engine,
+            threads=args.threads,
+            stop_after=options["stop_after"],
+        )
+    else:
+        csv_check = check_csv_file(
+            paths[0],
+            model,
+            workers=args.workers,
+            # Compressed files are always validated as a whole.
+            cache=(
+                default_cache_path(paths[0])
+                if args.cache and csv_compression(paths[0]) is None
+                else None
+            ),
+            **options,
+        )
+    _print_check(csv_check, args.max_errors, line_numbers)
+    _print_peak_memory(args.memory_limit)
 
     if csv_check.num_errors:
         print(
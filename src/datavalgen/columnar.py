@@ -0,0 +1,284 @@
+"""
+Column-wise (vectorized) pre-checks compiled from a pydantic model.
+
+Validating each row with pydantic is exact but slow. Most models are flat
+(numbers with bounds, enums, patterns, dates), and for those we can check a
+whole chunk column by column with pandas/NumPy and only hand the rows that
+look suspicious to pydantic. The checks here are deliberately conservative:
+they may flag a valid value (pydantic then accepts it), but never let through
+a value that pydantic would reject. Error messages therefore always come from
+pydantic and stay the same as for a plain row-by-row validation.
+"""
+
+from __future__ import annotations
+
+import re
+import types
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+from typing import Any, Callable, Literal, Union, get_args, get_origin
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from datavalgen.constraints import split_field_metadata
+
+__all__ = [
+    "ColumnarPlan",
+    "compile_model",
+]
+
+# Takes a column of raw strings, returns a boolean array flagging the rows
+# that need a full pydantic validation.
+ColumnCheck = Callable[[pd.Series], np.ndarray]
+
+# Only plain ASCII forms; pydantic also accepts e.g. "1_000" or " 1", those
+# just get flagged and validated by pydantic. 18 digits always fit in int64.
+_INT_RE = r"[+-]?[0-9]{1,18}"
+_FLOAT_RE = r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+_DATE_RE = r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+# Strings pydantic accepts for booleans (case-insensitive).
+_BOOL_STRINGS = frozenset(
+    ["0", "off", "f", "false", "n", "no", "1", "on", "t", "true", "y", "yes"]
+)
+
+# Config options that change how strings are validated. We don't try to mimic
+# them, models using them just don't get a plan.
+_UNSUPPORTED_CONFIG = (
+    "strict",
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+)
+
+_BOUNDS = ("gt", "ge", "lt", "le")
+
+
+@dataclass(frozen=True)
+class ColumnarPlan:
+    """
+    Vectorized checks for every field of a model.
+    """
+
+    checks: tuple[tuple[str, ColumnCheck], ...]
+
+    def suspect_rows(self, frame: pd.DataFrame) -> np.ndarray:
+        """
+        Return a boolean array flagging the rows of `frame` that may not be
+        valid and need a full pydantic validation.
+        """
+        suspect = np.zeros(len(frame), dtype=bool)
+        for column, check in self.checks:
+            values = frame[column]
+            # Most columns only hold a handful of distinct values (codes,
+            # flags, dates), so we check each distinct value once and
+            # broadcast the outcome back to the rows.
+            codes, uniques = pd.factorize(values)
+            if len(uniques) * 2 <= len(values):
+                suspect |= check(pd.Series(uniques, dtype=object))[codes]
+            else:
+                suspect |= check(values)
+        return suspect
+
+
+def _not_matching(values: pd.Series, pattern: str) -> np.ndarray:
+    return ~values.str.fullmatch(pattern).to_numpy(dtype=bool)
+
+
+def _out_of_bounds(
+    values: pd.Series, constraints: dict[str, Any], *, tolerance: bool = False
+) -> np.ndarray:
+    """
+    Flag values violating gt/ge/lt/le. With `tolerance`, values within a few
+    ULPs of a bound are flagged too, as pandas and pydantic may round floats
+    differently in the last digit.
+    """
+    suspect = np.zeros(len(values), dtype=bool)
+    for name in _BOUNDS:
+        if name not in constraints:
+            continue
+        bound = constraints[name]
+        if name == "gt":
+            suspect |= (values <= bound).to_numpy(dtype=bool)
+        elif name == "ge":
+            suspect |= (values < bound).to_numpy(dtype=bool)
+        elif name == "lt":
+            suspect |= (values >= bound).to_numpy(dtype=bool)
+        else:
+            suspect |= (values > bound).to_numpy(dtype=bool)
+        if tolerance:
+            spacing = 4 * np.spacing(abs(float(bound)))
+            suspect |= (abs(values - bound) <= spacing).to_numpy(dtype=bool)
+    return suspect
+
+
+def _int_check(constraints: dict[str, Any]) -> ColumnCheck:
+    def check(values: pd.Series) -> np.ndarray:
+        suspect = _not_matching(values, _INT_RE)
+        numbers = pd.to_numeric(values.where(~suspect, "0"))
+        return suspect | _out_of_bounds(numbers, constraints)
+
+    return check
+
+
+def _float_check(constraints: dict[str, Any]) -> ColumnCheck:
+    def check(values: pd.Series) -> np.ndarray:
+        suspect = _not_matching(values, _FLOAT_RE)
+        numbers = pd.to_numeric(values.where(~suspect, "0"), errors="coerce")
+        suspect |= ~np.isfinite(numbers.to_numpy(dtype=float))
+        return suspect | _out_of_bounds(numbers, constraints, tolerance=True)
+
+    return check
+
+
+def _date_check(constraints: dict[str, Any]) -> ColumnCheck:
+    bounds = {name: pd.Timestamp(value) for name, value in constraints.items()}
+
+    def check(values: pd.Series) -> np.ndarray:
+        suspect = _not_matching(values, _DATE_RE)
+        dates = pd.to_datetime(
+            values.where(~suspect, "2000-01-01"), format="%Y-%m-%d", errors="coerce"
+        )
+        suspect |= dates.isna().to_numpy(dtype=bool)
+        return suspect | _out_of_bounds(dates, bounds)
+
+    return check
+
+
+def _bool_check(values: pd.Series) -> np.ndarray:
+    return ~values.str.lower().isin(_BOOL_STRINGS).to_numpy(dtype=bool)
+
+
+def _choices_check(choices: frozenset[str]) -> ColumnCheck:
+    def check(values: pd.Series) -> np.ndarray:
+        return ~values.isin(choices).to_numpy(dtype=bool)
+
+    return check
+
+
+def _str_check(constraints: dict[str, Any]) -> ColumnCheck:
+    min_length = constraints.get("min_length")
+    max_length = constraints.get("max_length")
+    pattern = constraints.get("pattern")
+
+    def check(values: pd.Series) -> np.ndarray:
+        suspect = np.zeros(len(values), dtype=bool)
+        if min_length is not None or max_length is not None:
+            lengths = values.str.len()
+            if min_length is not None:
+                suspect |= (lengths < min_length).to_numpy(dtype=bool)
+            if max_length is not None:
+                suspect |= (lengths > max_length).to_numpy(dtype=bool)
+        if pattern is not None:
+            # In Python's `re`, `$` also matches before a final newline and
+            # pydantic's regex engine doesn't, so leave newlines to pydantic.
+            suspect |= values.str.contains("\n", regex=False).to_numpy(dtype=bool)
+            suspect |= ~values.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        return suspect
+
+    return check
+
+
+def _strip_optional(annotation: Any) -> Any:
+    """
+    `X | None` validates a CSV string exactly like `X`: our cells are never
+    None, so we can drop the None branch.
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _string_choices(annotation: Any) -> frozenset[str] | None:
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        values = [member.value for member in annotation]
+    elif get_origin(annotation) is Literal:
+        values = list(get_args(annotation))
+    else:
+        return None
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return frozenset(values)
+
+
+def _compile_field(annotation: Any, constraints: dict[str, Any]) -> ColumnCheck | None:
+    """
+    Return the vectorized check for one field, or None if we can't build one
+    that is guaranteed to be at least as strict as pydantic.
+    """
+    annotation = _strip_optional(annotation)
+    names = set(constraints)
+
+    if annotation is bool:
+        return _bool_check if not names else None
+    if annotation is int:
+        return _int_check(constraints) if names <= set(_BOUNDS) else None
+    if annotation is float:
+        # Non-finite values are always flagged, so allow_inf_nan is left to
+        # pydantic.
+        if not names <= {*_BOUNDS, "allow_inf_nan"}:
+            return None
+        return _float_check(constraints)
+    if annotation is date:
+        if not names <= set(_BOUNDS):
+            return None
+        if not all(type(value) is date for value in constraints.values()):
+            return None
+        return _date_check(constraints)
+    if annotation is str:
+        if not names <= {"min_length", "max_length", "pattern"}:
+            return None
+        pattern = constraints.get("pattern")
+        if pattern is not None:
+            try:
+                re.compile(pattern)
+            except (re.error, TypeError):
+                return None
+        return _str_check(constraints)
+
+    choices = _string_choices(annotation)
+    if choices is not None and not names:
+        return _choices_check(choices)
+    return None
+
+
+def compile_model(model: type[BaseModel]) -> ColumnarPlan | None:
+    """
+    Compile the fields of `model` into vectorized column checks.
+
+    Returns None when any part of the model can't be checked column-wise
+    (custom field or model validators, aliases, unsupported types or
+    constraints, ...). Callers should then validate every row with pydantic.
+    """
+    config = model.model_config
+    if any(config.get(option) for option in _UNSUPPORTED_CONFIG):
+        return None
+
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return None
+
+    checks: list[tuple[str, ColumnCheck]] = []
+    for name, field_info in model.model_fields.items():
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            return None
+        constraints, others = split_field_metadata(field_info)
+        if others:
+            return None
+        check = _compile_field(field_info.annotation, constraints)
+        if check is None:
+            return None
+        checks.append((name, check))
+
+    return ColumnarPlan(checks=tuple(checks))
@@ -0,0 +1,72 @@
+"""Helpers to read the constraints (gt, le, pattern, ...) set on model fields."""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+__all__ = [
+    "constraint_table",
+    "split_field_metadata",
+]
+
+
+def split_field_metadata(field_info: FieldInfo) -> tuple[dict[str, Any], list[Any]]:
+    """
+    Split a field's metadata into simple named constraints and everything else.
+
+    Pydantic keeps constraints like `Field(gt=0, pattern=...)` in
+    `FieldInfo.metadata` as `annotated_types` dataclasses with a single field
+    (e.g. `Gt(gt=0)`) and a general metadata object for pydantic-specific
+    ones (e.g. `pattern`). This relies on those implementation details.
+
+    Anything that is not such a constraint (custom validators, constraints
+    repeated more than once, ...) ends up in the second list so callers can
+    decide whether they can still make sense of the field.
+
+    :param field_info: The pydantic field to inspect.
+    :return: `({"gt": 0, "pattern": "^a"}, [<other metadata>])`
+    """
+    constraints: dict[str, Any] = {}
+    others: list[Any] = []
+
+    for item in field_info.metadata:
+        if is_dataclass(item) and not isinstance(item, type):
+            # annotated-types style, e.g. Gt(gt=0) or MinLen(min_length=1)
+            item_fields = fields(item)
+            if len(item_fields) != 1 or item_fields[0].name in constraints:
+                others.append(item)
+                continue
+            name = item_fields[0].name
+            constraints[name] = getattr(item, name)
+        elif type(item).__name__ == "_PydanticGeneralMetadata":
+            # pydantic specific constraints, e.g. pattern or allow_inf_nan
+            items = vars(item)
+            if constraints.keys() & items.keys():
+                others.append(item)
+                continue
+            constraints.update(items)
+        else:
+            others.append(item)
+
+    return constraints, others
+
+
+def constraint_table(model: type[BaseModel]) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Read-only table of the named constraints of every field of a model (see
+    `split_field_metadata`), by field name.
+
+    :param model: The pydantic model to inspect.
+    :return: e.g. `{"age": {"ge": 0, "lt": 120}, "name": {}}`
+    """
+    return MappingProxyType(
+        {
+            name: MappingProxyType(split_field_metadata(field_info)[0])
+            for name, field_info in model.model_fields.items()
+        }
+    )
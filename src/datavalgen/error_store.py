@@ -0,0 +1,119 @@
+"""Compact, array-backed storage for row-indexed validation errors."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable, Iterator, Sequence, cast, overload
+
+from pydantic_core import ErrorDetails
+
+__all__ = [
+    "ErrorStore",
+]
+
+
+class ErrorStore(Sequence[ErrorDetails]):
+    """
+    A sequence of `ErrorDetails` whose `loc` starts with a row index, stored
+    column-wise instead of as one dict per error.
+
+    Each error takes a row index, an interned location id (the rest of `loc`,
+    e.g. `("age",)`), an interned error kind id (`type`, `msg` and `ctx`) and
+    a reference to its input value. That is a few dozen bytes per error
+    instead of several dicts, so large error samples stay cheap to keep.
+
+    Indexing or iterating returns plain `ErrorDetails` dicts built on the fly.
+    """
+
+    def __init__(self, errors: Iterable[ErrorDetails] = ()) -> None:
+        self._rows = array("q")
+        self._loc_ids = array("i")
+        self._kind_ids = array("i")
+        self._inputs: list[Any] = []
+        # interned values and their ids
+        self._locs: list[tuple[int | str, ...]] = []
+        self._loc_index: dict[tuple[int | str, ...], int] = {}
+        # (type, msg, ctx or None)
+        self._kinds: list[tuple[str, str, dict[str, Any] | None]] = []
+        self._kind_index: dict[tuple[str, str, str], int] = {}
+        self.extend(errors)
+
+    @staticmethod
+    def _intern(value: Any, key: Any, values: list[Any], index: dict[Any, int]) -> int:
+        value_id = index.get(key)
+        if value_id is None:
+            value_id = index[key] = len(values)
+            values.append(value)
+        return value_id
+
+    def append(self, error: ErrorDetails) -> None:
+        """
+        Add one error. Its `loc` must start with the integer row index.
+        """
+        row, *rest = error["loc"]
+        loc = tuple(rest)
+        ctx = error.get("ctx")
+        # ctx values may be unhashable (e.g. exceptions), so we key on repr
+        kind_key = (error["type"], error["msg"], repr(ctx))
+
+        self._rows.append(cast(int, row))
+        self._loc_ids.append(self._intern(loc, loc, self._locs, self._loc_index))
+        self._kind_ids.append(
+            self._intern(
+                (error["type"], error["msg"], ctx),
+                kind_key,
+                self._kinds,
+                self._kind_index,
+            )
+        )
+        self._inputs.append(error["input"])
+
+    def extend(self, errors: Iterable[ErrorDetails]) -> None:
+        for error in errors:
+            self.append(error)
+
+    def _view(self, index: int) -> ErrorDetails:
+        error_type, msg, ctx = self._kinds[self._kind_ids[index]]
+        error: dict[str, Any] = {
+            "type": error_type,
+            "loc": (self._rows[index], *self._locs[self._loc_ids[index]]),
+            "msg": msg,
+            "input": self._inputs[index],
+        }
+        if ctx is not None:
+            error["ctx"] = ctx
+        return cast(ErrorDetails, error)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> ErrorDetails: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ErrorDetails]: ...
+
+    def __getitem__(self, index: int | slice) -> ErrorDetails | list[ErrorDetails]:
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ErrorStore index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[ErrorDetails]:
+        for index in range(len(self)):
+            yield self._view(index)
+
+    def __eq__(self, other: object) -> bool:
+        # Compares equal to any list/tuple holding the same errors, so callers
+        # can keep treating results like the tuples we used to return.
+        if not isinstance(other, (ErrorStore, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ErrorStore({list(self)!r})"
@@ -1,9 +1,23 @@
-from typing import Any, Generic, TypeVar, cast
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
 from pydantic import BaseModel
-from dataclasses import asdict, is_dataclass
 from polyfactory.factories.pydantic_factory import ModelFactory
-import pandas as pd
-from pydantic.fields import FieldInfo
+
+from datavalgen.constraints import constraint_table
+
+# pandas is only needed to build DataFrames, so it is imported there
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # just for static type-checking. TModel is a type parameter that must be a
@@ -16,72 +30,148 @@ class BaseDataModelFactory(ModelFactory[TModel], Generic[TModel]):
 
     __is_base_factory__ = True
 
-    # FIXME: this is a hacky util function to deal with constraints set in the
-    #        model (lt, gt) more easily as we write generators for different fields
-    #        But it makes bad assumptions about implementation details of pydantic
+    # `{field: {constraint: value}}` of this factory's model, see
+    # `field_constraints`
+    _field_constraints: ClassVar[Mapping[str, Mapping[str, Any]]]
+
+    @classmethod
+    def field_constraints(cls) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Read-only table of the constraints (gt, le, pattern, ...) of every
+        field of the model, e.g. `{"age": {"ge": 0, "lt": 120}, ...}`.
+
+        Built once per factory class, on first use.
+        """
+        # like polyfactory's `_fields_metadata`: a subclass may have another
+        # model, so only use a table set on this very class
+        if "_field_constraints" not in cls.__dict__:
+            cls._field_constraints = constraint_table(cls.__model__)
+        return cls._field_constraints
+
     @classmethod
     def get_field_constraint(cls, field: str, constraint: str) -> Any:
         """
         Helper method to get a constraint value from a field in the model
 
+        Cheap enough to call in field generators for every row, it only
+        looks the value up in `field_constraints`.
+
         :param field: The field name to get the constraint from
         :param constraint: The constraint name to get the value of (e.g. "lt")
 
         :return: The constraint value (e.g. date(1969, 7, 20))
-        """
-        # https://docs.pydantic.dev/latest/api/fields/#pydantic.fields.FieldInfo
-        field_info: FieldInfo = cls.__model__.__pydantic_fields__[field]
 
-        if constraint not in field_info.metadata_lookup:
+        :raises KeyError: if the model has no such field
+        :raises ValueError: if the field has no such constraint
+        """
+        try:
+            constraints = cls.field_constraints()[field]
+        except KeyError:
+            raise KeyError(f"{cls.__model__.__name__} has no field {field!r}") from None
+        try:
+            return constraints[constraint]
+        except KeyError:
             raise ValueError(
                 f"Field {field!r} has no {constraint!r} constraint "
-                f"(available: {sorted(field_info.metadata_lookup.keys())})"
-            )
+                f"(available: {sorted(constraints)})"
+            ) from None
 
-        # map from constraint string to constraint type seems to be found in
-        # field_info.metadata_lookup
-        raw_constraint_type = field_info.metadata_lookup[constraint]
-        if not isinstance(raw_constraint_type, type):
-            raise TypeError(
-                f"Constraint metadata lookup for {field!r}.{constraint!r} "
-                f"did not return a type: {raw_constraint_type!r}"
-            )
-        constraint_type: type[Any] = raw_constraint_type
-        # return first instance of that constraint type
-        constraint_object: Any | None = next(
-            (c for c in field_info.metadata if isinstance(c, constraint_type)), None
-        )
+    @classmethod
+    def batch_dataframe(
+        cls,
+        n: int,
+        *,
+        columnar: bool = False,
+        columns: Sequence[str] | None = None,
+        fixed: Mapping[str, Any] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Generate a batch of n instances and return them as a pandas DataFrame
 
-        if constraint_object is None:
-            raise ValueError(
-                f"Could not find a {constraint!r} constraint instance for field {field!r}"
-            )
+        :param n: Number of rows to generate
+        :param columnar: Generate the rows column by column with NumPy (see
+            `datavalgen.generation`), much faster for large flat models. The
+            rows are just as valid but the values differ from `batch`. Falls
+            back to `batch` for models we can't compile a plan for.
+        :param columns: Only generate these columns (dumped field names), in
+            this order. The other fields are not generated at all, except for
+            models without a plan (validators, computed fields, ...), whose
+            whole rows are generated and then projected.
+        :param fixed: Set these columns to a value instead of generating
+            them. The values are validated for their field, so e.g. "12" is
+            fine for an int column.
+
+        :raises ValueError: for unknown columns or invalid fixed values.
+        """
+        import pandas as pd
 
-        if isinstance(constraint_object, type) or not is_dataclass(
-            constraint_object
-        ):
-            raise TypeError(
-                f"Constraint object for {field!r}.{constraint!r} is not a dataclass: "
-                f"{constraint_object!r}"
+        if columnar or columns is not None or fixed:
+            import numpy as np
+
+            from datavalgen.generation import (
+                compile_generation_plan,
+                model_columns,
+                validate_fixed_values,
             )
-        # `is_dataclass()` is true for both dataclass instances and dataclass
-        # classes, but `asdict()` only accepts an instance. The runtime guard
-        # above rejects the class case; this cast is only to make that narrowing
-        # explicit to static type checkers.
-        constraint_dataclass = cast(Any, constraint_object)
 
-        # we hackily assume constraints are dataclasses with a single field
-        # https://github.com/annotated-types/annotated-types/blob/main/annotated_types/__init__.py
-        return next(iter(asdict(constraint_dataclass).values()))
+            fixed_values = validate_fixed_values(cls, fixed or {})
+            plan = compile_generation_plan(cls, vectorized=columnar)
+            if plan is not None:
+                # seeded from the factory, so `seed_random` applies here too
+                rng = np.random.default_rng(cls.__random__.getrandbits(64))
+                return plan.dataframe(n, rng, columns=columns, fixed=fixed_values)
 
-    @classmethod
-    def batch_dataframe(cls, n: int) -> pd.DataFrame:
-        """
-        Generate a batch of n instances and return them as a pandas DataFrame
-        """
-        instances: list[TModel] = cls.batch(n)
+            # No plan: `batch` makes whole rows, with the fixed values passed
+            # in so validators and computed fields see them, then we project.
+            fields = model_columns(cls)
+            dumped = set(fields) | {
+                info.alias or name
+                for name, info in cls.__model__.model_computed_fields.items()
+            }
+            missing = [name for name in columns or () if name not in dumped]
+            if missing:
+                raise ValueError(f"Columns not in model: {', '.join(missing)}")
+            kwargs = {
+                fields[name][0].name: value for name, value in fixed_values.items()
+            }
+        else:
+            kwargs = {}
+
+        instances: list[TModel] = cls.batch(n, **kwargs)
         # with 'mode="json" enums take on their value (e.g. 'Yes' not YesNo.yes)
         rows: list[dict[str, Any]] = [
             i.model_dump(by_alias=True, mode="json") for i in instances
         ]
+        if columns is not None:
+            return pd.DataFrame(rows, columns=list(columns))
         return pd.DataFrame(rows)
+
+    @classmethod
+    def iter_dataframes(
+        cls,
+        n: int,
+        *,
+        chunk_size: int,
+        columnar: bool = False,
+        columns: Sequence[str] | None = None,
+        fixed: Mapping[str, Any] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Generate n rows as DataFrames of at most chunk_size rows each, so only
+        one chunk is in memory at a time. Yields one empty DataFrame for n=0.
+
+        :param n: Number of rows to generate
+        :param chunk_size: Maximum number of rows per DataFrame
+        :param columnar: See `batch_dataframe`
+        :param columns: See `batch_dataframe`
+        :param fixed: See `batch_dataframe`
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        for start in range(0, max(n, 1), chunk_size):
+            yield cls.batch_dataframe(
+                min(chunk_size, n - start),
+                columnar=columnar,
+                columns=columns,
+                fixed=fixed,
+            )
@@ -0,0 +1,521 @@
+"""
+Column-wise (vectorized) fake data generation compiled from a factory.
+
+`BaseDataModelFactory.batch` builds one validated pydantic instance per row,
+which `batch_dataframe` then dumps to a dict per row. For flat models that
+is far more work than needed: most fields are numbers with bounds, dates,
+enums or plain strings, and a whole column of those can be drawn at once
+with NumPy. A `GenerationPlan` does that, and only falls back to per-row
+Python for fields the factory sets itself (e.g. a classmethod generator) or
+that we can't draw column-wise (patterns, nested models, ...). Those values
+are validated against the field, one pydantic call per column.
+
+Vectorized columns follow the field's constraints, so the rows are valid
+for the model, but the values are drawn from NumPy's generator and differ
+from what polyfactory would have made. Models with validators (which may
+change values or relate fields to each other), computed fields or custom
+serializers don't get a plan, as their rows depend on the model instances.
+
+Every column draws from its own random stream, so a plan can also generate
+only some of the columns (a projection), or fill columns with fixed values,
+without generating the others at all and without changing the values of the
+columns it does generate.
+"""
+
+from __future__ import annotations
+
+import string
+import types
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Iterator,
+    Literal,
+    Mapping,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+from datavalgen.constraints import split_field_metadata
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from datavalgen.factory import BaseDataModelFactory
+
+__all__ = [
+    "GenerationPlan",
+    "compile_generation_plan",
+    "model_columns",
+    "validate_fixed_values",
+]
+
+# Draws a column of `n` JSON-ready values (as `model_dump(mode="json")`).
+ColumnGenerator = Callable[[np.random.Generator, int], Any]
+
+_BOUNDS = ("gt", "ge", "lt", "le")
+# Range of unbounded numbers, and of dates with only one bound, roughly what
+# polyfactory draws.
+_NUMBER_SPAN = 10_000
+_DATE_SPAN_DAYS = 3650
+_STR_LENGTH = 20
+_LETTERS = np.frombuffer(string.ascii_letters.encode("ascii"), dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """
+    A column generator for every field of a model, in field order.
+    """
+
+    columns: tuple[tuple[str, ColumnGenerator], ...]
+
+    def dataframe(
+        self,
+        n: int,
+        rng: np.random.Generator,
+        *,
+        columns: Sequence[str] | None = None,
+        fixed: Mapping[str, Any] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Generate `n` rows as a DataFrame with the same columns as
+        `BaseDataModelFactory.batch_dataframe`.
+
+        :param columns: Only generate these columns, in this order.
+        :param fixed: Fill these columns with a value (validated for the
+            field, see `validate_fixed_values`) instead of generating them.
+        :raises ValueError: for columns not in the plan.
+        """
+        import pandas as pd
+
+        generators = dict(self.columns)
+        names = list(generators) if columns is None else list(columns)
+        fixed = fixed or {}
+        missing = [name for name in [*names, *fixed] if name not in generators]
+        if missing:
+            raise ValueError(f"Columns not in model: {', '.join(missing)}")
+
+        dumped = TypeAdapter(dict[str, Any]).dump_python(dict(fixed), mode="json")
+        # The stream of a column only depends on `rng` and its name.
+        stream = int(rng.integers(1 << 63))
+        data: dict[str, Any] = {}
+        for name in names:
+            if name in fixed:
+                data[name] = [dumped[name]] * n
+            else:
+                column_rng = np.random.default_rng(
+                    [stream, zlib.crc32(name.encode("utf-8"))]
+                )
+                data[name] = generators[name](column_rng, n)
+        return pd.DataFrame(data, index=pd.RangeIndex(n))
+
+
+def _strip_optional(annotation: Any) -> tuple[Any, bool]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1 and len(args) < len(get_args(annotation)):
+            return args[0], True
+    return annotation, False
+
+
+def _int_column(constraints: dict[str, Any]) -> ColumnGenerator | None:
+    if not set(constraints) <= set(_BOUNDS):
+        return None
+    low = constraints.get("ge")
+    if low is None and "gt" in constraints:
+        low = constraints["gt"] + 1
+    high = constraints.get("le")
+    if high is None and "lt" in constraints:
+        high = constraints["lt"] - 1
+    if low is None and high is None:
+        low, high = 0, _NUMBER_SPAN
+    elif low is None:
+        low = high - _NUMBER_SPAN
+    elif high is None:
+        high = low + _NUMBER_SPAN
+    if low > high:
+        return None
+
+    def generate(rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.integers(low, high, size=n, endpoint=True)
+
+    return generate
+
+
+def _float_column(constraints: dict[str, Any]) -> ColumnGenerator | None:
+    if not set(constraints) <= {*_BOUNDS, "allow_inf_nan"}:
+        return None
+    low = constraints.get("ge")
+    if low is None and "gt" in constraints:
+        low = np.nextafter(float(constraints["gt"]), np.inf)
+    # `uniform` never draws the upper bound itself, so lt and le are alike.
+    high = constraints.get("le", constraints.get("lt"))
+    if low is None and high is None:
+        low, high = 0.0, float(_NUMBER_SPAN)
+    elif low is None:
+        low = high - _NUMBER_SPAN
+    elif high is None:
+        high = low + _NUMBER_SPAN
+    if low >= high:
+        return None
+
+    def generate(rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.uniform(float(low), float(high), size=n)
+
+    return generate
+
+
+def _date_column(constraints: dict[str, Any]) -> ColumnGenerator | None:
+    if not set(constraints) <= set(_BOUNDS):
+        return None
+    if not all(type(value) is date for value in constraints.values()):
+        return None
+    low = constraints.get("ge")
+    if low is None and "gt" in constraints:
+        low = constraints["gt"] + timedelta(days=1)
+    high = constraints.get("le")
+    if high is None and "lt" in constraints:
+        high = constraints["lt"] - timedelta(days=1)
+    if low is None and high is None:
+        # polyfactory draws dates from this decade.
+        high = date.today()
+        low = date(high.year // 10 * 10, 1, 1)
+    elif low is None:
+        low = high - timedelta(days=_DATE_SPAN_DAYS)
+    elif high is None:
+        high = low + timedelta(days=_DATE_SPAN_DAYS)
+    if low > high:
+        return None
+    start = np.datetime64(low, "D")
+    num_days = (high - low).days
+
+    def generate(rng: np.random.Generator, n: int) -> np.ndarray:
+        days = start + rng.integers(0, num_days, size=n, endpoint=True)
+        return np.datetime_as_string(days, unit="D").astype(object)
+
+    return generate
+
+
+def _str_column(constraints: dict[str, Any]) -> ColumnGenerator | None:
+    if not set(constraints) <= {"min_length", "max_length"}:
+        return None
+    min_length = constraints.get("min_length") or 1
+    max_length = constraints.get("max_length")
+    if max_length is None:
+        max_length = max(min_length, _STR_LENGTH)
+    if min_length > max_length:
+        return None
+
+    def generate(rng: np.random.Generator, n: int) -> list[str]:
+        lengths = rng.integers(min_length, max_length, size=n, endpoint=True)
+        ends = np.cumsum(lengths).tolist()
+        # One draw for all letters of the column, then cut it into strings.
+        total = ends[-1] if n else 0
+        text = _LETTERS[rng.integers(0, len(_LETTERS), size=total)].tobytes()
+        return [
+            text[end - length : end].decode("ascii")
+            for end, length in zip(ends, lengths.tolist())
+        ]
+
+    return generate
+
+
+def _choices_column(annotation: Any) -> ColumnGenerator | None:
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        choices = [member.value for member in annotation]
+    elif get_origin(annotation) is Literal:
+        choices = list(get_args(annotation))
+    else:
+        return None
+    if not choices or not all(
+        isinstance(choice, (str, int, float, bool)) for choice in choices
+    ):
+        return None
+    values = np.array(choices, dtype=object)
+
+    def generate(rng: np.random.Generator, n: int) -> np.ndarray:
+        return values[rng.integers(0, len(values), size=n)]
+
+    return generate
+
+
+def _bool_column(rng: np.random.Generator, n: int) -> np.ndarray:
+    return rng.random(n) < 0.5
+
+
+def _vectorized_column(
+    annotation: Any, constraints: dict[str, Any]
+) -> ColumnGenerator | None:
+    """
+    Return a column-wise generator for a field, or None if we can't draw
+    valid values for it column-wise.
+    """
+    if annotation is bool:
+        return _bool_column if not constraints else None
+    if annotation is int:
+        return _int_column(constraints)
+    if annotation is float:
+        return _float_column(constraints)
+    if annotation is date:
+        return _date_column(constraints)
+    if annotation is str:
+        return _str_column(constraints)
+    if not constraints:
+        return _choices_column(annotation)
+    return None
+
+
+def _with_nones(generate: ColumnGenerator) -> ColumnGenerator:
+    """
+    Like polyfactory, leave optional fields None about half of the time.
+    """
+
+    def generate_optional(rng: np.random.Generator, n: int) -> np.ndarray:
+        values = np.asarray(generate(rng, n), dtype=object)
+        values[rng.random(n) < 0.5] = None
+        return values
+
+    return generate_optional
+
+
+def _with_defaults(
+    generate: ColumnGenerator, field_info: FieldInfo
+) -> ColumnGenerator:
+    """
+    Like polyfactory, leave fields with a default at that default about half
+    of the time.
+    """
+    adapter = TypeAdapter(Any)
+
+    def generate_or_default(rng: np.random.Generator, n: int) -> np.ndarray:
+        values = np.asarray(generate(rng, n), dtype=object)
+        for index in np.flatnonzero(rng.random(n) < 0.5).tolist():
+            default = field_info.get_default(call_default_factory=True)
+            values[index] = adapter.dump_python(default, mode="json")
+        return values
+
+    return generate_or_default
+
+
+@contextmanager
+def _seeded_factory(
+    factory: type[BaseDataModelFactory[Any]], seed: int
+) -> Iterator[None]:
+    """
+    Seed the factory's `Random` and Faker for the duration of the block and
+    then restore them, so other uses of the factory aren't affected.
+    """
+    own_random = "__random__" in vars(factory)
+    saved_random = factory.__random__
+    random_state = saved_random.getstate()
+    faker = factory.__faker__
+    saved_faker_random = faker.random
+    faker_state = saved_faker_random.getstate()
+    try:
+        factory.seed_random(seed)
+        yield
+    finally:
+        if own_random:
+            factory.__random__ = saved_random
+        else:
+            del factory.__random__
+        saved_random.setstate(random_state)
+        faker.random = saved_faker_random
+        saved_faker_random.setstate(faker_state)
+
+
+def _per_row_column(
+    factory: type[BaseDataModelFactory[Any]],
+    make_value: Callable[[], Any],
+    field_info: FieldInfo,
+) -> ColumnGenerator:
+    """
+    Call `make_value` once per row and validate the whole column against the
+    field in one pydantic call, as `batch` would for every instance.
+    """
+    field_type: Any = Annotated[field_info.annotation, field_info]
+    adapter: TypeAdapter[list[Any]] = TypeAdapter(list[field_type])
+
+    def generate(rng: np.random.Generator, n: int) -> list[Any]:
+        # Seed polyfactory from the column's stream.
+        with _seeded_factory(factory, int(rng.integers(1 << 63))):
+            raw_values = [make_value() for _ in range(n)]
+        values = adapter.validate_python(raw_values)
+        return adapter.dump_python(values, mode="json")
+
+    return generate
+
+
+def _factory_column(
+    factory: type[BaseDataModelFactory[Any]], field_meta: Any, field_info: FieldInfo
+) -> ColumnGenerator | None:
+    """
+    Column of a field the factory sets itself, or None for the kinds of
+    factory fields (sub-factories, PostGenerated, ...) we leave to `batch`.
+    """
+    from polyfactory.factories.base import BaseFactory
+    from polyfactory.fields import Ignore, PostGenerated, Require, Use
+
+    value = getattr(factory, field_meta.name)
+    if isinstance(value, (Ignore, Require, PostGenerated)):
+        return None
+    if isinstance(value, type) and issubclass(value, BaseFactory):
+        return None
+    if isinstance(value, Use):
+        return _per_row_column(factory, value.to_value, field_info)
+    if callable(value):
+        return _per_row_column(factory, value, field_info)
+    return _per_row_column(factory, lambda: value, field_info)
+
+
+def _has_decorators(model: type[BaseModel]) -> bool:
+    """
+    Whether the model has validators, computed fields or serializers, which
+    change the rows `batch_dataframe` dumps from its instances.
+    """
+    decorators = model.__pydantic_decorators__
+    return any(
+        (
+            decorators.validators,
+            decorators.field_validators,
+            decorators.root_validators,
+            decorators.model_validators,
+            decorators.computed_fields,
+            decorators.field_serializers,
+            decorators.model_serializers,
+        )
+    )
+
+
+def _polyfactory_value(
+    factory: type[BaseDataModelFactory[Any]], field_meta: Any, field_info: FieldInfo
+) -> Callable[[], Any]:
+    from polyfactory.field_meta import Null
+
+    def make_value() -> Any:
+        value = factory.get_field_value(field_meta)
+        # polyfactory leaves fields with a default out half of the time.
+        if value is Null:
+            return field_info.get_default(call_default_factory=True)
+        return value
+
+    return make_value
+
+
+def model_columns(
+    factory: type[BaseDataModelFactory[Any]],
+) -> dict[str, tuple[Any, FieldInfo]]:
+    """
+    Map the columns of `batch_dataframe` (the dumped field names) to the
+    factory's field metadata (whose `name` polyfactory takes as keyword
+    argument) and the pydantic field info.
+    """
+    model = factory.__model__
+    fields = zip(factory.get_model_fields(), model.model_fields.items())
+    return {
+        field_info.serialization_alias or field_info.alias or name: (
+            field_meta,
+            field_info,
+        )
+        for field_meta, (name, field_info) in fields
+    }
+
+
+def validate_fixed_values(
+    factory: type[BaseDataModelFactory[Any]], fixed: Mapping[str, Any]
+) -> dict[str, Any]:
+    """
+    Validate fixed column values (e.g. the string "12" for an int column)
+    against their fields and return the validated values.
+
+    :raises ValueError: for columns not in the model and invalid values.
+    """
+    columns = model_columns(factory)
+    validated: dict[str, Any] = {}
+    for name, value in fixed.items():
+        if name not in columns:
+            raise ValueError(f"Fixed column {name!r} not in model")
+        field_info = columns[name][1]
+        field_type: Any = Annotated[field_info.annotation, field_info]
+        try:
+            validated[name] = TypeAdapter(field_type).validate_python(value)
+        except ValidationError as exc:
+            message = exc.errors()[0]["msg"]
+            raise ValueError(
+                f"Invalid value {value!r} for column {name!r}: {message}"
+            ) from None
+    return validated
+
+
+@lru_cache(maxsize=64)
+def compile_generation_plan(
+    factory: type[BaseDataModelFactory[Any]], *, vectorized: bool = True
+) -> GenerationPlan | None:
+    """
+    Compile the fields of a factory's model into column generators.
+
+    Fields the factory sets itself are generated per row (see
+    `_per_row_column`), other fields column-wise when their type and
+    constraints allow it and else per row with polyfactory. Returns None when
+    the rows would not match what `batch` makes (validators, computed fields
+    or serializers, factory options we don't mimic, sub-factories, ...);
+    callers should then use `batch`.
+
+    :param vectorized: Draw fields column-wise where possible. Without it
+        all values come from polyfactory, as with `batch`, but a plan can
+        still skip columns.
+    """
+    from polyfactory.factories.base import BaseFactory
+
+    model = factory.__model__
+    if _has_decorators(model):
+        return None
+    if factory.__use_defaults__:
+        return None
+
+    columns: list[tuple[str, ColumnGenerator]] = []
+    fields = zip(factory.get_model_fields(), model.model_fields.items())
+    for field_meta, (name, field_info) in fields:
+        column_name = field_info.serialization_alias or field_info.alias or name
+        # polyfactory's test for values set on the factory.
+        if hasattr(factory, field_meta.name) and not hasattr(
+            BaseFactory, field_meta.name
+        ):
+            generate = _factory_column(factory, field_meta, field_info)
+            if generate is None:
+                return None
+            columns.append((column_name, generate))
+            continue
+
+        constraints, others = split_field_metadata(field_info)
+        annotation, optional = _strip_optional(field_info.annotation)
+        generate = None
+        if vectorized and not others:
+            generate = _vectorized_column(annotation, constraints)
+        if generate is None:
+            generate = _per_row_column(
+                factory, _polyfactory_value(factory, field_meta, field_info), field_info
+            )
+        else:
+            if optional and factory.__allow_none_optionals__:
+                generate = _with_nones(generate)
+            if not field_info.is_required():
+                generate = _with_defaults(generate, field_info)
+        columns.append((column_name, generate))
+
+    return GenerationPlan(columns=tuple(columns))
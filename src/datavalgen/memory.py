@@ -0,0 +1,171 @@
+"""
+Keep validation within a memory budget.
+
+A fixed chunk size is wasteful for narrow files and risky for wide files with
+long free-text cells. `AdaptiveChunkSize` starts with a small probe chunk,
+measures the bytes per row of every chunk read and sizes the next chunks so
+that the chunks in flight fit in what is left of the budget after the memory
+the process already used when validation started.
+
+Memory is estimated from a sample of rows as Python objects, so the result is
+a good guess and not a hard limit; pick a budget with some headroom below a
+container's memory limit.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import warnings
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from datavalgen.read_csv import CsvChunk
+
+__all__ = [
+    "AdaptiveChunkSize",
+    "current_rss",
+    "parse_memory_size",
+    "peak_rss",
+]
+
+# Rows in the first chunk, which we only read to measure the row size.
+_PROBE_ROWS = 100
+_MIN_ROWS = 10
+# More rows per chunk doesn't make validation faster.
+_MAX_ROWS = 100_000
+# Rows per chunk whose size we measure.
+_SAMPLE_ROWS = 64
+# A row exists as parsed chunk, row dict and validated model instance at once.
+_ROW_COPIES = 3
+
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_memory_size(text: str) -> int:
+    """
+    Parse a memory size like "512M", "2G" or "1.5GiB" (binary units) into
+    bytes. A plain number is in bytes.
+
+    :raises ValueError: for anything else.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*", text, re.I)
+    if match is None:
+        raise ValueError(f"Invalid memory size {text!r}, expected e.g. 512M or 2G")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.upper()])
+
+
+def current_rss() -> int | None:
+    """
+    Resident set size of this process in bytes, or None where we can't tell
+    (only Linux has `/proc/self/statm`).
+    """
+    try:
+        with open("/proc/self/statm", "rb") as fp:
+            resident_pages = int(fp.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def peak_rss() -> int | None:
+    """
+    Peak resident set size in bytes of this process or of any of its waited
+    for child processes (e.g. validation workers), whichever is larger; None
+    where the `resource` module is missing (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Kilobytes, except on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _row_bytes(chunk: CsvChunk) -> float | None:
+    """
+    Estimate the memory of one row of `chunk` from a sample of its rows.
+    """
+    num_rows = len(chunk)
+    if not num_rows:
+        return None
+    step = max(num_rows // _SAMPLE_ROWS, 1)
+    rows = chunk.row_dicts(range(0, num_rows, step))
+    sampled = sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+        for row in rows
+    )
+    return _ROW_COPIES * sampled / len(rows)
+
+
+class AdaptiveChunkSize:
+    """
+    Chunk size (see `datavalgen.read_csv.ChunkSize`) that keeps chunks within
+    a memory budget.
+
+    Pass it as `chunksize` to `read_csv_chunks`, which asks it for the size of
+    every next chunk and lets it `track` the chunks read. It can be pickled
+    to worker processes, each of which then measures its own baseline.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int,
+        *,
+        in_flight: int = 1,
+        max_rows: int = _MAX_ROWS,
+    ) -> None:
+        """
+        :param memory_budget: Bytes the process may use in total.
+        :param in_flight: Number of chunks held at the same time, e.g. one
+            plus the prefetched ones.
+        :param max_rows: Upper bound for the chunk size.
+        """
+        self.memory_budget = memory_budget
+        self.in_flight = max(in_flight, 1)
+        self.max_rows = max_rows
+        self.size = min(_PROBE_ROWS, max_rows)
+        # Memory in use before the first chunk, and the smoothed row size.
+        self._baseline: int | None = None
+        self._row_bytes: float | None = None
+
+    def __call__(self) -> int:
+        if self._baseline is None:
+            self._baseline = current_rss() or 0
+            if self._baseline >= self.memory_budget:
+                warnings.warn(
+                    f"The process already uses {self._baseline >> 20} MiB, more "
+                    f"than the memory budget of {self.memory_budget >> 20} MiB",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+        return self.size
+
+    def observe(self, chunk: CsvChunk) -> None:
+        """
+        Measure the rows of `chunk` and size the next chunks for them.
+        """
+        row_bytes = _row_bytes(chunk)
+        if row_bytes is None:
+            return
+        # React to wider rows at once, to narrower rows gradually.
+        if self._row_bytes is not None:
+            row_bytes = max(row_bytes, (self._row_bytes + row_bytes) / 2)
+        self._row_bytes = row_bytes
+        available = max(self.memory_budget - (self._baseline or 0), 0)
+        rows = int(available / self.in_flight / row_bytes)
+        self.size = min(max(rows, _MIN_ROWS), self.max_rows)
+
+    def track(self, chunks: Iterable[CsvChunk]) -> Iterator[CsvChunk]:
+        """
+        Pass `chunks` through, observing each one before it is handed on.
+        """
+        for chunk in chunks:
+            self.observe(chunk)
+            yield chunk
@@ -0,0 +1,224 @@
+"""
+Reproducible generation of many rows in parallel, or split over several nodes.
+
+The rows are cut into chunks of a fixed size, and every chunk gets its own
+seed derived from the run's seed and the chunk's index with NumPy's
+`SeedSequence`. Before a chunk is generated the factory is seeded with it
+(polyfactory's `Random` and Faker, and through `Random` the NumPy generator
+of `batch_dataframe(columnar=True)`). A chunk's rows therefore only depend on
+the seed, the chunk size and its index, not on which process or node made it
+or what it made before: generating on 8 processes, or as 8 shards on 8
+nodes, gives exactly the rows of a serial run with the same seed and chunk
+size.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+from datavalgen.write_table import open_table_writer
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from datavalgen.factory import BaseDataModelFactory
+
+__all__ = [
+    "GenerationChunk",
+    "chunk_seed",
+    "generate_chunk",
+    "iter_generated_chunks",
+    "new_seed",
+    "partition_path",
+    "plan_generation_chunks",
+    "write_partitions",
+]
+
+# Chunks submitted per worker, so workers don't wait while the results are
+# written but generated chunks don't pile up in memory either.
+_CHUNKS_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class GenerationChunk:
+    """
+    Rows `index * chunk_size` up to `index * chunk_size + num_rows` of a run.
+    """
+
+    index: int
+    num_rows: int
+
+
+def new_seed() -> int:
+    """
+    A fresh random seed, for runs that don't get one, so they can be repeated.
+    """
+    return int(np.random.SeedSequence().entropy) % (1 << 63)
+
+
+def plan_generation_chunks(
+    num_rows: int, *, chunk_size: int, shard: int = 0, num_shards: int = 1
+) -> list[GenerationChunk]:
+    """
+    Cut `num_rows` rows into chunks of `chunk_size` rows (and one shorter
+    last chunk) and return the chunks of shard `shard` of `num_shards`.
+
+    Shards are consecutive runs of chunks, so the outputs of shards 0, 1, ...
+    concatenated are the output of a run without shards. A shard can be
+    empty when there are fewer chunks than shards. For `num_rows=0` there is
+    one chunk of 0 rows.
+
+    :raises ValueError: for a chunk size below 1 or a shard out of range.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if not 0 <= shard < num_shards:
+        raise ValueError(f"Shard {shard} is not in 0..{num_shards - 1}")
+    num_chunks = max(-(-num_rows // chunk_size), 1)
+    first = shard * num_chunks // num_shards
+    stop = (shard + 1) * num_chunks // num_shards
+    return [
+        GenerationChunk(index, min(chunk_size, num_rows - index * chunk_size))
+        for index in range(first, stop)
+    ]
+
+
+def chunk_seed(seed: int, index: int) -> int:
+    """
+    Seed of chunk `index` of a run with `seed`, independent from the seeds
+    of the other chunks.
+    """
+    sequence = np.random.SeedSequence(seed, spawn_key=(index,))
+    return int(sequence.generate_state(1, np.uint64)[0])
+
+
+def generate_chunk(
+    factory: type[BaseDataModelFactory[Any]],
+    chunk: GenerationChunk,
+    *,
+    seed: int,
+    columnar: bool = False,
+    columns: Sequence[str] | None = None,
+    fixed: Mapping[str, Any] | None = None,
+) -> pd.DataFrame:
+    """
+    Generate the rows of `chunk` of a run with `seed`. See
+    `BaseDataModelFactory.batch_dataframe` for the options.
+    """
+    factory.seed_random(chunk_seed(seed, chunk.index))
+    return factory.batch_dataframe(
+        chunk.num_rows, columnar=columnar, columns=columns, fixed=fixed
+    )
+
+
+def _run_chunks(
+    job: Callable[..., Any],
+    chunks: Sequence[GenerationChunk],
+    args: tuple[Any, ...],
+    workers: int,
+) -> Iterator[Any]:
+    """
+    Run `job(chunk, *args)` for every chunk, in a process pool with
+    `workers > 1`, and yield the results in chunk order. Closing the
+    generator cancels the chunks that haven't started yet.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield job(chunk, *args)
+        return
+
+    max_pending = workers * _CHUNKS_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: list[Future[Any]] = []
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(job, chunk, *args))
+                if len(pending) >= max_pending:
+                    yield pending.pop(0).result()
+            while pending:
+                yield pending.pop(0).result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _generate_chunk_job(
+    chunk: GenerationChunk,
+    factory: type[BaseDataModelFactory[Any]],
+    seed: int,
+    options: dict[str, Any],
+) -> pd.DataFrame:
+    return generate_chunk(factory, chunk, seed=seed, **options)
+
+
+def iter_generated_chunks(
+    factory: type[BaseDataModelFactory[Any]],
+    chunks: Sequence[GenerationChunk],
+    *,
+    seed: int,
+    columnar: bool = False,
+    columns: Sequence[str] | None = None,
+    fixed: Mapping[str, Any] | None = None,
+    workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Generate `chunks` (see `plan_generation_chunks`) of a run with `seed`, in
+    `workers` processes, and yield their DataFrames in order. See
+    `BaseDataModelFactory.batch_dataframe` for the other options.
+    """
+    options = {"columnar": columnar, "columns": columns, "fixed": fixed}
+    args = (factory, seed, options)
+    yield from _run_chunks(_generate_chunk_job, chunks, args, workers)
+
+
+def partition_path(directory: str | Path, index: int, file_format: str) -> Path:
+    """
+    Path of the file of chunk `index` in a partitioned output directory.
+    """
+    return Path(directory) / f"part-{index:06d}.{file_format}"
+
+
+def _write_partition_job(
+    chunk: GenerationChunk,
+    factory: type[BaseDataModelFactory[Any]],
+    seed: int,
+    options: dict[str, Any],
+    directory: Path,
+    file_format: str,
+) -> Path:
+    df = generate_chunk(factory, chunk, seed=seed, **options)
+    path = partition_path(directory, chunk.index, file_format)
+    with open_table_writer(path, file_format) as writer:
+        writer.write(df)
+    return path
+
+
+def write_partitions(
+    factory: type[BaseDataModelFactory[Any]],
+    chunks: Sequence[GenerationChunk],
+    directory: str | Path,
+    *,
+    file_format: str,
+    seed: int,
+    columnar: bool = False,
+    columns: Sequence[str] | None = None,
+    fixed: Mapping[str, Any] | None = None,
+    workers: int = 1,
+) -> list[Path]:
+    """
+    Generate `chunks` of a run with `seed` and write every chunk to its own
+    file in `directory` (see `partition_path`), in `workers` processes which
+    each write the chunks they generate. Chunk files are named after their
+    index in the whole run, so the shards of a run can write to one
+    directory.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    options = {"columnar": columnar, "columns": columns, "fixed": fixed}
+    args = (factory, seed, options, directory, file_format)
+    return list(_run_chunks(_write_partition_job, chunks, args, workers))
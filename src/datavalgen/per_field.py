@@ -0,0 +1,149 @@
+"""
+Per-field validation with memoized outcomes for repeated raw values.
+
+CSV extracts are dominated by low-cardinality columns (sex, yes/no flags,
+stage codes, ...), so validating every cell means validating the same string
+over and over. Here each column gets its own field-level pydantic validator
+and every distinct raw value is validated once; the outcome (no errors, or the
+errors pydantic reported) is cached and broadcast to every row holding that
+value.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Annotated, Any, Callable, cast
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import ErrorDetails, ValidationError
+
+__all__ = [
+    "FIELD_CACHE_SIZE",
+    "FieldValidators",
+    "compile_field_validators",
+]
+
+# Maximum number of distinct raw values we remember per column. The cache
+# lives for the whole file, so low-cardinality columns are only ever
+# validated once per distinct value.
+FIELD_CACHE_SIZE = 4096
+
+# Validates one raw value, returns the errors with `loc` relative to the field.
+ValueValidator = Callable[[Any], tuple[ErrorDetails, ...]]
+
+
+def _validate_value(adapter: TypeAdapter[Any], value: Any) -> tuple[ErrorDetails, ...]:
+    try:
+        adapter.validate_python(value)
+    except ValidationError as exc:
+        return tuple(cast(list[ErrorDetails], exc.errors(include_url=False)))
+    return ()
+
+
+class FieldValidators:
+    """
+    One memoized validator per model field, applied column by column.
+    """
+
+    def __init__(
+        self,
+        adapters: list[tuple[str, TypeAdapter[Any]]],
+        cache_size: int = FIELD_CACHE_SIZE,
+    ) -> None:
+        """
+        :param adapters: A field-level validator per column name.
+        :param cache_size: Distinct values remembered per column.
+        """
+        # The caches belong to this instance. They are typed: 1, 1.0 and
+        # True are different values for e.g. strict fields.
+        self.validators: list[tuple[str, ValueValidator]] = [
+            (
+                name,
+                lru_cache(maxsize=cache_size, typed=True)(
+                    partial(_validate_value, adapter)
+                ),
+            )
+            for name, adapter in adapters
+        ]
+
+    def _bad_cells(self, frame: pd.DataFrame):
+        """
+        Yield `(field, codes, outcomes, bad_codes)` for every column with at
+        least one invalid value in `frame`.
+        """
+        for name, validate in self.validators:
+            # Nulls (from typed Parquet/Arrow columns) are values to
+            # validate too, not missing codes.
+            codes, uniques = pd.factorize(frame[name], use_na_sentinel=False)
+            outcomes = [validate(value) for value in uniques]
+            bad_codes = [code for code, errors in enumerate(outcomes) if errors]
+            if bad_codes:
+                yield name, codes, outcomes, bad_codes
+
+    def validate(self, frame: pd.DataFrame, row_offset: int) -> list[ErrorDetails]:
+        """
+        Validate every cell of `frame` and return the errors with global CSV
+        row indices, in the same order as a row-by-row model validation.
+        """
+        # Fields are visited in model order, so the errors of each row end up
+        # in the order pydantic reports them for the whole model.
+        row_errors: dict[int, list[ErrorDetails]] = defaultdict(list)
+        for name, codes, outcomes, bad_codes in self._bad_cells(frame):
+            for row in np.flatnonzero(np.isin(codes, bad_codes)).tolist():
+                global_row = row_offset + row
+                for error in outcomes[codes[row]]:
+                    located = dict(error)
+                    located["loc"] = (global_row, name, *error["loc"])
+                    row_errors[global_row].append(cast(ErrorDetails, located))
+
+        return [error for row in sorted(row_errors) for error in row_errors[row]]
+
+    def count(self, frame: pd.DataFrame) -> int:
+        """
+        Count the errors in `frame` without building per-row error details.
+        """
+        num_errors = 0
+        for _name, codes, outcomes, bad_codes in self._bad_cells(frame):
+            occurrences = np.bincount(codes, minlength=len(outcomes))
+            num_errors += sum(
+                len(outcomes[code]) * int(occurrences[code]) for code in bad_codes
+            )
+        return num_errors
+
+
+def compile_field_validators(
+    model: type[BaseModel], cache_size: int = FIELD_CACHE_SIZE
+) -> FieldValidators | None:
+    """
+    Build memoized field-level validators for `model`.
+
+    Returns None when validating fields on their own would not be equivalent
+    to validating the whole model, i.e. when the model has field or model
+    validators (which may look at other fields) or aliases. Callers should
+    then validate whole rows.
+    """
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return None
+
+    adapters: list[tuple[str, TypeAdapter[Any]]] = []
+    for name, field_info in model.model_fields.items():
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            return None
+        # The FieldInfo carries the constraints and the model config things
+        # like strictness or whitespace stripping.
+        adapter: TypeAdapter[Any] = TypeAdapter(
+            Annotated[field_info.annotation, field_info],
+            config=model.model_config,
+        )
+        adapters.append((name, adapter))
+
+    return FieldValidators(adapters, cache_size)
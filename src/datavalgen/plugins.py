@@ -3,11 +3,13 @@ import re
 import warnings
 
 from importlib.metadata import EntryPoint, EntryPoints, entry_points
-from typing import Any, Iterator, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Iterator, TypeVar, cast
 
 from pydantic import BaseModel
 
-from datavalgen.factory import BaseDataModelFactory
+# Factories pull in polyfactory (and faker), which model lookups don't need.
+if TYPE_CHECKING:
+    from datavalgen.factory import BaseDataModelFactory
 
 # just for static type checking
 TPluginClass = TypeVar("TPluginClass", bound=type[object])
@@ -195,6 +197,8 @@ def iter_factories(
     Factories are registered under the entry point group "datavalgen.factories".
     `homepage_url` may be "" if none is found.
     """
+    from datavalgen.factory import BaseDataModelFactory
+
     return _iter_plugins("datavalgen.factories", BaseDataModelFactory, distribution)
 
 
@@ -220,6 +224,8 @@ def get_factory(
     """
     Resolve a single factory by symbolic name (e.g. "example", "diabetes").
     """
+    from datavalgen.factory import BaseDataModelFactory
+
     return _get_plugin(
         "datavalgen.factories",
         name,
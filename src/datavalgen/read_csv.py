@@ -2,15 +2,54 @@
 
 from __future__ import annotations
 
+import bz2
+import csv
+import glob
+import gzip
+import io
+import lzma
+import os
+import queue
+import threading
+import warnings
+from abc import ABC, abstractmethod
+from collections import deque
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
-import pandas as pd
+# pandas is imported where it is used, so the stdlib "csv" reader works
+# without paying for the pandas import on small nodes.
+if TYPE_CHECKING:
+    import pandas as pd
 
 __all__ = [
     "CSV_READ_KWARGS",
+    "CSV_READERS",
+    "ChunkSize",
+    "CsvChunk",
     "read_csv_columns",
+    "csv_compression",
+    "open_csv_stream",
+    "read_csv_header",
+    "expand_csv_paths",
     "iter_csv_chunks",
+    "read_csv_chunks",
+    "csv_record_boundaries",
+    "csv_rows_end",
+    "csv_block_boundaries",
+    "open_csv_range",
+    "read_csv_range_chunks",
+    "prefetch_chunks",
 ]
 
 CSV_READ_KWARGS = {
@@ -19,13 +58,188 @@ CSV_READ_KWARGS = {
     "na_filter": False,
 }
 
-def read_csv_columns(csv_path: str | Path) -> tuple[str, ...]:
+T = TypeVar("T")
+
+# Size of the blocks we scan when looking for record boundaries.
+_SCAN_BLOCK_SIZE = 1 << 20
+
+# Magic bytes of the compression formats we read transparently.
+_COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+_COMPRESSED_CSV_SUFFIXES = (".csv.gz", ".csv.bz2", ".csv.xz", ".csv.zst")
+# Decompressed bytes per block handed over by the feeder thread, and the
+# number of blocks it may decompress ahead.
+_DECOMPRESS_BLOCK_SIZE = 1 << 20
+_DECOMPRESS_DEPTH = 4
+
+
+def expand_csv_paths(paths: Iterable[str | Path]) -> list[Path]:
+    """
+    Expand file paths, glob patterns and directories into a list of files.
+
+    A directory stands for all `*.csv` files (compressed ones included, e.g.
+    `*.csv.gz`) below it, a pattern for the
+    files it matches (`**` included), both in sorted order. Files listed more
+    than once are only kept the first time.
+
+    :raises FileNotFoundError: if a path or pattern gives no files.
+    """
+    found: dict[Path, None] = {}
+    for path in map(Path, paths):
+        if path.is_dir():
+            matches = sorted(
+                p
+                for p in path.rglob("*")
+                if p.is_file()
+                and p.name.lower().endswith((".csv", *_COMPRESSED_CSV_SUFFIXES))
+            )
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = sorted(
+                Path(match)
+                for match in glob.glob(str(path), recursive=True)
+                if os.path.isfile(match)
+            )
+        if not matches:
+            raise FileNotFoundError(f"No CSV files found at {str(path)!r}")
+        found.update(dict.fromkeys(matches))
+    return list(found)
+
+
+def csv_compression(csv_path: str | Path) -> str | None:
+    """
+    Detect a compressed CSV from its magic bytes.
+
+    :return: "gzip", "bz2", "xz" or "zstd", or None for a plain file.
+    """
+    with open(csv_path, "rb") as fp:
+        magic = fp.read(6)
+    for prefix, compression in _COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return compression
+    return None
+
+
+def _open_decompressed(csv_path: str | Path, compression: str) -> BinaryIO:
+    if compression == "gzip":
+        return cast(BinaryIO, gzip.open(csv_path, "rb"))
+    if compression == "bz2":
+        return cast(BinaryIO, bz2.open(csv_path, "rb"))
+    if compression == "xz":
+        return cast(BinaryIO, lzma.open(csv_path, "rb"))
+    try:
+        # Python 3.14+
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return cast(BinaryIO, zstd.open(csv_path, "rb"))
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "Reading zstd-compressed files needs Python 3.14+ or 'zstandard'."
+        ) from exc
+    return cast(BinaryIO, zstandard.open(csv_path, "rb"))
+
+
+def _decompressed_blocks(csv_path: str | Path, compression: str) -> Iterator[bytes]:
+    with _open_decompressed(csv_path, compression) as fp:
+        while block := fp.read(_DECOMPRESS_BLOCK_SIZE):
+            yield block
+
+
+class _BlockStream(io.RawIOBase):
+    """
+    Read-only binary stream over an iterator of byte blocks.
+    """
+
+    def __init__(self, blocks: Iterator[bytes]) -> None:
+        self._blocks = blocks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._pending = memoryview(block)
+        count = min(len(buffer), len(self._pending))
+        memoryview(buffer)[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def close(self) -> None:
+        close = getattr(self._blocks, "close", None)
+        if close is not None:
+            close()
+        super().close()
+
+
+def open_csv_stream(csv_path: str | Path, *, threaded: bool = True) -> BinaryIO:
+    """
+    Open a CSV file as a binary stream, decompressing gzip, bz2, xz and zstd
+    files on the fly (see `csv_compression`) instead of on disk.
+
+    :param csv_path: Path to the (compressed) CSV file.
+    :param threaded: Decompress in a feeder thread a few blocks ahead of the
+        reader, so decompression overlaps parsing and validation (zlib, bz2
+        and lzma release the GIL while they work).
+    :return: Buffered binary stream of the decompressed CSV.
+    """
+    compression = csv_compression(csv_path)
+    if compression is None:
+        return open(csv_path, "rb")
+    blocks = _decompressed_blocks(csv_path, compression)
+    if threaded:
+        blocks = prefetch_chunks(blocks, _DECOMPRESS_DEPTH)
+    return io.BufferedReader(_BlockStream(blocks), _DECOMPRESS_BLOCK_SIZE)
+
+
+def read_csv_header(stream: BinaryIO) -> tuple[str, ...]:
+    """
+    Read the header record at the start of a binary CSV stream and return
+    the column names, leaving the stream at the first data row.
+    """
+    record = stream.readline()
+    # A quoted column name may hold a newline.
+    while record.count(b'"') % 2:
+        line = stream.readline()
+        if not line:
+            break
+        record += line
+    text = record.decode("utf-8-sig")
+    return tuple(next(csv.reader(io.StringIO(text, newline="")), ()))
+
+
+def read_csv_columns(csv_path: str | Path, reader: str = "pandas") -> tuple[str, ...]:
     """
     Read only the CSV header and return the column names in file order.
 
     :param csv_path: Path to the CSV file.
+    :param reader: Name of the reader backend, see `CSV_READERS`. The "csv"
+        reader reads the header without importing pandas.
     :return: Column names from the CSV header.
     """
+    if csv_compression(csv_path) is not None:
+        # Only decompresses the start of the file.
+        with open_csv_stream(csv_path, threaded=False) as stream:
+            return read_csv_header(stream)
+
+    if reader == "csv":
+        with open(csv_path, newline="", encoding="utf-8-sig") as fp:
+            return tuple(next(csv.reader(fp), ()))
+
+    import pandas as pd
+
     df = pd.read_csv(csv_path, nrows=0, **CSV_READ_KWARGS)
     return tuple(str(column) for column in df.columns)
 
@@ -44,9 +258,704 @@ def iter_csv_chunks(
     :param chunksize: Number of rows per chunk.
     :return: Iterable of DataFrames, one per chunk.
     """
+    import pandas as pd
+
     return pd.read_csv(
         csv_path,
         usecols=list(usecols) if usecols is not None else None,
         chunksize=chunksize,
         **CSV_READ_KWARGS,
     )
+
+
+class CsvChunk(ABC):
+    """
+    A chunk of CSV rows with every cell as a raw string, in whatever shape
+    the reader backend produced it.
+
+    Validation engines ask for the view they need: row dicts for pydantic or
+    a DataFrame for column-wise checks.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def row_dicts(self, indices: Sequence[int] | None = None) -> list[dict[str, Any]]:
+        """
+        Return the rows (or only the rows at `indices`) as dicts.
+        """
+
+    @abstractmethod
+    def frame(self) -> pd.DataFrame:
+        """
+        Return the chunk as a DataFrame of strings.
+        """
+
+
+class _FrameChunk(CsvChunk):
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def row_dicts(self, indices: Sequence[int] | None = None) -> list[dict[str, Any]]:
+        df = self._df if indices is None else self._df.iloc[list(indices)]
+        # Faster than `to_dict("records")`, which boxes every value.
+        columns = list(df.columns)
+        if not columns:
+            return [{} for _ in range(len(df))]
+        values = zip(*(df[column].tolist() for column in columns))
+        return [dict(zip(columns, row)) for row in values]
+
+    def frame(self) -> pd.DataFrame:
+        return self._df
+
+
+class _ArrowChunk(CsvChunk):
+    def __init__(self, batch: Any) -> None:
+        # a pyarrow.RecordBatch or Table
+        self._batch = batch
+
+    def __len__(self) -> int:
+        return self._batch.num_rows
+
+    def row_dicts(self, indices: Sequence[int] | None = None) -> list[dict[str, Any]]:
+        batch = self._batch if indices is None else self._batch.take(list(indices))
+        return batch.to_pylist()
+
+    def frame(self) -> pd.DataFrame:
+        return self._batch.to_pandas()
+
+
+class _RecordsChunk(CsvChunk):
+    def __init__(self, rows: list[dict[str, Any]], columns: Sequence[str]) -> None:
+        self._rows = rows
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row_dicts(self, indices: Sequence[int] | None = None) -> list[dict[str, Any]]:
+        if indices is None:
+            return self._rows
+        return [self._rows[index] for index in indices]
+
+    def frame(self) -> pd.DataFrame:
+        import pandas as pd
+
+        return pd.DataFrame(self._rows, columns=list(self._columns), dtype=object)
+
+
+# Rows per chunk: a number, or a callable asked for the size of every next
+# chunk, see `datavalgen.memory.AdaptiveChunkSize`.
+ChunkSize = int | Callable[[], int]
+
+# A reader backend takes a path or binary stream, the column names if the
+# source has no header row, the columns to keep and the chunk size in rows.
+CsvReader = Callable[..., Iterator[CsvChunk]]
+
+
+def _chunk_size_fn(chunksize: ChunkSize) -> Callable[[], int]:
+    if callable(chunksize):
+        return chunksize
+    return lambda: chunksize
+
+
+def _pandas_chunks(
+    source: str | Path | BinaryIO,
+    *,
+    names: Sequence[str] | None,
+    usecols: Sequence[str] | None,
+    chunksize: ChunkSize,
+) -> Iterator[CsvChunk]:
+    """
+    pandas C parser, one DataFrame per chunk.
+    """
+    import pandas as pd
+
+    keep: list[str] | None = None
+    if names is not None and usecols is not None:
+        # With `names`, pandas can't pad rows with fewer fields than the names
+        # when it also has to pick `usecols` (it raises "Too many columns
+        # specified"), so we read all columns and pick them ourselves, in
+        # file order like `usecols`.
+        wanted = set(usecols)
+        keep = [column for column in names if column in wanted]
+        usecols = None
+
+    next_size = _chunk_size_fn(chunksize)
+    with pd.read_csv(
+        source,
+        header=None if names is not None else "infer",
+        names=list(names) if names is not None else None,
+        usecols=list(usecols) if usecols is not None else None,
+        chunksize=next_size(),
+        **CSV_READ_KWARGS,
+    ) as reader:
+        while True:
+            try:
+                df = reader.get_chunk(next_size())
+            except StopIteration:
+                return
+            yield _FrameChunk(df if keep is None else df[keep])
+
+
+class _ShortRows:
+    """
+    pyarrow's `invalid_row_handler`. pyarrow can't pad rows with missing
+    cells like pandas does, so we have it skip them and keep their text and
+    data row index, to put them back padded with empty strings. Blank rows
+    are skipped for good, as pandas does; rows with too many cells are
+    errors, as with pandas.
+    """
+
+    def __init__(self, first_row_number: int) -> None:
+        # pyarrow's number of the first data row, counting from 1 (and the
+        # header), but not empty lines.
+        self.first_row_number = first_row_number
+        self.num_blank = 0
+        self.rows: deque[tuple[int, str]] = deque()
+
+    def __call__(self, row: Any) -> str:
+        if not row.text.strip():
+            self.num_blank += 1
+            return "skip"
+        if row.number is None or row.actual_columns > row.expected_columns:
+            return "error"
+        index = row.number - self.first_row_number - self.num_blank
+        self.rows.append((index, row.text))
+        return "skip"
+
+
+def _with_short_rows(
+    batches: Iterable[Any],
+    short_rows: _ShortRows,
+    columns: Sequence[str],
+    schema: Any,
+) -> Iterator[Any]:
+    """
+    Put the rows skipped by `short_rows` back between the record batches
+    read by pyarrow, padded with empty strings. A row is reported to the
+    handler before the batch holding the rows after it is read.
+    """
+    import pyarrow as pa
+
+    positions = {column: index for index, column in enumerate(columns)}
+    index = 0
+
+    def padded() -> Iterator[Any]:
+        nonlocal index
+        rows = []
+        while short_rows.rows and short_rows.rows[0][0] <= index:
+            fields = next(csv.reader(io.StringIO(short_rows.rows.popleft()[1])))
+            fields += [""] * (len(columns) - len(fields))
+            rows.append({name: fields[positions[name]] for name in schema.names})
+            index += 1
+        if rows:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+    for batch in batches:
+        start = 0
+        while start < batch.num_rows:
+            yield from padded()
+            stop = batch.num_rows
+            if short_rows.rows:
+                stop = min(stop, start + short_rows.rows[0][0] - index)
+            yield batch.slice(start, stop - start)
+            index += stop - start
+            start = stop
+    yield from padded()
+
+
+def _pyarrow_chunks(
+    source: str | Path | BinaryIO,
+    *,
+    names: Sequence[str] | None,
+    usecols: Sequence[str] | None,
+    chunksize: ChunkSize,
+) -> Iterator[CsvChunk]:
+    """
+    pyarrow's streaming CSV reader, which parses blocks of the file in
+    several threads into Arrow record batches.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    if names is None:
+        columns = read_csv_columns(cast(str | Path, source))
+    else:
+        columns = tuple(names)
+    keep = list(usecols) if usecols is not None else list(columns)
+    short_rows = _ShortRows(first_row_number=2 if names is None else 1)
+
+    # Same semantics as CSV_READ_KWARGS: every cell is a string and nothing
+    # is turned into a null.
+    stream = pa_csv.open_csv(
+        source,
+        read_options=pa_csv.ReadOptions(
+            use_threads=True,
+            column_names=list(names) if names is not None else None,
+        ),
+        parse_options=pa_csv.ParseOptions(
+            newlines_in_values=True,
+            invalid_row_handler=short_rows,
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=keep,
+            column_types={column: pa.string() for column in keep},
+            null_values=[],
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    # Record batches are sized in bytes; we slice and combine them into
+    # chunks of `chunksize` rows.
+    next_size = _chunk_size_fn(chunksize)
+    size = next_size()
+    parts: list[Any] = []
+    num_rows = 0
+    for batch in _with_short_rows(stream, short_rows, columns, stream.schema):
+        start = 0
+        while start < batch.num_rows:
+            part = batch.slice(start, size - num_rows)
+            parts.append(part)
+            num_rows += part.num_rows
+            start += part.num_rows
+            if num_rows == size:
+                yield _ArrowChunk(_combine_batches(parts))
+                parts = []
+                num_rows = 0
+                size = next_size()
+    if parts:
+        yield _ArrowChunk(_combine_batches(parts))
+
+
+def _combine_batches(parts: list[Any]) -> Any:
+    if len(parts) == 1:
+        return parts[0]
+    import pyarrow as pa
+
+    return pa.Table.from_batches(parts)
+
+
+def _is_blank(row: list[str]) -> bool:
+    # pandas skips empty and whitespace-only lines (`skip_blank_lines`).
+    return not row or (len(row) == 1 and not row[0].strip() and row[0] != "")
+
+
+def _stdlib_chunks(
+    source: str | Path | BinaryIO,
+    *,
+    names: Sequence[str] | None,
+    usecols: Sequence[str] | None,
+    chunksize: ChunkSize,
+) -> Iterator[CsvChunk]:
+    """
+    Stream rows straight from the file with the stdlib `csv` module, without
+    pandas or DataFrames. Memory use only depends on `chunksize` and the
+    width of the selected columns.
+    """
+    if isinstance(source, (str, Path)):
+        # Like pandas, drop a UTF-8 byte order mark before the header.
+        fp = open(source, newline="", encoding="utf-8-sig")
+    else:
+        fp = io.TextIOWrapper(source, encoding="utf-8", newline="")
+
+    with fp:
+        rows = csv.reader(fp)
+        columns = tuple(names) if names is not None else tuple(next(rows, ()))
+        wanted = set(usecols) if usecols is not None else set(columns)
+        # pandas returns `usecols` in file order, so do we.
+        keep = [(index, column) for index, column in enumerate(columns) if column in wanted]
+        kept_columns = [column for _, column in keep]
+        width = len(columns)
+
+        next_size = _chunk_size_fn(chunksize)
+        size = next_size()
+        chunk: list[dict[str, Any]] = []
+        for row in rows:
+            if _is_blank(row):
+                continue
+            if len(row) > width:
+                raise ValueError(
+                    f"Expected {width} fields in line {rows.line_num}, saw {len(row)}"
+                )
+            if len(row) < width:
+                # Missing trailing cells are empty strings, as with pandas.
+                row.extend([""] * (width - len(row)))
+            chunk.append({column: row[index] for index, column in keep})
+            if len(chunk) >= size:
+                yield _RecordsChunk(chunk, kept_columns)
+                chunk = []
+                size = next_size()
+        if chunk:
+            yield _RecordsChunk(chunk, kept_columns)
+
+
+CSV_READERS: dict[str, CsvReader] = {
+    "pandas": _pandas_chunks,
+    "pyarrow": _pyarrow_chunks,
+    "csv": _stdlib_chunks,
+}
+
+
+def _get_reader(reader: str) -> CsvReader:
+    if reader not in CSV_READERS:
+        raise ValueError(
+            f"Unknown CSV reader {reader!r} (available: {', '.join(CSV_READERS)})"
+        )
+    if reader == "pyarrow":
+        try:
+            import pyarrow.csv  # noqa: F401
+        except ImportError:
+            warnings.warn(
+                "CSV reader 'pyarrow' needs 'pyarrow'; falling back to 'pandas'",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            reader = "pandas"
+    return CSV_READERS[reader]
+
+
+def read_csv_chunks(
+    source: str | Path | BinaryIO,
+    *,
+    reader: str = "pandas",
+    names: Sequence[str] | None = None,
+    usecols: Sequence[str] | None = None,
+    chunksize: ChunkSize = 5000,
+) -> Iterator[CsvChunk]:
+    """
+    Iterate over the CSV in chunks with the selected reader backend while
+    preserving raw-string parsing semantics.
+
+    :param source: Path to the CSV file, or a binary stream. Compressed
+        files are decompressed on the fly, see `open_csv_stream`.
+    :param reader: Name of the reader backend, see `CSV_READERS`. "pyarrow"
+        falls back to "pandas" with a warning when pyarrow is not installed,
+        "csv" uses the stdlib csv module and never imports pandas.
+    :param names: Column names, when the source has no header row.
+    :param usecols: Optional subset of columns to read.
+    :param chunksize: Maximum number of rows per chunk, or a callable giving
+        it for every next chunk. A callable with a `track` method, like
+        `datavalgen.memory.AdaptiveChunkSize`, also gets to see the chunks.
+    :return: Iterator of chunks.
+    """
+    if isinstance(source, (str, Path)) and csv_compression(source) is not None:
+        chunks = _compressed_chunks(
+            source, reader=reader, names=names, usecols=usecols, chunksize=chunksize
+        )
+    else:
+        chunks = _get_reader(reader)(
+            source, names=names, usecols=usecols, chunksize=chunksize
+        )
+    track = getattr(chunksize, "track", None)
+    return track(chunks) if track is not None else chunks
+
+
+def _compressed_chunks(
+    csv_path: str | Path,
+    *,
+    reader: str,
+    names: Sequence[str] | None,
+    usecols: Sequence[str] | None,
+    chunksize: ChunkSize,
+) -> Iterator[CsvChunk]:
+    # The header and the rows come from the same decompressed stream.
+    with open_csv_stream(csv_path) as stream:
+        if names is None:
+            names = read_csv_header(stream)
+        yield from _get_reader(reader)(
+            stream, names=names, usecols=usecols, chunksize=chunksize
+        )
+
+
+class _RecordScanner:
+    """
+    Find record boundaries in a CSV byte stream without parsing it.
+
+    Newlines inside quoted fields are not record ends: we track the parity of
+    `"` characters seen so far (escaped `""` quotes keep it even).
+    """
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        # Absolute offset of `self._block[0]`.
+        self._block_start = 0
+        self._block = fp.read(_SCAN_BLOCK_SIZE)
+        # Scan position in the block and quote parity at that position.
+        self._pos = 0
+        self._in_quotes = False
+
+    def _consume(self, stop: int) -> None:
+        if self._block.count(b'"', self._pos, stop) % 2:
+            self._in_quotes = not self._in_quotes
+        self._pos = stop
+
+    def _next_block(self) -> None:
+        self._block_start += len(self._block)
+        self._block = self._fp.read(_SCAN_BLOCK_SIZE)
+        self._pos = 0
+
+    def next_boundary(self, target: int = 0) -> int | None:
+        """
+        Return the first record boundary at or after byte offset `target`, or
+        None at EOF. Targets must not go backwards between calls.
+        """
+        while self._block:
+            end = len(self._block)
+            local_target = target - self._block_start
+            if local_target > self._pos:
+                # Skip ahead to the target, only counting quotes.
+                self._consume(min(local_target, end))
+                if self._pos == end:
+                    self._next_block()
+                continue
+
+            newline = self._block.find(b"\n", self._pos)
+            if newline == -1:
+                self._consume(end)
+                self._next_block()
+                continue
+
+            self._consume(newline + 1)
+            if not self._in_quotes:
+                return self._block_start + self._pos
+        return None
+
+
+def csv_record_boundaries(csv_path: str | Path, num_parts: int) -> list[int]:
+    """
+    Split a CSV file into `num_parts` byte ranges that start and end on record
+    boundaries.
+
+    The first boundary is the end of the header record and the last one is the
+    file size, so consecutive pairs are `(start, end)` ranges of data rows.
+    Finding the boundaries needs one sequential pass over the file, but it only
+    counts bytes and is cheap next to parsing and validation.
+
+    :param csv_path: Path to the CSV file.
+    :param num_parts: Number of byte ranges to aim for. Ranges may be empty
+        for small files.
+    :return: Sorted byte offsets, `num_parts + 1` of them.
+    """
+    size = os.path.getsize(csv_path)
+    boundaries: list[int] = []
+
+    with open(csv_path, "rb") as fp:
+        scanner = _RecordScanner(fp)
+        # The first target is 0, which gives us the end of the header.
+        for part in range(num_parts):
+            target = size * part // num_parts
+            # Several targets can fall inside one (long) record.
+            if boundaries and boundaries[-1] >= target:
+                boundaries.append(boundaries[-1])
+                continue
+            boundary = scanner.next_boundary(target)
+            if boundary is None:
+                break
+            boundaries.append(boundary)
+
+    # Files without a trailing newline (or with fewer rows than parts) end at
+    # the file size.
+    boundaries.extend([size] * (num_parts + 1 - len(boundaries)))
+    return boundaries
+
+
+def csv_rows_end(csv_path: str | Path, num_rows: int) -> int:
+    """
+    Byte offset just after the first `num_rows` data records of a CSV file
+    (blank lines count as records), or the file size if it has fewer.
+    """
+    with open(csv_path, "rb") as fp:
+        scanner = _RecordScanner(fp)
+        # The end of the header.
+        boundary = scanner.next_boundary(0)
+        for _ in range(num_rows):
+            if boundary is None:
+                break
+            boundary = scanner.next_boundary(boundary)
+    return os.path.getsize(csv_path) if boundary is None else boundary
+
+
+def csv_block_boundaries(csv_path: str | Path, block_size: int) -> list[int]:
+    """
+    Split the data rows of a CSV file into record-aligned blocks of about
+    `block_size` bytes.
+
+    Unlike `csv_record_boundaries`, each boundary only depends on the bytes
+    before it, so rows appended to the file leave all blocks but the last one
+    unchanged.
+
+    :param csv_path: Path to the CSV file.
+    :param block_size: Minimum size of a block in bytes (the last one may be
+        smaller).
+    :return: Sorted byte offsets starting at the end of the header and ending
+        at the file size; consecutive pairs are `(start, end)` blocks.
+    """
+    size = os.path.getsize(csv_path)
+    with open(csv_path, "rb") as fp:
+        scanner = _RecordScanner(fp)
+        boundary = scanner.next_boundary(0)
+        if boundary is None:
+            # Header only, without a trailing newline.
+            return [size]
+        boundaries = [boundary]
+        while boundary < size:
+            boundary = scanner.next_boundary(boundary + block_size)
+            if boundary is None:
+                break
+            boundaries.append(boundary)
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+
+class _ByteRange(io.RawIOBase):
+    """
+    Read-only binary stream over the `[start, end)` byte range of a file.
+    """
+
+    def __init__(self, csv_path: str | Path, start: int, end: int) -> None:
+        self._fp = open(csv_path, "rb")
+        self._fp.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[: self._remaining]
+        count = self._fp.readinto(view)
+        self._remaining -= count
+        return count
+
+    def close(self) -> None:
+        self._fp.close()
+        super().close()
+
+
+def open_csv_range(csv_path: str | Path, start: int, end: int) -> BinaryIO:
+    """
+    Open the `[start, end)` byte range of a file as a buffered binary stream.
+
+    :param csv_path: Path to the CSV file.
+    :param start: First byte of the range, usually from `csv_record_boundaries`.
+    :param end: Byte offset just after the range.
+    :return: Binary stream that hits EOF at `end`.
+    """
+    return io.BufferedReader(_ByteRange(csv_path, start, end))
+
+
+def read_csv_range_chunks(
+    csv_path: str | Path,
+    start: int,
+    end: int,
+    *,
+    columns: Sequence[str],
+    reader: str = "pandas",
+    usecols: Sequence[str] | None = None,
+    chunksize: ChunkSize = 5000,
+) -> Iterator[CsvChunk]:
+    """
+    Iterate over the data rows in a byte range of the CSV in chunks.
+
+    The range has no header, so the caller passes the column names read from
+    the start of the file.
+
+    :param csv_path: Path to the CSV file.
+    :param start: First byte of the range (a record boundary).
+    :param end: Byte offset just after the range (a record boundary).
+    :param columns: All column names of the CSV, in file order.
+    :param reader: Name of the reader backend, see `CSV_READERS`.
+    :param usecols: Optional subset of columns to read.
+    :param chunksize: Maximum number of rows per chunk.
+    :return: Iterator of chunks.
+    """
+    if start >= end:
+        return
+    with open_csv_range(csv_path, start, end) as stream:
+        yield from read_csv_chunks(
+            stream,
+            reader=reader,
+            names=columns,
+            usecols=usecols,
+            chunksize=chunksize,
+        )
+
+
+class _ReaderFailed:
+    """
+    Carries an exception raised in the reader thread over to the consumer.
+    """
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_END = object()
+
+
+def prefetch_chunks(chunks: Iterable[T], depth: int) -> Iterator[T]:
+    """
+    Read chunks in a background thread while the caller processes earlier
+    ones.
+
+    Parsing (pandas and pyarrow release the GIL for most of it) then
+    overlaps with validation. At most `depth` parsed chunks wait in the queue,
+    which bounds the extra memory.
+
+    :param chunks: Chunk iterable, consumed in the reader thread.
+    :param depth: Maximum number of chunks read ahead. `0` disables the
+        reader thread and just returns the chunks.
+    :return: Iterator over the same chunks, in the same order.
+    """
+    if depth <= 0:
+        yield from chunks
+        return
+
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Wake up regularly so the thread can exit when the consumer is gone.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read() -> None:
+        iterator = iter(chunks)
+        try:
+            for chunk in iterator:
+                if not put(chunk):
+                    return
+            put(_END)
+        except BaseException as exc:
+            put(_ReaderFailed(exc))
+        finally:
+            # Close generators (and the files they hold) in this thread.
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=read, name="datavalgen-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, _ReaderFailed):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        thread.join()
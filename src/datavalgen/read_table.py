@@ -0,0 +1,143 @@
+"""
+Read Parquet and Arrow IPC (Feather v2) files in chunks for validation.
+
+Unlike CSV cells, the columns of these files are typed, so rows are handed
+to pydantic as Python values (ints, dates, ...) and nothing is re-parsed from
+strings. Only the model's columns are read.
+
+Needs pyarrow, which is an optional dependency.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+
+from datavalgen.read_csv import CsvChunk, _ArrowChunk
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "TABLE_FORMATS",
+    "table_format",
+    "read_table_columns",
+    "read_table_chunks",
+]
+
+TABLE_FORMATS = ("parquet", "arrow")
+
+_SUFFIXES = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def table_format(path: str | Path) -> str | None:
+    """
+    Return the table format of a file ("parquet" or "arrow"), from its suffix
+    or else its magic bytes, or None for anything else (e.g. CSV).
+    """
+    suffix_format = _SUFFIXES.get(Path(path).suffix.lower())
+    if suffix_format is not None:
+        return suffix_format
+    try:
+        with open(path, "rb") as fp:
+            magic = fp.read(6)
+    except OSError:
+        return None
+    if magic[:4] == b"PAR1":
+        return "parquet"
+    if magic == b"ARROW1":
+        return "arrow"
+    return None
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("Reading Parquet or Arrow files needs 'pyarrow'.") from exc
+    return pa
+
+
+def _format(path: str | Path) -> str:
+    file_format = table_format(path)
+    if file_format is None:
+        raise ValueError(f"{str(path)!r} is not a Parquet or Arrow IPC file")
+    return file_format
+
+
+def read_table_columns(path: str | Path) -> tuple[str, ...]:
+    """
+    Return the column names of a Parquet or Arrow IPC file from its schema.
+    """
+    pa = _pyarrow()
+    if _format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        return tuple(pq.read_schema(path).names)
+    with pa.memory_map(str(path)) as source:
+        return tuple(pa.ipc.open_file(source).schema.names)
+
+
+class _TableChunk(_ArrowChunk):
+    """
+    A record batch with typed columns.
+    """
+
+    def frame(self) -> pd.DataFrame:
+        import pandas as pd
+
+        # Python objects, exactly as in `row_dicts`: pandas would turn ints
+        # with nulls into floats and nulls into NaN.
+        return pd.DataFrame(
+            {
+                name: pd.Series(column.to_pylist(), dtype=object)
+                for name, column in zip(self._batch.schema.names, self._batch.columns)
+            }
+        )
+
+
+def read_table_chunks(
+    path: str | Path,
+    *,
+    usecols: Sequence[str] | None = None,
+    chunksize: int = 5000,
+) -> Iterator[CsvChunk]:
+    """
+    Iterate over the rows of a Parquet or Arrow IPC file in chunks.
+
+    Parquet files are streamed row group by row group, Arrow IPC files are
+    memory-mapped and read batch by batch. Either way only `usecols` are
+    read.
+
+    :param path: Path to the Parquet or Arrow IPC (Feather v2) file.
+    :param usecols: Optional subset of columns to read.
+    :param chunksize: Maximum number of rows per chunk.
+    :return: Iterator of chunks.
+    """
+    pa = _pyarrow()
+    columns = list(usecols) if usecols is not None else None
+
+    if _format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        with pq.ParquetFile(path) as parquet_file:
+            for batch in parquet_file.iter_batches(
+                batch_size=chunksize, columns=columns
+            ):
+                yield _TableChunk(batch)
+        return
+
+    with pa.memory_map(str(path)) as source:
+        ipc_file = pa.ipc.open_file(source)
+        for index in range(ipc_file.num_record_batches):
+            batch = ipc_file.get_batch(index)
+            if columns is not None:
+                batch = batch.select(columns)
+            for start in range(0, batch.num_rows, chunksize):
+                yield _TableChunk(batch.slice(start, chunksize))
@@ -1,20 +1,29 @@
 from collections import defaultdict
+from typing import Callable, Iterable
 
 from pydantic_core import ErrorDetails
 
+from datavalgen.sampling import ErrorRateEstimate
+
+
+def _default_line_number(row: int) -> int:
+    return row + 2
+
 
 def format_val_errors(
-    errors: list[ErrorDetails],
+    errors: Iterable[ErrorDetails],
     max_errors: int = 10,
     *,
     truncated: bool = False,
+    line_numbers: Callable[[int], int] | None = None,
 ) -> str:
     """
     Format Pydantic v2 validation errors into a compact, human-readable string
     (with new lines).
 
-    The function expects a list of `ErrorDetails` (the dicts you get from
-    `ValidationError.errors()` in Pydantic v2). It groups "cell-level" errors
+    The function expects `ErrorDetails` (the dicts you get from
+    `ValidationError.errors()` in Pydantic v2), e.g. a list or the
+    `ErrorStore` of a `CsvCheckResult`. It groups "cell-level" errors
     by (row_index, field_name) when the error location begins with an integer
     (e.g., `(3, "age", ...)` meaning row 3, field "age"). Other errors are
     treated as "model-level" (e.g., `__root__` or custom validators not tied
@@ -23,27 +32,22 @@ def format_val_errors(
     Row numbers are displayed as `row_index + 2` to account for zero-based
     indexing and a single header row. So DataFrame row 0 → “Line 2”. Line 1 is
     the header with column names. Just makes this easier for folks using simple
-    editors to quickly edit/view their CSVs.
+    editors to quickly edit/view their CSVs. That is off when quoted fields
+    hold newlines or there are blank lines; pass `line_numbers` (e.g.
+    `RowIndex.line_number`) to map rows to the true lines.
 
     Args:
-        errors: A list of Pydantic `ErrorDetails` dictionaries.
+        errors: Pydantic `ErrorDetails` dictionaries.
         max_errors: Maximum number of distinct problem *cells* (row, column
             pairs) to print before truncating with a summary line.
         truncated: Whether the caller already truncated the input error list and
             therefore only wants a generic truncation note.
+        line_numbers: Maps a row index to its line in the file.
 
     Returns:
         str: A human-readable multi-line summary. If `errors` is empty, returns
             "✅ No validatoin errors found."
     """
-    if not errors:
-        if truncated:
-            return (
-                f"Validation found errors, but output was truncated because "
-                f"--max-errors is set to {max_errors}."
-            )
-        return "✅ No validation errors found."
-
     cell_errs: dict[tuple[int, str], list[ErrorDetails]] = defaultdict(list)
     model_errs: list[ErrorDetails] = []
 
@@ -60,13 +64,24 @@ def format_val_errors(
             # they can come from custom validators
             model_errs.append(err)
 
+    if not cell_errs and not model_errs:
+        if truncated:
+            return (
+                f"Validation found errors, but output was truncated because "
+                f"--max-errors is set to {max_errors}."
+            )
+        return "✅ No validation errors found."
+
+    if line_numbers is None:
+        line_numbers = _default_line_number
+
     lines: list[str] = []
 
     # Pretty-print cell-level problems
     displayed_cell_errs = list(cell_errs.items())[:max_errors]
     for (row, col), errs in displayed_cell_errs:
         joined = "\n   Or: ".join(e["msg"] for e in errs)
-        lines.append(f"❌ Line {row + 2}, column '{col}': {joined}.")
+        lines.append(f"❌ Line {line_numbers(row)}, column '{col}': {joined}.")
         lines.append(f"   Got: '{errs[0]['input']}'.")
     if len(cell_errs) > max_errors:
         lines.append(f"... and {len(cell_errs) - max_errors} more problem cells.")
@@ -83,7 +98,31 @@ def format_val_errors(
     for err in model_errs:
         loc_str = ".".join(str(x) for x in err["loc"]) or "__root__"
         if loc_str.isdigit():
-            loc_str = int(loc_str) + 2
+            loc_str = line_numbers(int(loc_str))
         lines.append(f"❌ Line {loc_str}: {err['msg']}")
 
     return "\n".join(lines)
+
+
+def format_error_rate_estimate(estimate: ErrorRateEstimate) -> str:
+    """
+    Summarize an error rate estimated from a sample of rows, with the
+    estimated failure rate of every column that had errors in the sample.
+    """
+    lines = [
+        f"📊 {estimate.num_failing_rows} of {estimate.num_rows} sampled rows have "
+        f"errors: estimated error rate {estimate.error_rate:.1%} "
+        f"({estimate.confidence:.0%} confidence interval "
+        f"{estimate.low:.1%} to {estimate.high:.1%})."
+    ]
+    failing_columns = [
+        f"'{column}' {rate:.1%}"
+        for column, rate in estimate.column_rates.items()
+        if rate > 0
+    ]
+    if failing_columns:
+        lines.append(
+            f"   Estimated rows failing per column: {', '.join(failing_columns)}."
+        )
+    lines.append("   (Run without --sample to check every row.)")
+    return "\n".join(lines)
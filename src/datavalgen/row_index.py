@@ -0,0 +1,303 @@
+"""
+Byte-offset index of the data rows of a CSV file, for random access.
+
+Row indices in validation errors count data rows, so the line of row `i` is
+only `i + 2` when no quoted field holds a newline and there are no blank
+lines. The index keeps, for every data row, the byte offset where it starts
+and the physical line it starts on, as two compact int64 arrays. With it we
+report true line numbers and re-validate a range of rows by reading just
+those bytes from a memory map, in time proportional to the number of rows
+and not to their position in the file.
+
+The index is built in one vectorized pass over a memory map of the file and
+saved next to it (see `default_index_path`). It only holds offsets, no data
+values. A saved index is ignored once the file's size or modification time
+changes.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import warnings
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from datavalgen.read_csv import (
+    ChunkSize,
+    CsvChunk,
+    csv_compression,
+    read_csv_chunks,
+)
+
+__all__ = [
+    "RowIndex",
+    "build_row_index",
+    "default_index_path",
+    "get_row_index",
+    "read_row_chunks",
+]
+
+# Bytes scanned at a time; the scan needs a few bytes of scratch per byte.
+_INDEX_BLOCK_SIZE = 16 << 20
+
+_NEWLINE = ord("\n")
+_QUOTE = ord('"')
+# pandas skips lines with only whitespace (`skip_blank_lines`).
+_BLANK_BYTES = np.array([ord(" "), ord("\t"), ord("\r"), ord("\n")], dtype=np.uint8)
+
+
+def default_index_path(csv_path: str | Path) -> Path:
+    """
+    Sidecar path of the row index of `csv_path`.
+    """
+    return Path(f"{csv_path}.datavalgen-index")
+
+
+def _stamp(csv_path: str | Path) -> tuple[int, int]:
+    stat = os.stat(csv_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+@dataclass(frozen=True)
+class RowIndex:
+    """
+    Start offsets and line numbers of the data rows of a CSV file.
+    """
+
+    # Byte offset where each data row starts, followed by the file size.
+    offsets: np.ndarray
+    # One-based physical line on which each data row starts.
+    lines: np.ndarray
+    # File size and modification time the index was built for.
+    stamp: tuple[int, int]
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def byte_range(self, start_row: int, stop_row: int) -> tuple[int, int]:
+        """
+        Byte range `[start, end)` holding the data rows `start_row` up to (not
+        including) `stop_row`; both are clipped to the rows in the file.
+        """
+        start_row = min(max(start_row, 0), len(self))
+        stop_row = min(max(stop_row, start_row), len(self))
+        return int(self.offsets[start_row]), int(self.offsets[stop_row])
+
+    def line_number(self, row: int) -> int:
+        """
+        One-based line in the file on which data row `row` starts.
+        """
+        if 0 <= row < len(self):
+            return int(self.lines[row])
+        # Rows past the end, e.g. from another file; best effort.
+        return row + 2
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the index to `path`. Failing to write it is not an error, it is
+        just built again next time.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            with open(tmp_path, "wb") as fp:
+                np.savez(
+                    fp,
+                    offsets=self.offsets,
+                    lines=self.lines,
+                    stamp=np.array(self.stamp, dtype=np.int64),
+                )
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            warnings.warn(
+                f"Could not write row index {path}: {exc}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> RowIndex | None:
+        """
+        Read an index written by `save`, or None if there is no usable one.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                offsets = data["offsets"]
+                lines = data["lines"]
+                size, mtime_ns = (int(value) for value in data["stamp"])
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # e.g. truncated by a crash while it was copied
+            return None
+        return cls(offsets=offsets, lines=lines, stamp=(size, mtime_ns))
+
+
+def _scan_rows(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the start offsets and lines of the non-blank data records in the
+    bytes of a CSV file, `_INDEX_BLOCK_SIZE` bytes at a time.
+    """
+    starts: list[np.ndarray] = []
+    lines: list[np.ndarray] = []
+    # State carried from one block to the next: quote parity, lines seen,
+    # and start, line and "has a non-blank byte" of the open record.
+    in_quotes = 0
+    num_newlines = 0
+    record_start = 0
+    record_line = 1
+    record_nonblank = False
+
+    for block_start in range(0, len(data), _INDEX_BLOCK_SIZE):
+        block = data[block_start : block_start + _INDEX_BLOCK_SIZE]
+        newlines = np.flatnonzero(block == _NEWLINE)
+        quotes = np.flatnonzero(block == _QUOTE)
+        # A newline ends a record if an even number of quotes precede it.
+        parity = (in_quotes + np.searchsorted(quotes, newlines)) % 2
+        is_end = parity == 0
+        # Local offsets just after each record end, and their line numbers.
+        ends = newlines[is_end] + 1
+        end_lines = num_newlines + np.flatnonzero(is_end) + 2
+
+        # Does each record ending in this block have a non-blank byte? The
+        # first one may have started in an earlier block.
+        nonblank = ~np.isin(block, _BLANK_BYTES)
+        bounds = np.concatenate(([0], ends))
+        bounds = bounds[bounds < len(block)]
+        any_nonblank = np.logical_or.reduceat(nonblank, bounds)
+        any_nonblank[0] |= record_nonblank
+
+        if len(ends):
+            # Records closed in this block: the open one, then one starting
+            # at every record end but the last.
+            closed_starts = np.concatenate(
+                ([record_start], ends[:-1] + block_start)
+            ).astype(np.int64)
+            closed_lines = np.concatenate(([record_line], end_lines[:-1]))
+            keep = any_nonblank[: len(ends)]
+            starts.append(closed_starts[keep])
+            lines.append(closed_lines[keep].astype(np.int64))
+            record_start = int(ends[-1]) + block_start
+            record_line = int(end_lines[-1])
+            # Bytes after the last record end belong to the open record.
+            record_nonblank = len(any_nonblank) > len(ends) and bool(any_nonblank[-1])
+        else:
+            record_nonblank = bool(any_nonblank[0])
+
+        in_quotes = int(in_quotes + len(quotes)) % 2
+        num_newlines += len(newlines)
+
+    # The last record may lack a newline.
+    if record_nonblank:
+        starts.append(np.array([record_start], dtype=np.int64))
+        lines.append(np.array([record_line], dtype=np.int64))
+    if not starts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(starts), np.concatenate(lines)
+
+
+def build_row_index(csv_path: str | Path) -> RowIndex:
+    """
+    Scan a CSV file and index its data rows.
+
+    Record ends are found like `csv_record_boundaries` does, without parsing:
+    newlines inside quoted fields don't end a record. The first record is the
+    header; blank lines are skipped, as pandas does.
+
+    :raises ValueError: for compressed files, which can't be memory-mapped.
+    """
+    if csv_compression(csv_path) is not None:
+        raise ValueError(
+            f"{str(csv_path)!r} is compressed; a row index needs an uncompressed "
+            "CSV file"
+        )
+    stamp = _stamp(csv_path)
+    size = stamp[0]
+    if size == 0:
+        starts = lines = np.empty(0, dtype=np.int64)
+    else:
+        with open(csv_path, "rb") as fp, mmap.mmap(
+            fp.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            data = np.frombuffer(mapped, dtype=np.uint8)
+            try:
+                starts, lines = _scan_rows(data)
+            finally:
+                # The mmap can't close while numpy still exports its buffer.
+                del data
+        # Drop the header.
+        starts, lines = starts[1:], lines[1:]
+    return RowIndex(
+        offsets=np.append(starts, np.int64(size)),
+        lines=lines,
+        stamp=stamp,
+    )
+
+
+def get_row_index(
+    csv_path: str | Path,
+    index_path: str | Path | None = None,
+    *,
+    save: bool = True,
+) -> RowIndex:
+    """
+    Load the saved row index of a CSV file, or build it (and save it) when
+    there is none or the file changed since.
+
+    :param csv_path: Path to the CSV file.
+    :param index_path: Where the index is kept, by default
+        `default_index_path(csv_path)`.
+    :param save: Save a newly built index.
+    """
+    if index_path is None:
+        index_path = default_index_path(csv_path)
+    index = RowIndex.load(index_path)
+    if index is not None and index.stamp == _stamp(csv_path):
+        return index
+    index = build_row_index(csv_path)
+    if save:
+        index.save(index_path)
+    return index
+
+
+def read_row_chunks(
+    csv_path: str | Path,
+    index: RowIndex,
+    start_row: int,
+    stop_row: int,
+    *,
+    columns: Sequence[str],
+    reader: str = "pandas",
+    usecols: Sequence[str] | None = None,
+    chunksize: ChunkSize = 5000,
+) -> Iterator[CsvChunk]:
+    """
+    Iterate over the data rows `start_row` up to (not including) `stop_row`
+    in chunks, only reading their bytes from a memory map of the file.
+
+    :param csv_path: Path to the CSV file `index` was built for.
+    :param index: Row index of the file, see `get_row_index`.
+    :param columns: All column names of the CSV, in file order.
+    :param reader: Name of the reader backend, see `CSV_READERS`.
+    :param usecols: Optional subset of columns to read.
+    :param chunksize: Maximum number of rows per chunk.
+    :return: Iterator of chunks.
+    """
+    start, end = index.byte_range(start_row, stop_row)
+    if start >= end:
+        return
+    with open(csv_path, "rb") as fp, mmap.mmap(
+        fp.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        rows = mapped[start:end]
+    yield from read_csv_chunks(
+        io.BytesIO(rows),
+        reader=reader,
+        names=columns,
+        usecols=usecols,
+        chunksize=chunksize,
+    )
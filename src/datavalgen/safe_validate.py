@@ -6,12 +6,15 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 from pathlib import Path
+from typing import Sequence
 
 from run_context import run_context
 
+from datavalgen.checkpoint import default_checkpoint_dir
 from datavalgen.plugins import get_model
-from datavalgen.validate import check_csv_file
+from datavalgen.validate import check_csv_files
 
 
 @run_context(
@@ -20,13 +23,37 @@ from datavalgen.validate import check_csv_file
     output_uris="output_path",
 )
 def safe_validate(
-    dataset_path: Path,
+    dataset_path: Path | Sequence[Path],
     output_path: Path,
     pydantic_model_name: str | None = None,
     json_out: bool = True,
+    workers: int | None = None,
+    reader: str | None = None,
+    checkpoints: bool = True,
 ) -> None:
     """
-    Validate one CSV and write privacy-safe result to output path.
+    Validate one or more CSVs and write privacy-safe result to output path.
+
+    `dataset_path` is one CSV or a sequence of CSVs, validated against the
+    model `pydantic_model_name` (or the DATAVALGEN_MODEL env var) from the
+    trusted DATAVALGEN_DISTRIBUTION. Errors are only counted, error details
+    (which would hold data values) are never built.
+
+    The result is `{"num_errors": N}` with `json_out` (the default), else
+    just the number. For several input CSVs the JSON has the total count and
+    one count per input, in input order: `{"num_errors": N, "files":
+    [{"num_errors": n}, ...]}`. File names are left out on purpose.
+
+    `workers` (or the DATAVALGEN_WORKERS env var) sets how many processes
+    validate the CSVs in parallel. `reader` (or DATAVALGEN_READER) picks the
+    CSV reader backend, e.g. "csv" for nodes with little memory.
+
+    With `checkpoints` (the default), progress is saved next to the output
+    (see `datavalgen.checkpoint.default_checkpoint_dir`) while validating, so
+    a task that is preempted and started again with the same run context
+    resumes where it stopped and writes the same result. The checkpoints
+    hold offsets and counts but no data values, and are removed once the
+    result is written.
     """
     model_name = pydantic_model_name or os.environ.get("DATAVALGEN_MODEL")
     if not model_name:
@@ -43,14 +70,35 @@ def safe_validate(
             "lookup is restricted to one trusted distribution"
         )
     model = get_model(model_name, distribution=distribution)
-    validation = check_csv_file(dataset_path, model, max_errors=0)
-    num_errors = validation.num_errors
+    if workers is None:
+        workers = int(os.environ.get("DATAVALGEN_WORKERS", "1"))
+    reader = reader or os.environ.get("DATAVALGEN_READER", "pandas")
+    many = not isinstance(dataset_path, (str, Path))
+    dataset_paths = list(dataset_path) if many else [dataset_path]
+    checkpoint_dir = default_checkpoint_dir(output_path) if checkpoints else None
+    validations = check_csv_files(
+        dataset_paths,
+        model,
+        max_errors=0,
+        workers=workers,
+        reader=reader,
+        checkpoint_dir=checkpoint_dir,
+    )
+    num_errors = sum(validation.num_errors for validation in validations)
+
+    payload: dict[str, object] = {"num_errors": int(num_errors)}
+    if many:
+        payload["files"] = [
+            {"num_errors": int(validation.num_errors)} for validation in validations
+        ]
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     if json_out:
         with open(output_path, "w", encoding="utf-8") as fp:
-            json.dump({"num_errors": int(num_errors)}, fp)
+            json.dump(payload, fp)
             fp.write("\n")
     else:
         with open(output_path, "w", encoding="utf-8") as fp:
             fp.write(f"{int(num_errors)}\n")
+    if checkpoint_dir is not None:
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
@@ -0,0 +1,213 @@
+"""
+Validate a random sample of rows to quickly estimate the error rate of a
+large CSV file.
+
+Rows are cut out of the file by seeking to random byte offsets and taking the
+record after the next newline, so we only read the sampled rows and not the
+whole file. A record is then picked with a probability proportional to the
+length of the line before it, which is close enough to uniform for extracts
+with similar row lengths. Records we can't cut out reliably (e.g. when we land
+inside a quoted field with newlines, so the cut parses as several rows) are
+skipped, single rows with the wrong number of fields are failing rows.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import NormalDist
+from typing import BinaryIO, Iterable, Sequence
+
+from pydantic_core import ErrorDetails
+
+from datavalgen.read_csv import csv_record_boundaries
+
+__all__ = [
+    "CsvRecordSample",
+    "ErrorRateEstimate",
+    "estimate_error_rate",
+    "sample_csv_records",
+    "wilson_interval",
+]
+
+# Give up on a record spanning more lines than this, we most likely landed
+# inside a quoted field.
+_MAX_RECORD_LINES = 1000
+
+
+def _read_record(fp: BinaryIO) -> bytes | None:
+    record = fp.readline()
+    if not record:
+        return None
+    # A record goes on while a quoted field is open (odd number of quotes).
+    num_lines = 1
+    while record.count(b'"') % 2:
+        line = fp.readline()
+        if not line or num_lines >= _MAX_RECORD_LINES:
+            return None
+        record += line
+        num_lines += 1
+    return record
+
+
+def _num_fields(record: bytes) -> int:
+    rows = list(csv.reader(io.StringIO(record.decode("utf-8", "replace"))))
+    return len(rows[0]) if len(rows) == 1 else -1
+
+
+@dataclass(frozen=True)
+class CsvRecordSample:
+    """
+    Records cut out of a CSV file by `sample_csv_records`.
+    """
+
+    # Raw records with `num_columns` fields in file order, each ending with a
+    # newline.
+    records: list[bytes]
+    # Sampled records with another number of fields.
+    num_malformed: int = 0
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.records) + self.num_malformed
+
+
+def sample_csv_records(
+    csv_path: str | Path,
+    num_rows: int,
+    *,
+    num_columns: int,
+    seed: int | None = None,
+    start: int = 0,
+) -> CsvRecordSample:
+    """
+    Cut up to `num_rows` random data records out of a CSV file.
+
+    :param csv_path: Path to the CSV file.
+    :param num_rows: Number of random byte offsets to draw. Offsets leading to
+        the same record, or to a record we can't cut out reliably, don't give
+        a row, so small files yield fewer records.
+    :param num_columns: Number of columns in the header. Records with another
+        number of fields are only counted.
+    :param seed: Seed for the random offsets, for a reproducible sample.
+    :param start: Only sample records starting at or after this byte offset
+        (at a record boundary), e.g. to leave out rows validated otherwise.
+    """
+    header_end, size = csv_record_boundaries(csv_path, 1)
+    start = max(start, header_end)
+    if start >= size:
+        return CsvRecordSample([])
+
+    rng = random.Random(seed)
+    # Seeking to the newline ending the previous record selects the first
+    # record after `start`.
+    offsets = sorted(rng.randrange(start - 1, size - 1) for _ in range(num_rows))
+
+    records: list[bytes] = []
+    num_malformed = 0
+    seen: set[int] = set()
+    with open(csv_path, "rb") as fp:
+        for offset in offsets:
+            fp.seek(offset)
+            # Skip the rest of the line we landed in.
+            fp.readline()
+            start = fp.tell()
+            if start in seen:
+                continue
+            seen.add(start)
+            record = _read_record(fp)
+            if record is None:
+                continue
+            num_fields = _num_fields(record)
+            if num_fields == -1:
+                continue
+            if num_fields != num_columns:
+                num_malformed += 1
+                continue
+            if not record.endswith(b"\n"):
+                record += b"\n"
+            records.append(record)
+    return CsvRecordSample(records, num_malformed)
+
+
+def wilson_interval(
+    successes: int, trials: int, confidence: float = 0.95
+) -> tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion, which behaves well for
+    proportions close to 0 or 1 (unlike the normal approximation).
+
+    :return: `(low, high)`, `(0.0, 1.0)` when there are no trials.
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = (
+        z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    ) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+@dataclass(frozen=True)
+class ErrorRateEstimate:
+    """
+    Fraction of rows with errors, estimated from a sample of rows.
+    """
+
+    num_rows: int
+    num_failing_rows: int
+    confidence: float
+    # Confidence interval of the error rate.
+    low: float
+    high: float
+    # Estimated fraction of rows with an error in each column.
+    column_rates: dict[str, float]
+
+    @property
+    def error_rate(self) -> float:
+        return self.num_failing_rows / self.num_rows if self.num_rows else 0.0
+
+
+def estimate_error_rate(
+    errors: Iterable[ErrorDetails],
+    num_rows: int,
+    columns: Sequence[str],
+    confidence: float = 0.95,
+    *,
+    num_malformed: int = 0,
+) -> ErrorRateEstimate:
+    """
+    Estimate the error rate of a file from the errors found in `num_rows`
+    sampled rows (`loc` starting with the index of the row in the sample).
+
+    `num_malformed` of the `num_rows` rows couldn't be validated at all (see
+    `CsvRecordSample`); they fail, but not in any particular column.
+    """
+    failing_rows: set[object] = set()
+    column_failures: dict[str, set[object]] = {column: set() for column in columns}
+    for error in errors:
+        loc = error["loc"]
+        failing_rows.add(loc[0])
+        if len(loc) > 1 and loc[1] in column_failures:
+            column_failures[str(loc[1])].add(loc[0])
+
+    num_failing_rows = len(failing_rows) + num_malformed
+    low, high = wilson_interval(num_failing_rows, num_rows, confidence)
+    return ErrorRateEstimate(
+        num_rows=num_rows,
+        num_failing_rows=num_failing_rows,
+        confidence=confidence,
+        low=low,
+        high=high,
+        column_rates={
+            column: len(rows) / num_rows if num_rows else 0.0
+            for column, rows in column_failures.items()
+        },
+    )
@@ -1,14 +1,49 @@
 from __future__ import annotations
 
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Sequence, cast
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Sequence, cast
 
 from pydantic import BaseModel, TypeAdapter
 from pydantic_core import ErrorDetails, ValidationError
 
 from datavalgen.check_result import CheckResult
-from datavalgen.read_csv import iter_csv_chunks, read_csv_columns
+from datavalgen.error_store import ErrorStore
+from datavalgen.read_csv import (
+    ChunkSize,
+    CsvChunk,
+    csv_block_boundaries,
+    csv_compression,
+    csv_record_boundaries,
+    csv_rows_end,
+    prefetch_chunks,
+    read_csv_chunks,
+    read_csv_columns,
+    read_csv_range_chunks,
+)
+from datavalgen.sampling import (
+    ErrorRateEstimate,
+    estimate_error_rate,
+    sample_csv_records,
+)
+
+# The row index needs numpy, which the stdlib "csv" reader does without.
+if TYPE_CHECKING:
+    from datavalgen.row_index import RowIndex
+
+# Ways to validate a chunk of rows, see `_ChunkValidator`.
+ENGINES = ("batch", "columnar", "per-field")
+
+# Number of rows validated before `abort_error_rate` is checked, so one bad
+# chunk at the start of a large file doesn't stop the scan on its own.
+ABORT_MIN_ROWS = 1000
 
 
 @dataclass(frozen=True)
@@ -18,10 +53,17 @@ class CsvCheckResult:
     the sampled errors retained for reporting.
     """
 
-    errors: tuple[ErrorDetails, ...] = ()
+    # An `ErrorStore` for results of `check_csv_file`, which compares equal to
+    # a tuple of the same errors.
+    errors: Sequence[ErrorDetails] = ()
     warnings: tuple[str, ...] = ()
     num_errors: int = 0
     truncated: bool = False
+    # Set when the scan stopped before the end of the file (`stop_after` or
+    # `abort_error_rate`), `num_errors` is then a lower bound.
+    stop_reason: str | None = None
+    # Set when only a random sample of rows was validated (`sample_rows`).
+    estimate: ErrorRateEstimate | None = None
 
     @property
     def ok(self) -> bool:
@@ -57,44 +99,906 @@ def check_column_names(
         warnings=tuple(warning_lines),
     )
 
-def _prefix_row_index(error: ErrorDetails, row_index: int) -> ErrorDetails:
+def _prefix_row_index(error: ErrorDetails, row_offset: int) -> ErrorDetails:
     """
-    Put the zero-based CSV row index at the front of the error `loc` tuple.
+    Turn the chunk-local row index at the front of the error `loc` tuple into
+    the zero-based CSV row index.
 
-    Pydantic returns field errors relative to the validated row dict, so
-    `error["loc"]` might be `("age",)`. We rewrite that `loc` value to include
-    the CSV row index so downstream error formatting can report the correct line
-    in the original file.
+    We validate a whole chunk as one list, so Pydantic returns field errors
+    relative to that list and `error["loc"]` might be `(2, "age")`. We rewrite
+    that `loc` value with the chunk's row offset so downstream error formatting
+    can report the correct line in the original file.
 
     Example:
-        `error["loc"] == ("age",)` for the CSV row with zero-based index `7`
+        `error["loc"] == (2, "age")` in a chunk starting at CSV row `5`
         becomes `error["loc"] == (7, "age")`.
     """
+    loc = error["loc"]
     prefixed = dict(error)
-    prefixed["loc"] = (row_index, *tuple(error["loc"]))
+    prefixed["loc"] = (row_offset + cast(int, loc[0]), *loc[1:])
     return cast(ErrorDetails, prefixed)
 
 
-def _iter_row_dicts(chunk) -> Iterable[dict[str, object]]:
-    for row in chunk.itertuples(index=False, name=None):
-        yield dict(zip(chunk.columns, row))
+def _validate_rows(
+    adapter: TypeAdapter[list[Any]],
+    rows: list[dict[str, object]],
+    row_offset: int,
+    row_indices: Sequence[int] | None = None,
+) -> list[ErrorDetails]:
+    """
+    Validate a list of row dicts in one Pydantic call and return its errors
+    with global CSV row indices.
 
+    Handing the whole list to pydantic-core keeps the per-row loop in Rust;
+    we only pay Python overhead for rows that actually fail.
 
-def check_csv_file(
+    `row_indices` gives the chunk-local index of each row when `rows` is only
+    a selection of the chunk.
+    """
+    try:
+        adapter.validate_python(rows)
+    except ValidationError as exc:
+        errors = cast(list[ErrorDetails], exc.errors(include_url=False))
+        if row_indices is not None:
+            for error in errors:
+                loc = error["loc"]
+                error["loc"] = (row_indices[cast(int, loc[0])], *loc[1:])
+        return [_prefix_row_index(error, row_offset) for error in errors]
+    return []
+
+
+def _count_errors(adapter: TypeAdapter[list[Any]], rows: list[dict[str, object]]) -> int:
+    """
+    Validate a list of row dicts in one Pydantic call and only return the
+    number of errors.
+
+    `error_count()` is answered by pydantic-core, so no ErrorDetails dicts are
+    ever built.
+    """
+    try:
+        adapter.validate_python(rows)
+    except ValidationError as exc:
+        return exc.error_count()
+    return 0
+
+
+class _ChunkValidator:
+    """
+    Validate chunks of CSV rows against a model with one of the `ENGINES`:
+
+    - "batch": every row goes through Pydantic, one call per chunk.
+    - "columnar": vectorized column checks compiled from the model pick out
+      the suspicious rows and only those go through Pydantic. Falls back to
+      "batch" for models that can't be compiled (see `compile_model`).
+    - "per-field": each column is validated with its own field validator and
+      every distinct raw value only once (see `compile_field_validators`).
+      Falls back to "batch" for models with field or model validators.
+    """
+
+    def __init__(self, model: type[BaseModel], engine: str = "batch") -> None:
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown validation engine {engine!r} (available: {', '.join(ENGINES)})"
+            )
+        # We build one reusable Pydantic validator for a list of the selected
+        # model and apply it to each chunk of row dicts in turn, instead of
+        # validating row by row or the whole CSV as one big list.
+        self.adapter = TypeAdapter(list[model])
+        # The columnar engines need pandas/NumPy, so we only import them when
+        # they are selected.
+        self.plan = None
+        self.fields = None
+        if engine == "columnar":
+            from datavalgen.columnar import compile_model
+
+            self.plan = compile_model(model)
+        elif engine == "per-field":
+            from datavalgen.per_field import compile_field_validators
+
+            self.fields = compile_field_validators(model)
+
+    def validate(self, chunk: CsvChunk, row_offset: int) -> list[ErrorDetails]:
+        if self.fields is not None:
+            return self.fields.validate(chunk.frame(), row_offset)
+
+        if self.plan is None:
+            return _validate_rows(self.adapter, chunk.row_dicts(), row_offset)
+
+        suspect = self.plan.suspect_rows(chunk.frame()).nonzero()[0].tolist()
+        if not suspect:
+            return []
+        rows = chunk.row_dicts(suspect)
+        return _validate_rows(self.adapter, rows, row_offset, suspect)
+
+    def count(self, chunk: CsvChunk) -> int:
+        """
+        Count the errors in `chunk` without building any error details.
+        """
+        if self.fields is not None:
+            return self.fields.count(chunk.frame())
+
+        if self.plan is None:
+            return _count_errors(self.adapter, chunk.row_dicts())
+
+        suspect = self.plan.suspect_rows(chunk.frame()).nonzero()[0].tolist()
+        if not suspect:
+            return 0
+        return _count_errors(self.adapter, chunk.row_dicts(suspect))
+
+
+@lru_cache(maxsize=16)
+def _chunk_validator(model: type[BaseModel], engine: str) -> _ChunkValidator:
+    """
+    Shared `_ChunkValidator` per model and engine, so validating many files
+    (or byte ranges in one worker process) builds the validators only once.
+    """
+    return _ChunkValidator(model, engine)
+
+
+class _ErrorSample:
+    """
+    Keep exact error counts while only retaining the first `max_errors`
+    problem cells for human-readable output.
+
+    Errors must be added in file order so the sample is deterministic.
+
+    With `stop_after`, the sample stops taking errors once it has seen that
+    many problem cells and sets `stop_reason`.
+    """
+
+    def __init__(self, max_errors: int | None, stop_after: int | None = None) -> None:
+        self.max_errors = max_errors
+        self.stop_after = stop_after
+        # Sample of errors we keep in memory for later formatting/output.
+        self.errors = ErrorStore()
+        # Number of distinct problem cells we have decided to show, e.g.
+        # `(7, "age")`, and the last one of them. All errors for one cell are
+        # reported next to each other, so we never need to look further back.
+        # This is for max_errors
+        self.num_shown_cells = 0
+        self.last_shown_key: tuple[object, ...] | None = None
+        # All problem cells and rows seen, shown or not.
+        self.num_cells = 0
+        self.last_key: tuple[object, ...] | None = None
+        self.num_failing_rows = 0
+        self.last_row: object = None
+        self.num_errors = 0
+        self.truncated = False
+        self.stop_reason: str | None = None
+
+    def _stop(self) -> None:
+        self.stop_reason = (
+            f"Stopped after the first {self.stop_after} problem cells; "
+            "the error count is a lower bound."
+        )
+
+    def add(self, errors: Iterable[ErrorDetails]) -> None:
+        if self.stop_reason is not None:
+            return
+        max_errors = self.max_errors
+        for error in errors:
+            # Example flow for a bad `age` cell on CSV row 7:
+            #   error["loc"] == (7, "age")
+            #   key == (7, "age")
+            key = tuple(error["loc"])
+            if key != self.last_key:
+                if self.stop_after is not None and self.num_cells >= self.stop_after:
+                    self._stop()
+                    return
+                self.num_cells += 1
+                self.last_key = key
+                if key[0] != self.last_row:
+                    self.num_failing_rows += 1
+                    self.last_row = key[0]
+            self.num_errors += 1
+
+            # If we already decided to display this cell, we keep any extra
+            # errors for the same cell so multi-rule failures stay grouped
+            # together in the formatter.
+            if key == self.last_shown_key:
+                self.errors.append(error)
+                continue
+
+            # `max_errors=None` means we keep every problem cell, which is
+            # mostly useful for tests or small files.
+            if max_errors is None or self.num_shown_cells < max_errors:
+                self.num_shown_cells += 1
+                self.last_shown_key = key
+                self.errors.append(error)
+            else:
+                # We still keep counting after we stop storing display
+                # samples so `safe_validate` can return the true total.
+                self.truncated = True
+
+    def add_count(self, num_errors: int) -> None:
+        """
+        Count errors that were never materialized (`max_errors=0`).
+
+        Without error details we can't tell cells apart, so `stop_after`
+        counts errors here.
+        """
+        if self.stop_reason is not None:
+            return
+        self.num_errors += num_errors
+        if num_errors:
+            self.truncated = True
+        if self.stop_after is not None and self.num_errors >= self.stop_after:
+            self._stop()
+
+
+def _free_threaded() -> bool:
+    """
+    True on a free-threaded (no-GIL) CPython build with the GIL disabled.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _iter_chunk_results(
+    chunks: Iterable[CsvChunk],
+    validator: _ChunkValidator,
+    *,
+    count_only: bool = False,
+    threads: int = 1,
+) -> Iterator[tuple[int, Any]]:
+    """
+    Validate each chunk in turn and yield `(num_rows, result)` per chunk, in
+    file order. `result` is the list of errors with global CSV row indices,
+    or only their number with `count_only`.
+
+    With `threads > 1` on a free-threaded build, chunks are validated
+    concurrently by a thread pool sharing `validator`; results are still
+    yielded in file order. With the GIL, threads would only add overhead, so
+    we validate serially.
+
+    Closing the generator stops reading the CSV.
+    """
+    # Each chunk starts its own row index at zero, so we carry a running offset
+    # to keep error locations aligned with the original CSV line numbers.
+    row_offset = 0
+
+    work: Callable[[CsvChunk, int], Any]
+    if count_only:
+        work = lambda chunk, _row_offset: validator.count(chunk)  # noqa: E731
+    else:
+        work = validator.validate
+
+    if threads > 1 and _free_threaded():
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            pending: deque[tuple[int, Future[Any]]] = deque()
+            for chunk in chunks:
+                pending.append((len(chunk), executor.submit(work, chunk, row_offset)))
+                row_offset += len(chunk)
+                # Bound the chunks in flight, oldest result first.
+                if len(pending) >= threads * 2:
+                    num_rows, future = pending.popleft()
+                    yield num_rows, future.result()
+            while pending:
+                num_rows, future = pending.popleft()
+                yield num_rows, future.result()
+        return
+
+    # iterate thru chunks
+    for chunk in chunks:
+        yield len(chunk), work(chunk, row_offset)
+        row_offset += len(chunk)
+
+
+def _check_chunks(
+    chunks: Iterable[CsvChunk],
+    validator: _ChunkValidator,
+    sample: _ErrorSample,
+    threads: int = 1,
+    abort_error_rate: float | None = None,
+) -> int:
+    """
+    Validate each chunk in turn, feeding its errors into `sample`, until the
+    end of the file or until the sample sets a `stop_reason`.
+
+    When the sample keeps no errors at all (`max_errors=0`, e.g. for
+    `safe_validate`) we only count errors and never build error details.
+
+    With `abort_error_rate`, we stop once the first `ABORT_MIN_ROWS` rows (or
+    rather the chunks holding them) have at least that fraction of rows with
+    errors. We can't tell rows apart when only counting, so this is ignored
+    with `max_errors=0`.
+
+    :return: Number of rows validated.
+    """
+    count_only = sample.max_errors == 0
+    record: Callable[[Any], None] = sample.add_count if count_only else sample.add
+    if count_only:
+        abort_error_rate = None
+
+    num_rows = 0
+    results = _iter_chunk_results(
+        chunks, validator, count_only=count_only, threads=threads
+    )
+    for chunk_rows, result in results:
+        record(result)
+        num_rows += chunk_rows
+        # The error density is only checked once, at the start of the file.
+        if abort_error_rate is not None and num_rows >= ABORT_MIN_ROWS:
+            error_rate = sample.num_failing_rows / num_rows
+            if sample.stop_reason is None and error_rate >= abort_error_rate:
+                sample.stop_reason = (
+                    f"Stopped after the first {num_rows} rows because "
+                    f"{error_rate:.0%} of them have errors. This usually points "
+                    "to a problem with the whole file (wrong delimiter, shifted "
+                    "or swapped columns, wrong encoding) rather than to "
+                    "individual bad values; the error count is a lower bound."
+                )
+            abort_error_rate = None
+        if sample.stop_reason is not None:
+            # Stops the reader (thread) too.
+            results.close()
+            break
+    return num_rows
+
+
+@dataclass(frozen=True)
+class _RangeResult:
+    """
+    Validation result for one byte range of a CSV, with row indices relative
+    to the start of the range.
+    """
+
+    errors: ErrorStore
+    num_errors: int
+    truncated: bool
+    num_rows: int
+    stop_reason: str | None
+
+
+def _range_max_errors(max_errors: int | None, stop_after: int | None) -> int | None:
+    """
+    Number of problem cells each byte range keeps. With `stop_after` we keep
+    at least that many, so the merged sample can tell where the whole file
+    reaches it.
+    """
+    if stop_after is not None and max_errors is not None and max_errors > 0:
+        return max(max_errors, stop_after)
+    return max_errors
+
+
+def _check_csv_range(
+    csv_path: str | Path,
+    start: int,
+    end: int,
+    columns: Sequence[str],
+    model: type[BaseModel],
+    chunk_size: ChunkSize,
+    max_errors: int | None,
+    engine: str,
+    reader: str,
+    prefetch: int,
+    threads: int,
+    stop_after: int | None,
+    abort_error_rate: float | None,
+) -> _RangeResult:
+    """
+    Validate the data rows in one byte range of a CSV. Runs in a worker
+    process, so everything it takes and returns must be picklable.
+    """
+    sample = _ErrorSample(_range_max_errors(max_errors, stop_after), stop_after)
+    num_rows = _check_chunks(
+        prefetch_chunks(
+            read_csv_range_chunks(
+                csv_path,
+                start,
+                end,
+                columns=columns,
+                reader=reader,
+                usecols=_model_columns(model),
+                chunksize=chunk_size,
+            ),
+            prefetch,
+        ),
+        _chunk_validator(model, engine),
+        sample,
+        threads,
+        abort_error_rate,
+    )
+    return _RangeResult(
+        errors=sample.errors,
+        num_errors=sample.num_errors,
+        truncated=sample.truncated,
+        num_rows=num_rows,
+        stop_reason=sample.stop_reason,
+    )
+
+
+def _iter_range_results(
+    csv_path: str | Path,
+    ranges: Sequence[tuple[int, int]],
+    columns: Sequence[str],
+    model: type[BaseModel],
+    sample: _ErrorSample,
+    *,
+    chunk_size: ChunkSize,
+    workers: int,
+    engine: str,
+    reader: str,
+    prefetch: int,
+    threads: int,
+    abort_error_rate: float | None,
+    data_start: int,
+) -> Iterator[_RangeResult]:
+    """
+    Validate byte ranges of a CSV, in a process pool with `workers > 1`, and
+    yield their results in order. Closing the generator cancels the ranges
+    that haven't started yet.
+
+    `abort_error_rate` is about the first rows of the file, so it only
+    applies to the range starting at `data_start` (the first data row), as
+    if the file were validated serially.
+    """
+    args = (
+        columns,
+        model,
+        chunk_size,
+        sample.max_errors,
+        engine,
+        reader,
+        prefetch,
+        threads,
+        sample.stop_after,
+    )
+
+    def range_args(start: int, end: int) -> tuple[Any, ...]:
+        abort = abort_error_rate if start == data_start else None
+        return (csv_path, start, end, *args, abort)
+
+    if workers <= 1:
+        for start, end in ranges:
+            yield _check_csv_range(*range_args(start, end))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_check_csv_range, *range_args(start, end))
+            for start, end in ranges
+        ]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _merge_range_result(
+    sample: _ErrorSample, result: _RangeResult, row_offset: int
+) -> None:
+    """
+    Add the result of a byte range starting at CSV row `row_offset` to the
+    sample of the whole file.
+    """
+    sample.add(_prefix_row_index(e, row_offset) for e in result.errors)
+    # The sample only saw the retained errors of this range.
+    sample.add_count(result.num_errors - len(result.errors))
+    sample.truncated = sample.truncated or result.truncated
+    if sample.stop_reason is None:
+        sample.stop_reason = result.stop_reason
+
+
+def _check_csv_parallel(
+    csv_path: str | Path,
+    columns: Sequence[str],
+    model: type[BaseModel],
+    sample: _ErrorSample,
+    *,
+    chunk_size: ChunkSize,
+    workers: int,
+    engine: str,
+    reader: str,
+    prefetch: int,
+    threads: int,
+    abort_error_rate: float | None,
+) -> None:
+    """
+    Validate a CSV in a process pool, one record-aligned byte range per task,
+    and merge the results into `sample` in file order.
+
+    Each range keeps its own first `max_errors` problem cells, so the first
+    `max_errors` cells of the whole file are always among them and the merged
+    sample matches the serial one.
+
+    Once the merged sample stops (`stop_after`) or the first range aborted
+    on its error density, ranges that haven't started yet are cancelled.
+    """
+    # A few ranges per worker keeps the pool busy when some ranges are slower.
+    boundaries = csv_record_boundaries(csv_path, workers * 4)
+    if abort_error_rate is not None and sample.max_errors != 0:
+        # The first range holds all rows the serial scan would look at for
+        # the error density, so it decides just the same.
+        head_rows = ABORT_MIN_ROWS
+        if isinstance(chunk_size, int):
+            head_rows = -(-ABORT_MIN_ROWS // chunk_size) * chunk_size
+        head_end = csv_rows_end(csv_path, head_rows)
+        boundaries = [boundaries[0], *(max(b, head_end) for b in boundaries[1:])]
+    results = _iter_range_results(
+        csv_path,
+        list(zip(boundaries[:-1], boundaries[1:])),
+        columns,
+        model,
+        sample,
+        chunk_size=chunk_size,
+        workers=workers,
+        engine=engine,
+        reader=reader,
+        prefetch=prefetch,
+        threads=threads,
+        abort_error_rate=abort_error_rate,
+        data_start=boundaries[0],
+    )
+
+    row_offset = 0
+    for result in results:
+        _merge_range_result(sample, result, row_offset)
+        if sample.stop_reason is not None:
+            results.close()
+            break
+        row_offset += result.num_rows
+
+
+def _check_csv_cached(
+    csv_path: str | Path,
+    columns: Sequence[str],
+    model: type[BaseModel],
+    sample: _ErrorSample,
+    cache_path: str | Path,
+    *,
+    chunk_size: ChunkSize,
+    workers: int,
+    engine: str,
+    reader: str,
+    prefetch: int,
+    threads: int,
+    abort_error_rate: float | None,
+) -> None:
+    """
+    Validate a CSV block by block, reusing the results of blocks that are
+    unchanged since the last run (see `datavalgen.cache`), and merge the
+    results into `sample` in file order.
+
+    Changed blocks are validated like the byte ranges of
+    `_check_csv_parallel`, in a process pool with `workers > 1`.
+    """
+    from datavalgen.cache import (
+        CACHE_BLOCK_SIZE,
+        CachedBlock,
+        ValidationCache,
+        model_identity,
+    )
+
+    cache = ValidationCache(cache_path, f"{model_identity(model)}\n{list(columns)!r}")
+    blocks = cache.blocks(csv_path, CACHE_BLOCK_SIZE)
+    max_errors = _range_max_errors(sample.max_errors, sample.stop_after)
+    hits = [cache.get(digest, max_errors) for _start, _end, digest in blocks]
+
+    fresh = _iter_range_results(
+        csv_path,
+        [(start, end) for (start, end, _), hit in zip(blocks, hits) if hit is None],
+        columns,
+        model,
+        sample,
+        chunk_size=chunk_size,
+        workers=workers,
+        engine=engine,
+        reader=reader,
+        prefetch=prefetch,
+        threads=threads,
+        abort_error_rate=abort_error_rate,
+        data_start=blocks[0][0] if blocks else 0,
+    )
+
+    row_offset = 0
+    for (_start, _end, digest), hit in zip(blocks, hits):
+        if hit is None:
+            result = next(fresh)
+            # Blocks that stopped early don't have a complete result.
+            if result.stop_reason is None:
+                cache.put(
+                    digest,
+                    CachedBlock(
+                        num_rows=result.num_rows,
+                        num_errors=result.num_errors,
+                        truncated=result.truncated,
+                        errors=result.errors,
+                        max_errors=max_errors,
+                    ),
+                )
+        else:
+            result = _RangeResult(
+                errors=hit.errors,
+                num_errors=hit.num_errors,
+                truncated=hit.truncated,
+                num_rows=hit.num_rows,
+                stop_reason=None,
+            )
+        _merge_range_result(sample, result, row_offset)
+        if sample.stop_reason is not None:
+            break
+        row_offset += result.num_rows
+
+    fresh.close()
+    cache.save()
+
+
+def _check_csv_checkpointed(
+    csv_path: str | Path,
+    columns: Sequence[str],
+    model: type[BaseModel],
+    sample: _ErrorSample,
+    checkpoint_path: str | Path,
+    *,
+    chunk_size: ChunkSize,
+    workers: int,
+    engine: str,
+    reader: str,
+    prefetch: int,
+    threads: int,
+    abort_error_rate: float | None,
+) -> None:
+    """
+    Count the errors of a CSV block by block, resuming after the last block
+    of an interrupted run, and save a checkpoint after every block (see
+    `datavalgen.checkpoint`).
+
+    Blocks are validated like the byte ranges of `_check_csv_parallel`, in a
+    process pool with `workers > 1`.
+    """
+    from datavalgen.checkpoint import (
+        CHECKPOINT_BLOCK_SIZE,
+        Checkpoint,
+        ValidationCheckpoint,
+        checkpoint_fingerprint,
+    )
+
+    checkpoint = ValidationCheckpoint(
+        checkpoint_path, checkpoint_fingerprint(csv_path, model, columns)
+    )
+    resumed = checkpoint.load() or Checkpoint()
+    boundaries = csv_block_boundaries(csv_path, CHECKPOINT_BLOCK_SIZE)
+    start = max(boundaries[0], resumed.offset)
+    ends = [end for end in boundaries[1:] if end > start]
+    ranges = list(zip([start, *ends[:-1]], ends))
+
+    sample.add_count(resumed.num_errors)
+    if sample.stop_reason is not None:
+        return
+    results = _iter_range_results(
+        csv_path,
+        ranges,
+        columns,
+        model,
+        sample,
+        chunk_size=chunk_size,
+        workers=workers,
+        engine=engine,
+        reader=reader,
+        prefetch=prefetch,
+        threads=threads,
+        abort_error_rate=abort_error_rate,
+        data_start=boundaries[0],
+    )
+
+    row_offset = resumed.row_offset
+    for (_start, end), result in zip(ranges, results):
+        _merge_range_result(sample, result, row_offset)
+        if sample.stop_reason is not None:
+            results.close()
+            break
+        row_offset += result.num_rows
+        checkpoint.save(
+            Checkpoint(offset=end, row_offset=row_offset, num_errors=sample.num_errors)
+        )
+
+
+def _check_csv_sample(
+    csv_path: str | Path,
+    columns: Sequence[str],
+    model: type[BaseModel],
+    *,
+    num_rows: int,
+    seed: int | None,
+    chunk_size: ChunkSize,
+    engine: str,
+    reader: str,
+    start: int = 0,
+) -> tuple[ErrorRateEstimate, int]:
+    """
+    Validate a random sample of about `num_rows` rows of a CSV, starting at
+    byte offset `start`.
+
+    We don't know the line numbers of the sampled rows, so we only keep what
+    we need for the estimate. Rows with the wrong number of fields count as
+    one error each.
+
+    :return: The error rate estimate and the number of errors found.
+    """
+    sample = sample_csv_records(
+        csv_path, num_rows, num_columns=len(columns), seed=seed, start=start
+    )
+    chunks = read_csv_chunks(
+        io.BytesIO(b"".join(sample.records)),
+        reader=reader,
+        names=columns,
+        usecols=_model_columns(model),
+        chunksize=chunk_size,
+    )
+    # `loc` starts with the index of the row in the sample.
+    errors = [
+        error
+        for _num_rows, chunk_errors in _iter_chunk_results(
+            chunks, _chunk_validator(model, engine)
+        )
+        for error in chunk_errors
+    ]
+    estimate = estimate_error_rate(
+        errors,
+        sample.num_rows,
+        _model_columns(model),
+        num_malformed=sample.num_malformed,
+    )
+    return estimate, len(errors) + sample.num_malformed
+
+
+def iter_csv_errors(
     csv_path: str | Path,
     model: type[BaseModel],
     *,
     chunk_size: int = 5000,
+    engine: str = "batch",
+    reader: str = "pandas",
+    prefetch: int = 0,
+    threads: int = 1,
+) -> Iterator[ErrorDetails]:
+    """
+    Yield the validation errors of a CSV file while it is being scanned.
+
+    Errors come in file order, with `loc` starting at the zero-based CSV row
+    index like the errors of `check_csv_file`. The first errors are available
+    as soon as the chunk holding them is validated, so callers can stop after
+    the first hit or forward errors elsewhere without keeping them all in
+    memory. Closing the generator (or just dropping it) stops the scan.
+
+    `chunk_size`, `engine`, `reader`, `prefetch` and `threads` work as for
+    `check_csv_file`. There is no `workers` option: byte ranges validated in
+    worker processes only report back once they are done.
+
+    :raises ValueError: if the CSV lacks some of the model's columns.
+    """
+    columns = read_csv_columns(csv_path, reader)
+    column_check = check_column_names(columns, model)
+    if column_check.errors:
+        raise ValueError("\n".join(column_check.errors))
+
+    results = _iter_chunk_results(
+        prefetch_chunks(
+            read_csv_chunks(
+                csv_path,
+                reader=reader,
+                usecols=_model_columns(model),
+                chunksize=chunk_size,
+            ),
+            prefetch,
+        ),
+        _chunk_validator(model, engine),
+        threads=threads,
+    )
+    for _num_rows, errors in results:
+        yield from errors
+
+
+def check_csv_file(
+    csv_path: str | Path,
+    model: type[BaseModel],
+    *,
+    chunk_size: ChunkSize = 5000,
     max_errors: int | None = 10,
+    workers: int = 1,
+    engine: str = "batch",
+    reader: str = "pandas",
+    prefetch: int = 0,
+    threads: int = 1,
+    stop_after: int | None = None,
+    abort_error_rate: float | None = None,
+    cache: str | Path | None = None,
+    sample_rows: int | None = None,
+    sample_head: bool = False,
+    sample_seed: int | None = None,
+    memory_budget: int | None = None,
+    checkpoint: str | Path | None = None,
 ) -> CsvCheckResult:
     """
     Validate a CSV file chunk-by-chunk to keep memory bounded.
 
-    We keep the current parsing semantics by still using pandas with
-    `dtype=str`, `keep_default_na=False`, and `na_filter=False`, but we no
-    longer materialize the whole file or convert it to one giant list of dicts.
+    Every reader backend (`reader`, see `CSV_READERS`) keeps the pandas
+    parsing semantics of `dtype=str`, `keep_default_na=False`, and
+    `na_filter=False`, but we never materialize the whole file or convert it
+    to one giant list of dicts.
+
+    With `workers > 1` the file is split into byte ranges on record boundaries
+    that are validated in a process pool. Counts, row indices and the sampled
+    errors are the same as for a serial run.
+
+    `engine` selects how chunks are validated, see `ENGINES`. All engines
+    report the same errors.
+
+    With `prefetch > 0` a reader thread parses up to that many chunks ahead
+    while the current one is validated, so parsing and validation overlap.
+
+    With `threads > 1` on a free-threaded (no-GIL) Python build, chunks are
+    validated concurrently in a thread pool sharing one validator, without
+    the pickling and memory cost of `workers`. On a regular build this falls
+    back to serial validation, so the same call works everywhere.
+
+    The scan stops early, with `stop_reason` set on the result and
+    `num_errors` only a lower bound, after `stop_after` problem cells (1 to
+    stop at the first error) or when at least `abort_error_rate` of the
+    first `ABORT_MIN_ROWS` rows have errors, which hints at a problem with
+    the whole file. With `workers > 1` the first byte range holds these rows,
+    so the decision is the same as for a serial scan.
+
+    With `cache`, the path of a sidecar file, results are cached per block of
+    the file and a re-run only validates the blocks that changed, see
+    `datavalgen.cache`. The sidecar holds the sampled errors, i.e. data
+    values.
+
+    With `sample_rows`, only a random sample of about that many rows is
+    validated, read by seeking to random byte offsets (see
+    `datavalgen.sampling`), and the result has an `estimate` of the error
+    rate of the whole file. With `sample_head` the first chunk is validated
+    too and left out of the sample; its errors are the only ones kept in
+    `errors`, as the line numbers of sampled rows are unknown. `num_errors`
+    counts the errors found in both, plus one for every sampled row with the
+    wrong number of fields, and is a lower bound. `workers`, `cache`, `stop_after` and
+    `abort_error_rate` don't apply to samples.
+
+    With `memory_budget`, in bytes, `chunk_size` is ignored: chunks are
+    sized from the measured bytes per row so that the chunks in flight fit in
+    the budget, see `datavalgen.memory.AdaptiveChunkSize`. With `workers > 1`
+    every worker gets an equal share of it.
+
+    With `checkpoint`, the path of a checkpoint file, errors are counted
+    block by block and how far we got is saved after every block, so an
+    interrupted run started again resumes there with the same final count
+    (see `datavalgen.checkpoint`). Checkpoints hold no data values, so this
+    needs `max_errors=0`, and it doesn't combine with `cache` or
+    `sample_rows`.
+
+    Compressed files (gzip, bz2, xz, zstd) are decompressed on the fly in a
+    feeder thread, see `datavalgen.read_csv.open_csv_stream`. They can't be
+    split into byte ranges, so they are validated serially whatever
+    `workers` is, and `cache`, `sample_rows` and `checkpoint` raise a
+    ValueError.
     """
-    columns = read_csv_columns(csv_path)
+    if csv_compression(csv_path) is not None:
+        if cache is not None or sample_rows is not None or checkpoint is not None:
+            raise ValueError(
+                f"{str(csv_path)!r} is compressed; caching, sampling and "
+                "checkpoints need an uncompressed CSV file"
+            )
+        workers = 1
+    if checkpoint is not None and (
+        max_errors != 0 or cache is not None or sample_rows is not None
+    ):
+        raise ValueError(
+            "checkpoint needs max_errors=0 and doesn't work with cache or "
+            "sample_rows"
+        )
+
+    if memory_budget is not None:
+        from datavalgen.memory import AdaptiveChunkSize
+
+        # Chunks being validated by every thread plus the prefetched ones.
+        chunk_size = AdaptiveChunkSize(
+            memory_budget // max(workers, 1), in_flight=max(threads, 1) + prefetch
+        )
+
+    columns = read_csv_columns(csv_path, reader)
     column_check = check_column_names(columns, model)
     # We fail fast on header mismatches before starting the chunk loop. Row-wise
     # validation only makes sense once we know the expected model columns exist.
@@ -104,75 +1008,315 @@ def check_csv_file(
             num_errors=len(column_check.errors),
         )
 
-    model_columns = _model_columns(model)
-    # We build one reusable Pydantic validator for the selected model and apply
-    # it to each row dict in turn, instead of validating the whole CSV as one
-    # big list.
-    adapter = TypeAdapter(model)
-
     # We keep exact counts for the whole file, but we only retain a bounded
     # sample of problem cells for human-readable output.
-    # Sample of errors we keep in memory for later formatting/output.
-    stored_errors: list[ErrorDetails] = []
-    # Distinct problem cells we have decided to show, e.g. `(7, "age")`.
-    # This is for max_errors
-    shown_problem_keys: set[tuple[object, ...]] = set()
-    num_errors = 0
-    truncated = False
-    # Each chunk starts its own row index at zero, so we carry a running offset
-    # to keep error locations aligned with the original CSV line numbers.
-    row_offset = 0
+    sample = _ErrorSample(max_errors, stop_after)
 
-    # iterate thru chunks
-    for chunk in iter_csv_chunks(
-        csv_path, usecols=model_columns, chunksize=chunk_size
-    ):
-        # iterate thru rows in a chunck
-        for chunk_index, row_dict in enumerate(_iter_row_dicts(chunk)):
-            global_row_index = row_offset + chunk_index
-            try:
-                adapter.validate_python(row_dict)
-            except ValidationError as exc:
-                row_errors = cast(
-                    tuple[ErrorDetails, ...], tuple(exc.errors(include_url=False))
-                )
-                num_errors += len(row_errors)
-
-                for error in row_errors:
-                    # Example flow for a bad `age` cell on CSV row 7:
-                    #   error["loc"] == ("age",)
-                    #   prefixed["loc"] == (7, "age")
-                    #   key == (7, "age")
-                    prefixed = _prefix_row_index(error, global_row_index)
-                    # `prefixed["loc"]` should already be a tuple here.
-                    key = prefixed["loc"]
-                    # `max_errors=None` means we keep every problem cell, which is
-                    # mostly useful for tests or small files.
-                    if max_errors is None:
-                        shown_problem_keys.add(key)
-                        stored_errors.append(prefixed)
-                        continue
-
-                    # If we already decided to display this cell, we keep any
-                    # extra errors for the same cell so multi-rule failures stay
-                    # grouped together in the formatter.
-                    if key in shown_problem_keys:
-                        stored_errors.append(prefixed)
-                        continue
-
-                    if len(shown_problem_keys) < max_errors:
-                        shown_problem_keys.add(key)
-                        stored_errors.append(prefixed)
-                    else:
-                        # We still keep counting after we stop storing display
-                        # samples so `safe_validate` can return the true total.
-                        truncated = True
+    if sample_rows is not None:
+        head_rows = 0
+        if sample_head:
+            head_rows = _check_chunks(
+                islice(
+                    read_csv_chunks(
+                        csv_path,
+                        reader=reader,
+                        usecols=_model_columns(model),
+                        chunksize=chunk_size,
+                    ),
+                    1,
+                ),
+                _chunk_validator(model, engine),
+                sample,
+            )
+        estimate, num_sampled_errors = _check_csv_sample(
+            csv_path,
+            columns,
+            model,
+            num_rows=sample_rows,
+            seed=sample_seed,
+            chunk_size=chunk_size,
+            engine=engine,
+            reader=reader,
+            # Leave out the rows of the first chunk, their errors are counted.
+            start=csv_rows_end(csv_path, head_rows) if head_rows else 0,
+        )
+        first_chunk = " and the first chunk" if sample_head else ""
+        return CsvCheckResult(
+            errors=sample.errors,
+            warnings=column_check.warnings,
+            num_errors=sample.num_errors + num_sampled_errors,
+            truncated=sample.truncated,
+            stop_reason=(
+                f"Only validated {estimate.num_rows} sampled rows{first_chunk}; "
+                "the error count is a lower bound."
+            ),
+            estimate=estimate,
+        )
 
-        row_offset += len(chunk)
+    if cache is not None:
+        _check_csv_cached(
+            csv_path,
+            columns,
+            model,
+            sample,
+            cache,
+            chunk_size=chunk_size,
+            workers=workers,
+            engine=engine,
+            reader=reader,
+            prefetch=prefetch,
+            threads=threads,
+            abort_error_rate=abort_error_rate,
+        )
+    elif checkpoint is not None:
+        _check_csv_checkpointed(
+            csv_path,
+            columns,
+            model,
+            sample,
+            checkpoint,
+            chunk_size=chunk_size,
+            workers=workers,
+            engine=engine,
+            reader=reader,
+            prefetch=prefetch,
+            threads=threads,
+            abort_error_rate=abort_error_rate,
+        )
+    elif workers > 1:
+        _check_csv_parallel(
+            csv_path,
+            columns,
+            model,
+            sample,
+            chunk_size=chunk_size,
+            workers=workers,
+            engine=engine,
+            reader=reader,
+            prefetch=prefetch,
+            threads=threads,
+            abort_error_rate=abort_error_rate,
+        )
+    else:
+        _check_chunks(
+            prefetch_chunks(
+                read_csv_chunks(
+                    csv_path,
+                    reader=reader,
+                    usecols=_model_columns(model),
+                    chunksize=chunk_size,
+                ),
+                prefetch,
+            ),
+            _chunk_validator(model, engine),
+            sample,
+            threads,
+            abort_error_rate,
+        )
 
     return CsvCheckResult(
-        errors=tuple(stored_errors),
+        errors=sample.errors,
         warnings=column_check.warnings,
-        num_errors=num_errors,
-        truncated=truncated,
+        num_errors=sample.num_errors,
+        truncated=sample.truncated,
+        stop_reason=sample.stop_reason,
+    )
+
+
+def check_csv_rows(
+    csv_path: str | Path,
+    model: type[BaseModel],
+    start_row: int,
+    stop_row: int,
+    *,
+    index: RowIndex | None = None,
+    chunk_size: int = 5000,
+    max_errors: int | None = 10,
+    engine: str = "batch",
+    reader: str = "pandas",
+) -> CsvCheckResult:
+    """
+    Validate only the data rows `start_row` up to (not including) `stop_row`
+    of a CSV file, e.g. to recheck rows after fixing them.
+
+    The rows are found with a row index (see `datavalgen.row_index`), loaded
+    from next to the file or built and saved there when `index` is None, and
+    read from a memory map, so this takes time in the number of rows and not
+    in their position in the file. Errors keep the row indices of the whole
+    file; map them to lines with `index.line_number`.
+    """
+    from datavalgen.row_index import get_row_index, read_row_chunks
+
+    columns = read_csv_columns(csv_path, reader)
+    column_check = check_column_names(columns, model)
+    if column_check.errors:
+        return CsvCheckResult(
+            warnings=column_check.warnings,
+            num_errors=len(column_check.errors),
+        )
+
+    if index is None:
+        index = get_row_index(csv_path)
+    range_sample = _ErrorSample(max_errors)
+    num_rows = _check_chunks(
+        read_row_chunks(
+            csv_path,
+            index,
+            start_row,
+            stop_row,
+            columns=columns,
+            reader=reader,
+            usecols=_model_columns(model),
+            chunksize=chunk_size,
+        ),
+        _chunk_validator(model, engine),
+        range_sample,
+    )
+    sample = _ErrorSample(max_errors)
+    _merge_range_result(
+        sample,
+        _RangeResult(
+            errors=range_sample.errors,
+            num_errors=range_sample.num_errors,
+            truncated=range_sample.truncated,
+            num_rows=num_rows,
+            stop_reason=None,
+        ),
+        max(start_row, 0),
+    )
+    return CsvCheckResult(
+        errors=sample.errors,
+        warnings=column_check.warnings,
+        num_errors=sample.num_errors,
+        truncated=sample.truncated,
+    )
+
+
+def check_table_file(
+    path: str | Path,
+    model: type[BaseModel],
+    *,
+    chunk_size: int = 5000,
+    max_errors: int | None = 10,
+    engine: str = "batch",
+    threads: int = 1,
+    stop_after: int | None = None,
+) -> CsvCheckResult:
+    """
+    Validate a Parquet or Arrow IPC (Feather v2) file chunk-by-chunk, like
+    `check_csv_file` does for CSV files.
+
+    Only the model's columns are read, Parquet files row group by row group.
+    Columns are typed, so pydantic gets Python values (ints, dates, ...)
+    instead of strings and validates them in its usual lax mode. Errors have
+    the same zero-based row indices as a CSV of the same rows.
+
+    `engine` is "batch" or "per-field"; the "columnar" checks only work on
+    the raw strings of a CSV. Needs pyarrow.
+    """
+    from datavalgen.read_table import read_table_chunks, read_table_columns
+
+    if engine == "columnar":
+        raise ValueError(
+            "The 'columnar' engine only works on CSV files, use 'batch' or "
+            "'per-field' for Parquet and Arrow files"
+        )
+
+    column_check = check_column_names(read_table_columns(path), model)
+    if column_check.errors:
+        return CsvCheckResult(
+            warnings=column_check.warnings,
+            num_errors=len(column_check.errors),
+        )
+
+    sample = _ErrorSample(max_errors, stop_after)
+    _check_chunks(
+        read_table_chunks(path, usecols=_model_columns(model), chunksize=chunk_size),
+        _chunk_validator(model, engine),
+        sample,
+        threads,
+    )
+    return CsvCheckResult(
+        errors=sample.errors,
+        warnings=column_check.warnings,
+        num_errors=sample.num_errors,
+        truncated=sample.truncated,
+        stop_reason=sample.stop_reason,
+    )
+
+
+def _check_csv_file_job(
+    csv_path: Path, model: type[BaseModel], options: dict[str, Any]
+) -> CsvCheckResult:
+    return check_csv_file(csv_path, model, **options)
+
+
+def check_csv_files(
+    csv_paths: Sequence[str | Path],
+    model: type[BaseModel],
+    *,
+    workers: int = 1,
+    use_cache: bool = False,
+    checkpoint_dir: str | Path | None = None,
+    **options: Any,
+) -> list[CsvCheckResult]:
+    """
+    Validate several CSV files against one model, e.g. monthly partitions.
+
+    With `workers > 1` the files are validated in a process pool, one file
+    per task and the largest files first, so a big file at the end of the
+    list doesn't keep the pool waiting. A single file is split over the
+    workers instead, like `check_csv_file(..., workers=workers)` does. A
+    `memory_budget` is shared by the files validated at the same time.
+
+    With `use_cache`, each file gets its own cache next to it (see
+    `datavalgen.cache.default_cache_path`); compressed files are not cached.
+
+    With `checkpoint_dir`, each file gets a checkpoint named after its index
+    in `csv_paths` in that directory, see `check_csv_file(checkpoint=...)`;
+    compressed files are not checkpointed.
+
+    Other keyword arguments are passed to `check_csv_file`.
+
+    :return: One result per file, in the order of `csv_paths`.
+    """
+    paths = [Path(csv_path) for csv_path in csv_paths]
+
+    def file_options(index: int) -> dict[str, Any]:
+        path = paths[index]
+        # Compressed files can't be cached or checkpointed, they are
+        # validated as a whole.
+        if csv_compression(path) is not None:
+            return options
+        extra: dict[str, Any] = {}
+        if use_cache:
+            from datavalgen.cache import default_cache_path
+
+            extra["cache"] = default_cache_path(path)
+        if checkpoint_dir is not None:
+            extra["checkpoint"] = Path(checkpoint_dir) / f"{index}.json"
+        return {**options, **extra}
+
+    if workers <= 1 or len(paths) <= 1:
+        return [
+            check_csv_file(path, model, workers=workers, **file_options(index))
+            for index, path in enumerate(paths)
+        ]
+
+    if options.get("memory_budget") is not None:
+        # Every process validates one file with its own chunks.
+        options = {
+            **options,
+            "memory_budget": options["memory_budget"] // min(workers, len(paths)),
+        }
+    largest_first = sorted(
+        range(len(paths)), key=lambda index: os.path.getsize(paths[index]), reverse=True
     )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            index: executor.submit(
+                _check_csv_file_job, paths[index], model, file_options(index)
+            )
+            for index in largest_first
+        }
+        return [futures[index].result() for index in range(len(paths))]
@@ -0,0 +1,161 @@
+"""
+Write generated data to CSV or Parquet one chunk at a time.
+
+Writing a whole DataFrame at once needs all rows in memory, which limits
+generated files to what fits in RAM. These writers take the rows chunk by
+chunk instead: CSV chunks are appended under a single header, Parquet chunks
+become row groups of one file written by a persistent `ParquetWriter`.
+
+Parquet needs pyarrow, which is an optional dependency.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "WRITE_FORMATS",
+    "TableWriter",
+    "open_table_writer",
+]
+
+WRITE_FORMATS = ("csv", "parquet")
+
+# Parquet chunks held back while some columns are all null, waiting for a
+# chunk that gives them a type.
+_MAX_PENDING_CHUNKS = 8
+
+
+class TableWriter(ABC):
+    """
+    Writes DataFrames with the same columns to one file, in order.
+
+    Use as a context manager, or call `close` when done.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.num_rows = 0
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Append the rows of `df` to the file.
+        """
+        self._write(df)
+        self.num_rows += len(df)
+
+    @abstractmethod
+    def _write(self, df: pd.DataFrame) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Finish the file.
+        """
+
+    def __enter__(self) -> TableWriter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _CsvWriter(TableWriter):
+    def __init__(self, path: str | Path) -> None:
+        super().__init__(path)
+        self._fp: IO[str] = open(self.path, "w", encoding="utf-8", newline="")
+        self._header = True
+
+    def _write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._fp, index=False, header=self._header)
+        self._header = False
+
+    def close(self) -> None:
+        self._fp.close()
+
+
+class _ParquetWriter(TableWriter):
+    def __init__(self, path: str | Path) -> None:
+        super().__init__(path)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Writing Parquet files needs 'pyarrow'.") from exc
+        self._pa = pa
+        self._pq = pq
+        self._writer: Any = None
+        self._pending: list[Any] = []
+
+    def _write(self, df: pd.DataFrame) -> None:
+        table = self._pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is not None:
+            if table.schema != self._writer.schema:
+                # e.g. an int column without Nones in this chunk but with
+                # Nones (so float) in the first one.
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+            return
+
+        # The first chunks fix the schema of the file. A column with only
+        # Nones has type null, which no later value can be cast to, so we
+        # wait for a chunk with values for it.
+        self._pending.append(table)
+        schema = self._pending_schema()
+        if not self._null_fields(schema):
+            self._open(schema)
+        elif len(self._pending) >= _MAX_PENDING_CHUNKS:
+            # Still no values, strings are what most types are dumped as.
+            self._open(self._with_type(schema, self._null_fields(schema)))
+
+    def _pending_schema(self) -> Any:
+        return self._pa.unify_schemas(
+            [table.schema for table in self._pending], promote_options="permissive"
+        )
+
+    def _null_fields(self, schema: Any) -> list[str]:
+        return [field.name for field in schema if self._pa.types.is_null(field.type)]
+
+    def _with_type(self, schema: Any, names: list[str]) -> Any:
+        return self._pa.schema(
+            [
+                field.with_type(self._pa.string()) if field.name in names else field
+                for field in schema
+            ],
+            metadata=schema.metadata,
+        )
+
+    def _open(self, schema: Any) -> None:
+        self._writer = self._pq.ParquetWriter(self.path, schema)
+        for table in self._pending:
+            self._writer.write_table(table.cast(schema))
+        self._pending = []
+
+    def close(self) -> None:
+        if self._writer is None and self._pending:
+            # Columns without any value stay null.
+            self._open(self._pending_schema())
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_table_writer(path: str | Path, file_format: str) -> TableWriter:
+    """
+    Open a writer for a "csv" or "parquet" file at `path`, replacing any
+    existing file.
+
+    :raises ValueError: for other formats.
+    :raises ImportError: for Parquet without pyarrow.
+    """
+    if file_format == "csv":
+        return _CsvWriter(path)
+    if file_format == "parquet":
+        return _ParquetWriter(path)
+    raise ValueError(
+        f"Unknown format {file_format!r}, expected one of {', '.join(WRITE_FORMATS)}"
+    )
@@ -0,0 +1,45 @@
+import pytest
+
+
+class Preempted(Exception):
+    pass
+
+
+def csv_rows(first: int, last: int) -> str:
+    """
+    Data rows `first` to `last` for `SimpleModel`, every fifth with an age
+    error.
+    """
+    lines = []
+    for i in range(first, last + 1):
+        age = 200 if i % 5 == 0 else 30
+        lines.append(f"{i},{age},1990-01-01\n")
+    return "".join(lines)
+
+
+@pytest.fixture
+def validated_ranges(monkeypatch, block_size_setting):
+    """
+    Record the byte ranges validated, with the block size at
+    `block_size_setting` (overridden per test module, e.g.
+    "datavalgen.cache.CACHE_BLOCK_SIZE") set to 64 bytes, and fail the range
+    after `validated_ranges.fail_after` ranges if set.
+    """
+    import datavalgen.validate as validate_module
+
+    monkeypatch.setattr(block_size_setting, 64)
+    original = validate_module._check_csv_range
+
+    class Ranges(list):
+        fail_after = None
+
+    ranges = Ranges()
+
+    def check_csv_range(csv_path, start, end, *args):
+        if ranges.fail_after is not None and len(ranges) >= ranges.fail_after:
+            raise Preempted
+        ranges.append((start, end))
+        return original(csv_path, start, end, *args)
+
+    monkeypatch.setattr(validate_module, "_check_csv_range", check_csv_range)
+    return ranges
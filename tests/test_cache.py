@@ -0,0 +1,128 @@
+import json
+import pickle
+
+import pytest
+
+from datavalgen.cache import default_cache_path
+from datavalgen.read_csv import csv_block_boundaries
+from datavalgen.validate import check_csv_file
+from .conftest import csv_rows
+from .test_validate import OrderedAgeModel, SimpleModel
+
+
+@pytest.fixture
+def block_size_setting():
+    return "datavalgen.cache.CACHE_BLOCK_SIZE"
+
+
+def test_csv_block_boundaries_depend_only_on_preceding_bytes(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 20), encoding="utf-8")
+    before = csv_block_boundaries(csv_path, 64)
+
+    with open(csv_path, "a", encoding="utf-8") as fp:
+        fp.write(csv_rows(21, 40))
+    after = csv_block_boundaries(csv_path, 64)
+
+    assert before[0] == len("id,age,birthday\n")
+    assert after[: len(before) - 1] == before[:-1]
+    assert after[-1] == csv_path.stat().st_size
+
+
+def test_cached_check_matches_and_skips_unchanged_file(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 40), encoding="utf-8")
+    cache_path = default_cache_path(csv_path)
+
+    expected = check_csv_file(csv_path, SimpleModel, max_errors=3)
+    first = check_csv_file(csv_path, SimpleModel, max_errors=3, cache=cache_path)
+    num_blocks = len(validated_ranges)
+    second = check_csv_file(csv_path, SimpleModel, max_errors=3, cache=cache_path)
+
+    assert num_blocks > 1
+    assert len(validated_ranges) == num_blocks
+    for result in (first, second):
+        assert result.errors == expected.errors
+        assert result.num_errors == expected.num_errors == 8
+        assert result.truncated is expected.truncated is True
+
+
+def test_cached_check_only_revalidates_changed_blocks(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 40), encoding="utf-8")
+    cache_path = tmp_path / "cache"
+    check_csv_file(csv_path, SimpleModel, cache=cache_path)
+    num_blocks = len(validated_ranges)
+
+    # Fix a row in the first block (same length) and append new rows.
+    text = csv_path.read_text(encoding="utf-8").replace("\n5,200,", "\n5,020,")
+    csv_path.write_text(text + csv_rows(41, 45), encoding="utf-8")
+    validated_ranges.clear()
+    result = check_csv_file(csv_path, SimpleModel, cache=cache_path)
+
+    assert 0 < len(validated_ranges) < num_blocks
+    assert result.errors == check_csv_file(csv_path, SimpleModel).errors
+    assert result.num_errors == 8
+
+
+def test_cached_check_ignores_results_for_another_model(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 40), encoding="utf-8")
+    cache_path = tmp_path / "cache"
+    check_csv_file(csv_path, SimpleModel, cache=cache_path)
+    validated_ranges.clear()
+
+    result = check_csv_file(
+        csv_path, OrderedAgeModel, max_errors=None, cache=cache_path
+    )
+
+    expected = check_csv_file(csv_path, OrderedAgeModel, max_errors=None)
+    assert validated_ranges
+    assert [(e["loc"], e["msg"]) for e in result.errors] == [
+        (e["loc"], e["msg"]) for e in expected.errors
+    ]
+
+
+def test_cached_check_revalidates_when_more_errors_are_wanted(
+    tmp_path, validated_ranges
+):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n" + "1,200,1990-01-01\n" * 10, encoding="utf-8"
+    )
+    cache_path = tmp_path / "cache"
+    check_csv_file(csv_path, SimpleModel, max_errors=1, cache=cache_path)
+    validated_ranges.clear()
+
+    result = check_csv_file(csv_path, SimpleModel, max_errors=None, cache=cache_path)
+
+    assert validated_ranges
+    assert len(result.errors) == result.num_errors == 10
+
+
+def test_cache_is_json_and_ignores_pickled_sidecars(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 20), encoding="utf-8")
+    cache_path = tmp_path / "cache"
+    cache_path.write_bytes(pickle.dumps({"format": 1}))
+
+    with pytest.warns(RuntimeWarning, match="unreadable validation cache"):
+        first = check_csv_file(csv_path, SimpleModel, cache=cache_path)
+    json.loads(cache_path.read_text(encoding="utf-8"))
+    validated_ranges.clear()
+    second = check_csv_file(csv_path, SimpleModel, cache=cache_path)
+
+    assert not validated_ranges
+    assert second.errors == first.errors
+
+
+def test_cached_check_reads_blocks_of_short_rows(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    rows = "".join(f"{i},30\n" for i in range(1, 31))
+    csv_path.write_text("id,age,birthday\n" + rows, encoding="utf-8")
+
+    result = check_csv_file(csv_path, SimpleModel, cache=tmp_path / "cache")
+
+    assert len(validated_ranges) > 1
+    assert result == check_csv_file(csv_path, SimpleModel)
+    assert result.num_errors == 30
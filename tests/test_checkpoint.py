@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from datavalgen.validate import check_csv_file
+from .conftest import Preempted, csv_rows
+from .test_validate import SimpleModel
+
+
+@pytest.fixture
+def block_size_setting():
+    return "datavalgen.checkpoint.CHECKPOINT_BLOCK_SIZE"
+
+
+def test_checkpointed_check_resumes_with_the_same_count(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 40), encoding="utf-8")
+    checkpoint_path = tmp_path / "checkpoints" / "0.json"
+    expected = check_csv_file(csv_path, SimpleModel, max_errors=0)
+    validated_ranges.clear()
+
+    validated_ranges.fail_after = 3
+    with pytest.raises(Preempted):
+        check_csv_file(
+            csv_path, SimpleModel, max_errors=0, checkpoint=checkpoint_path
+        )
+    state = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    # Offsets and counts only, no data values.
+    assert set(state) == {
+        "format",
+        "fingerprint",
+        "offset",
+        "row_offset",
+        "num_errors",
+    }
+    assert state["offset"] == validated_ranges[2][1]
+
+    validated_ranges.fail_after = None
+    validated_ranges.clear()
+    result = check_csv_file(
+        csv_path, SimpleModel, max_errors=0, checkpoint=checkpoint_path
+    )
+
+    assert validated_ranges[0][0] == state["offset"]
+    assert result.num_errors == expected.num_errors == 8
+
+
+def test_checkpoint_is_ignored_when_the_file_changes(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 40), encoding="utf-8")
+    checkpoint_path = tmp_path / "0.json"
+    validated_ranges.fail_after = 3
+    with pytest.raises(Preempted):
+        check_csv_file(
+            csv_path, SimpleModel, max_errors=0, checkpoint=checkpoint_path
+        )
+
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 45), encoding="utf-8")
+    validated_ranges.fail_after = None
+    validated_ranges.clear()
+    result = check_csv_file(
+        csv_path, SimpleModel, max_errors=0, checkpoint=checkpoint_path
+    )
+
+    assert validated_ranges[0][0] == len("id,age,birthday\n")
+    assert result.num_errors == 9
+
+
+def test_checkpointed_check_counts_short_rows(tmp_path, validated_ranges):
+    csv_path = tmp_path / "data.csv"
+    rows = "".join(f"{i},30\n" for i in range(1, 31))
+    csv_path.write_text("id,age,birthday\n" + rows, encoding="utf-8")
+
+    result = check_csv_file(
+        csv_path, SimpleModel, max_errors=0, checkpoint=tmp_path / "0.json"
+    )
+
+    assert len(validated_ranges) > 1
+    assert result.num_errors == 30
+
+
+def test_checkpoint_needs_counting_only(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n" + csv_rows(1, 4), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        check_csv_file(csv_path, SimpleModel, checkpoint=tmp_path / "0.json")
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from datavalgen.cli import validate
+from .test_validate import SimpleModel
+
+
+def test_validate_cli_checks_tables_among_several_files(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(validate, "get_model", lambda *a, **kw: SimpleModel)
+    csv_path = tmp_path / "a.csv"
+    csv_path.write_text("id,age,birthday\n1,200,1990-01-01\n", encoding="utf-8")
+    parquet_path = tmp_path / "b.parquet"
+    table = {"id": [1, 2], "age": [30, 300], "birthday": ["1990-01-01"] * 2}
+    pq.write_table(pa.table(table), parquet_path)
+
+    with pytest.raises(SystemExit) as exc_info:
+        validate.main(["-m", "simple", "-d", str(csv_path), str(parquet_path)])
+
+    out = capsys.readouterr().out
+    assert exc_info.value.code == 1
+    assert f"{csv_path}: 1 errors." in out
+    assert f"{parquet_path}: 1 errors." in out
+    assert "2 files checked, 2 with problems, 2 errors in total." in out
+
+
+def test_validate_cli_imports_numpy_only_when_needed():
+    code = "import sys, datavalgen.cli.validate; print('numpy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,97 @@
+from datetime import date
+from enum import Enum
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from datavalgen.columnar import compile_model
+from datavalgen.validate import check_csv_file
+from .test_validate import OrderedAgeModel, SimpleModel
+
+
+class YesNo(str, Enum):
+    yes = "Yes"
+    no = "No"
+
+
+class FlatModel(BaseModel):
+    id: int = Field(..., gt=0)
+    weight: float = Field(..., ge=0, lt=500.5)
+    smoker: YesNo
+    stage: Literal["I", "II", "III"]
+    code: str = Field(..., pattern=r"^C[0-9]{2}$", max_length=3)
+    diagnosed: Optional[date] = Field(None, ge=date(2000, 1, 1))
+    active: bool
+
+
+class ValidatedModel(SimpleModel):
+    @field_validator("age")
+    @classmethod
+    def check_age(cls, value: int) -> int:
+        return value
+
+
+class StrippedModel(SimpleModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+def test_compile_model_supports_flat_models():
+    assert compile_model(SimpleModel) is not None
+    assert compile_model(FlatModel) is not None
+
+
+def test_compile_model_rejects_validators_and_config():
+    assert compile_model(OrderedAgeModel) is None
+    assert compile_model(ValidatedModel) is None
+    assert compile_model(StrippedModel) is None
+
+
+def test_columnar_engine_matches_batch_engine(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,weight,smoker,stage,code,diagnosed,active\n"
+        "1,70.5,Yes,II,C12,2001-05-01,true\n"
+        "2, 80,No,I,C34,2010-01-01,NO\n"
+        "03,1_000,yes,IV,C345,1999-12-31,maybe\n"
+        "-4,500.5,No,III,D12,,1\n"
+        "5,1e2,No,III,C99,2020-02-30,off\n"
+        "x,inf,No,III,C99,2020-02-03,on\n",
+        encoding="utf-8",
+    )
+
+    batch = check_csv_file(csv_path, FlatModel, chunk_size=4, max_errors=None)
+    columnar = check_csv_file(
+        csv_path, FlatModel, chunk_size=4, max_errors=None, engine="columnar"
+    )
+
+    assert batch.num_errors == 13
+    assert columnar.num_errors == batch.num_errors
+    assert columnar.errors == batch.errors
+
+
+def test_columnar_engine_falls_back_for_uncompiled_models(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n30,21,1990-01-03\n",
+        encoding="utf-8",
+    )
+
+    result = check_csv_file(csv_path, OrderedAgeModel, engine="columnar")
+
+    assert result.num_errors == 1
+    assert result.errors[0]["loc"] == (0,)
+
+
+class CodeModel(BaseModel):
+    code: str = Field(..., pattern=r"^[A-Z][0-9]{2}$")
+
+
+def test_columnar_engine_rejects_pattern_matches_before_a_newline(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text('code\n"A12\n"\nA12\n', encoding="utf-8")
+
+    batch = check_csv_file(csv_path, CodeModel, max_errors=None)
+    columnar = check_csv_file(csv_path, CodeModel, max_errors=None, engine="columnar")
+
+    assert batch.num_errors == 1
+    assert columnar.errors == batch.errors
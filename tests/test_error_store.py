@@ -0,0 +1,63 @@
+import pickle
+
+from datavalgen.error_store import ErrorStore
+
+
+ERRORS = [
+    {
+        "type": "greater_than",
+        "loc": (0, "id"),
+        "msg": "Input should be greater than 0",
+        "input": "-1",
+        "ctx": {"gt": 0},
+    },
+    {
+        "type": "value_error",
+        "loc": (3,),
+        "msg": "Value error, id must be smaller than age",
+        "input": {"id": "30"},
+        "ctx": {"error": ValueError("id must be smaller than age")},
+    },
+    {
+        "type": "greater_than",
+        "loc": (7, "id"),
+        "msg": "Input should be greater than 0",
+        "input": "-7",
+        "ctx": {"gt": 0},
+    },
+    {
+        "type": "missing",
+        "loc": (8, "age"),
+        "msg": "Field required",
+        "input": {},
+    },
+]
+
+
+def test_error_store_round_trips_error_details():
+    store = ErrorStore(ERRORS[:1])
+    store.extend(ERRORS[1:])
+
+    assert len(store) == 4
+    assert store[0] == ERRORS[0]
+    assert store[-1] == ERRORS[-1]
+    assert "ctx" not in store[3]
+    assert store[1]["ctx"] is ERRORS[1]["ctx"]
+    assert store[2:] == ERRORS[2:]
+    assert list(store) == ERRORS
+    assert store == tuple(ERRORS)
+    assert ErrorStore() == ()
+
+
+def test_error_store_interns_locations_and_kinds():
+    store = ErrorStore(ERRORS)
+
+    # (0, "id") and (7, "id") share a location and an error kind
+    assert len(store._locs) == 3
+    assert len(store._kinds) == 3
+
+
+def test_error_store_pickles():
+    store = ErrorStore([ERRORS[0], ERRORS[2]])
+
+    assert pickle.loads(pickle.dumps(store)) == store
@@ -0,0 +1,54 @@
+from datetime import date
+
+import pytest
+from pydantic import BaseModel, Field
+
+from datavalgen.factory import BaseDataModelFactory
+
+
+class VisitModel(BaseModel):
+    age: int = Field(..., ge=0, lt=120)
+    visit: date = Field(..., gt=date(1969, 7, 20))
+    code: str = Field(..., pattern=r"^C[0-9]{2}$", max_length=3)
+    note: str
+
+
+class VisitModelFactory(BaseDataModelFactory[VisitModel]):
+    @classmethod
+    def age(cls) -> int:
+        return cls.__random__.randint(
+            cls.get_field_constraint("age", "ge"),
+            cls.get_field_constraint("age", "lt") - 1,
+        )
+
+
+class OtherModel(BaseModel):
+    age: int = Field(..., gt=5)
+
+
+class OtherModelFactory(VisitModelFactory):
+    __model__ = OtherModel  # type: ignore[assignment]
+
+
+def test_get_field_constraint_reads_the_constraint_table():
+    assert VisitModelFactory.get_field_constraint("age", "lt") == 120
+    assert VisitModelFactory.get_field_constraint("visit", "gt") == date(1969, 7, 20)
+    assert VisitModelFactory.get_field_constraint("code", "pattern") == r"^C[0-9]{2}$"
+    assert VisitModelFactory.field_constraints()["note"] == {}
+    assert 0 <= VisitModelFactory.build().age < 120
+
+
+def test_constraint_table_is_per_factory_and_read_only():
+    table = VisitModelFactory.field_constraints()
+
+    assert table is VisitModelFactory.field_constraints()
+    assert OtherModelFactory.field_constraints()["age"] == {"gt": 5}
+    with pytest.raises(TypeError):
+        table["age"]["lt"] = 10  # type: ignore[index]
+
+
+def test_get_field_constraint_errors():
+    with pytest.raises(ValueError, match=r"'age' has no 'gt' constraint.*'ge', 'lt'"):
+        VisitModelFactory.get_field_constraint("age", "gt")
+    with pytest.raises(KeyError, match="no field 'weight'"):
+        VisitModelFactory.get_field_constraint("weight", "lt")
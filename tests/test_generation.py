@@ -0,0 +1,193 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+from datavalgen.factory import BaseDataModelFactory
+from datavalgen.generation import compile_generation_plan
+from .test_columnar import FlatModel
+
+
+class FlatModelFactory(BaseDataModelFactory[FlatModel]):
+    @classmethod
+    def code(cls) -> str:
+        return f"C{cls.__random__.randint(0, 99):02d}"
+
+
+class BoundedModel(FlatModel):
+    count: int = Field(..., ge=-5, lt=5)
+    ratio: float = Field(..., gt=0, le=1)
+    visit: date = Field(..., gt=date(2020, 1, 1), le=date(2020, 1, 31))
+    name: str = Field(..., min_length=2, max_length=4)
+
+
+class BoundedModelFactory(BaseDataModelFactory[BoundedModel]):
+    code = FlatModelFactory.code
+
+
+class CheckedModel(FlatModel):
+    @model_validator(mode="after")
+    def check(self) -> "CheckedModel":
+        return self
+
+
+class CheckedModelFactory(BaseDataModelFactory[CheckedModel]):
+    code = FlatModelFactory.code
+
+
+class DecoratedModel(BaseModel):
+    name: str = Field(..., min_length=3, max_length=8)
+    age: int = Field(..., ge=0, le=100)
+
+    @field_validator("name")
+    @classmethod
+    def upper_name(cls, value: str) -> str:
+        return value.upper()
+
+    @computed_field
+    @property
+    def age2(self) -> int:
+        return self.age * 2
+
+
+class DecoratedModelFactory(BaseDataModelFactory[DecoratedModel]):
+    pass
+
+
+def _validate_rows(model, df: pd.DataFrame) -> list:
+    rows = df.astype(object).where(df.notna(), None).to_dict("records")
+    return TypeAdapter(list[model]).validate_python(rows)
+
+
+def test_columnar_rows_are_valid_and_match_batch_columns():
+    df = FlatModelFactory.batch_dataframe(500, columnar=True)
+
+    assert len(df) == 500
+    assert list(df.columns) == list(FlatModelFactory.batch_dataframe(5).columns)
+    instances = _validate_rows(FlatModel, df)
+    assert {instance.smoker.value for instance in instances} == {"Yes", "No"}
+    assert any(instance.diagnosed is None for instance in instances)
+
+
+def test_columnar_rows_follow_constraints():
+    df = BoundedModelFactory.batch_dataframe(2000, columnar=True)
+
+    _validate_rows(BoundedModel, df)
+    assert df["count"].between(-5, 4).all()
+    assert set(df["count"]) == set(range(-5, 5))
+    assert ((df["ratio"] > 0) & (df["ratio"] <= 1)).all()
+    assert df["visit"].min() >= "2020-01-02" and df["visit"].max() <= "2020-01-31"
+    assert df["name"].str.len().between(2, 4).all()
+
+
+def test_columnar_generation_is_seeded_by_the_factory():
+    FlatModelFactory.seed_random(3)
+    first = FlatModelFactory.batch_dataframe(50, columnar=True)
+    FlatModelFactory.seed_random(3)
+    second = FlatModelFactory.batch_dataframe(50, columnar=True)
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_columnar_generation_leaves_the_factory_random_state_alone():
+    FlatModelFactory.seed_random(3)
+    FlatModelFactory.__random__.getrandbits(64)
+    expected = (
+        FlatModelFactory.__random__.random(),
+        FlatModelFactory.__faker__.random.random(),
+    )
+
+    FlatModelFactory.seed_random(3)
+    # draws the seed of the plan's generator, and per row values for `code`
+    FlatModelFactory.batch_dataframe(5, columnar=True)
+
+    assert (
+        FlatModelFactory.__random__.random(),
+        FlatModelFactory.__faker__.random.random(),
+    ) == expected
+
+
+def test_model_validators_fall_back_to_batch():
+    assert compile_generation_plan(CheckedModelFactory) is None
+
+    df = CheckedModelFactory.batch_dataframe(5, columnar=True)
+    assert len(df) == 5
+    _validate_rows(CheckedModel, df)
+
+
+def test_validators_and_computed_fields_fall_back_to_batch():
+    assert compile_generation_plan(DecoratedModelFactory) is None
+
+    df = DecoratedModelFactory.batch_dataframe(20, columnar=True)
+    assert list(df.columns) == ["name", "age", "age2"]
+    assert (df["name"] == df["name"].str.upper()).all()
+    assert (df["age2"] == df["age"] * 2).all()
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_projection_of_decorated_models_uses_batch(columnar):
+    df = DecoratedModelFactory.batch_dataframe(
+        5, columnar=columnar, columns=["age2", "name"], fixed={"age": "10"}
+    )
+
+    assert list(df.columns) == ["age2", "name"]
+    assert df["age2"].tolist() == [20] * 5
+    assert (df["name"] == df["name"].str.upper()).all()
+
+
+class CountingFactory(BaseDataModelFactory[FlatModel]):
+    calls = 0
+
+    @classmethod
+    def code(cls) -> str:
+        cls.calls += 1
+        return "C01"
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_projected_columns_are_not_generated(columnar):
+    CountingFactory.calls = 0
+    df = CountingFactory.batch_dataframe(
+        20, columnar=columnar, columns=["stage", "id"], fixed={"stage": "II"}
+    )
+
+    assert list(df.columns) == ["stage", "id"]
+    assert set(df["stage"]) == {"II"}
+    assert CountingFactory.calls == 0
+
+
+def test_projection_keeps_the_values_of_columnar_columns():
+    FlatModelFactory.seed_random(5)
+    full = FlatModelFactory.batch_dataframe(30, columnar=True)
+    FlatModelFactory.seed_random(5)
+    projected = FlatModelFactory.batch_dataframe(
+        30, columnar=True, columns=["weight", "code"], fixed={"id": "12"}
+    )
+
+    pd.testing.assert_frame_equal(projected, full[["weight", "code"]])
+
+
+def test_fixed_values_are_validated_for_their_field():
+    df = FlatModelFactory.batch_dataframe(3, columnar=True, fixed={"id": "12"})
+    assert df["id"].tolist() == [12, 12, 12]
+
+    with pytest.raises(ValueError, match="column 'id'"):
+        FlatModelFactory.batch_dataframe(3, fixed={"id": "-1"})
+    with pytest.raises(ValueError, match="not in model"):
+        FlatModelFactory.batch_dataframe(3, columns=["id", "nope"])
+
+
+def test_projection_without_plan_uses_fixed_values():
+    df = CheckedModelFactory.batch_dataframe(
+        5, columns=["stage"], fixed={"stage": "III"}
+    )
+
+    assert df["stage"].tolist() == ["III"] * 5
@@ -0,0 +1,54 @@
+import pytest
+
+from datavalgen.memory import AdaptiveChunkSize, parse_memory_size, peak_rss
+from datavalgen.read_csv import CSV_READERS, read_csv_chunks
+from datavalgen.validate import check_csv_file
+from .test_validate import SimpleModel
+
+
+def test_parse_memory_size():
+    assert parse_memory_size("512M") == 512 << 20
+    assert parse_memory_size("1.5GiB") == 3 << 29
+    assert parse_memory_size("2g") == 2 << 30
+    assert parse_memory_size("1000") == 1000
+    with pytest.raises(ValueError):
+        parse_memory_size("lots")
+
+
+@pytest.mark.parametrize("reader", CSV_READERS)
+def test_adaptive_chunk_size_follows_row_width(tmp_path, monkeypatch, reader):
+    monkeypatch.setattr("datavalgen.memory.current_rss", lambda: 0)
+    csv_path = tmp_path / "data.csv"
+    narrow = "".join(f"{i},x\n" for i in range(3000))
+    wide = "".join(f"{i},{'x' * 5000}\n" for i in range(3000))
+    csv_path.write_text("id,note\n" + narrow + wide, encoding="utf-8")
+    sizer = AdaptiveChunkSize(4 << 20)
+
+    chunks = read_csv_chunks(csv_path, reader=reader, chunksize=sizer)
+    sizes = [len(chunk) for chunk in chunks]
+
+    assert sum(sizes) == 6000
+    # A probe chunk, then large chunks of narrow rows and small ones of wide
+    # rows (about 15 KB each with the copies we account for).
+    assert sizes[0] == 100
+    assert max(sizes) > 1000
+    assert 10 <= sizes[-2] < 300
+
+
+def test_check_csv_file_with_memory_budget(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n"
+        + "".join(
+            f"{i},{200 if i % 50 == 0 else 30},1990-01-01\n" for i in range(1, 1000)
+        ),
+        encoding="utf-8",
+    )
+
+    expected = check_csv_file(csv_path, SimpleModel, max_errors=None)
+    result = check_csv_file(
+        csv_path, SimpleModel, max_errors=None, memory_budget=1 << 30
+    )
+
+    assert result.errors == expected.errors
+    assert peak_rss() is None or peak_rss() > 0
@@ -0,0 +1,103 @@
+import pandas as pd
+import pytest
+
+from datavalgen.cli import generate
+from datavalgen.parallel_generation import (
+    GenerationChunk,
+    iter_generated_chunks,
+    plan_generation_chunks,
+    write_partitions,
+)
+from .test_generation import FlatModelFactory
+
+
+def _generate(chunks, **options) -> pd.DataFrame:
+    dfs = iter_generated_chunks(FlatModelFactory, chunks, seed=42, **options)
+    return pd.concat(list(dfs), ignore_index=True)
+
+
+def test_plan_generation_chunks_splits_shards_by_chunk():
+    chunks = plan_generation_chunks(25, chunk_size=10)
+    shards = [
+        plan_generation_chunks(25, chunk_size=10, shard=shard, num_shards=2)
+        for shard in range(2)
+    ]
+
+    assert chunks == [
+        GenerationChunk(0, 10),
+        GenerationChunk(1, 10),
+        GenerationChunk(2, 5),
+    ]
+    assert shards == [chunks[:1], chunks[1:]]
+    assert plan_generation_chunks(5, chunk_size=10, shard=0, num_shards=2) == []
+    with pytest.raises(ValueError):
+        plan_generation_chunks(5, chunk_size=10, shard=2, num_shards=2)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_workers_and_shards_generate_the_serial_rows(columnar):
+    chunks = plan_generation_chunks(60, chunk_size=10)
+    serial = _generate(chunks, columnar=columnar)
+    parallel = _generate(chunks, columnar=columnar, workers=2)
+    sharded = pd.concat(
+        [
+            _generate(
+                plan_generation_chunks(60, chunk_size=10, shard=shard, num_shards=4),
+                columnar=columnar,
+            )
+            for shard in range(4)
+        ],
+        ignore_index=True,
+    )
+
+    assert len(serial) == 60
+    pd.testing.assert_frame_equal(serial, parallel)
+    pd.testing.assert_frame_equal(serial, sharded)
+
+
+def test_other_seeds_generate_other_rows():
+    chunks = plan_generation_chunks(20, chunk_size=10)
+    first = pd.concat(list(iter_generated_chunks(FlatModelFactory, chunks, seed=1)))
+    second = pd.concat(list(iter_generated_chunks(FlatModelFactory, chunks, seed=2)))
+
+    assert first["id"].tolist() != second["id"].tolist()
+
+
+def test_write_partitions_names_files_by_chunk(tmp_path):
+    chunks = plan_generation_chunks(25, chunk_size=10, shard=1, num_shards=2)
+    paths = write_partitions(
+        FlatModelFactory, chunks, tmp_path, file_format="csv", seed=42, workers=2
+    )
+
+    assert [path.name for path in paths] == ["part-000001.csv", "part-000002.csv"]
+    assert len(pd.read_csv(paths[1])) == 5
+
+
+def test_generate_cli_shards_match_one_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate, "get_factory", lambda *a, **kw: FlatModelFactory)
+    common = ["-f", "flat", "-n", "35", "--chunk-size", "10", "--seed", "7"]
+
+    generate.main([*common, "-o", str(tmp_path / "all.csv"), "--workers", "2"])
+    for shard in ("1/2", "2/2"):
+        generate.main(
+            [*common, "--shard", shard, "--partitioned", "-o", str(tmp_path / "parts")]
+        )
+
+    whole = pd.read_csv(tmp_path / "all.csv", keep_default_na=False)
+    parts = sorted((tmp_path / "parts").iterdir())
+    assert [path.name for path in parts] == [f"part-00000{i}.csv" for i in range(4)]
+    combined = pd.concat(
+        [pd.read_csv(path, keep_default_na=False) for path in parts],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(whole, combined)
+
+
+def test_generate_cli_show_df_uses_the_seed(monkeypatch, capsys):
+    monkeypatch.setattr(generate, "get_factory", lambda *a, **kw: FlatModelFactory)
+    shown = []
+    for _ in range(2):
+        generate.main(["-f", "flat", "-n", "5", "--show-df", "--seed", "7"])
+        shown.append(capsys.readouterr().out)
+
+    assert shown[0] == shown[1]
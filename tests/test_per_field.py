@@ -0,0 +1,66 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from datavalgen.per_field import compile_field_validators
+from datavalgen.validate import check_csv_file
+from .test_columnar import FlatModel
+from .test_validate import OrderedAgeModel, SimpleModel
+
+
+class StrippedModel(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    code: str = Field(..., max_length=2)
+
+
+def test_compile_field_validators_rejects_model_validators():
+    assert compile_field_validators(SimpleModel) is not None
+    assert compile_field_validators(OrderedAgeModel) is None
+
+
+def test_per_field_engine_matches_batch_engine(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    rows = [
+        "1,70.5,Yes,II,C12,2001-05-01,true",
+        "-2,80,No,IV,C34,1999-01-01,NO",
+        "3,-1,maybe,I,C345,,yes",
+    ]
+    csv_path.write_text(
+        "id,weight,smoker,stage,code,diagnosed,active\n" + "\n".join(rows * 4) + "\n",
+        encoding="utf-8",
+    )
+
+    batch = check_csv_file(csv_path, FlatModel, chunk_size=5, max_errors=None)
+    per_field = check_csv_file(
+        csv_path, FlatModel, chunk_size=5, max_errors=None, engine="per-field"
+    )
+
+    assert batch.num_errors == 28
+    assert per_field.num_errors == batch.num_errors
+    assert per_field.errors == batch.errors
+
+
+def test_per_field_engine_applies_model_config(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("code\n ab \nabc\n", encoding="utf-8")
+
+    result = check_csv_file(csv_path, StrippedModel, engine="per-field")
+
+    assert result.num_errors == 1
+    assert result.errors[0]["loc"] == (1, "code")
+
+
+class StrictModel(BaseModel):
+    count: int = Field(..., strict=True)
+
+
+def test_field_caches_are_typed_and_per_instance():
+    first = compile_field_validators(StrictModel)
+    second = compile_field_validators(StrictModel)
+    assert first is not None and second is not None
+    (_, validate), (_, other_validate) = first.validators[0], second.validators[0]
+
+    assert validate(1) == ()
+    assert validate(True) != ()
+    assert validate(1.0) != ()
+    assert validate is not other_validate
+    assert other_validate.cache_info().currsize == 0
@@ -0,0 +1,270 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from datavalgen.read_csv import (
+    CSV_READERS,
+    CsvChunk,
+    csv_compression,
+    csv_record_boundaries,
+    expand_csv_paths,
+    prefetch_chunks,
+    read_csv_chunks,
+    read_csv_columns,
+    read_csv_range_chunks,
+)
+from datavalgen.validate import ENGINES, check_csv_file
+from .test_validate import SimpleModel
+
+
+def _read_ids(csv_path, boundaries):
+    ids = []
+    for start, end in zip(boundaries, boundaries[1:]):
+        for chunk in read_csv_range_chunks(
+            csv_path, start, end, columns=("id", "note"), chunksize=3
+        ):
+            ids.extend(row["id"] for row in chunk.row_dicts())
+    return ids
+
+
+def test_csv_record_boundaries_respect_quoted_newlines(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    rows = [f'{i},"line\n""{i}""\nend"' for i in range(20)]
+    csv_path.write_text("id,note\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    for num_parts in (1, 2, 5, 50):
+        boundaries = csv_record_boundaries(csv_path, num_parts)
+
+        assert len(boundaries) == num_parts + 1
+        assert boundaries[0] == len("id,note\n")
+        assert boundaries[-1] == csv_path.stat().st_size
+        assert _read_ids(csv_path, boundaries) == [str(i) for i in range(20)]
+
+
+def test_csv_record_boundaries_without_trailing_newline(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,note\n1,a\n2,b", encoding="utf-8")
+
+    boundaries = csv_record_boundaries(csv_path, 3)
+
+    assert _read_ids(csv_path, boundaries) == ["1", "2"]
+
+
+def test_read_csv_chunks_keeps_raw_strings(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        'id,note,extra\n001,"a\nb",x\n,NA,y\n\n  \n3,,z\n', encoding="utf-8"
+    )
+
+    for reader in CSV_READERS:
+        chunks = list(
+            read_csv_chunks(
+                csv_path, reader=reader, usecols=["id", "note"], chunksize=2
+            )
+        )
+        rows = [row for chunk in chunks for row in chunk.row_dicts()]
+
+        assert rows == [
+            {"id": "001", "note": "a\nb"},
+            {"id": "", "note": "NA"},
+            {"id": "3", "note": ""},
+        ], reader
+        assert [len(chunk) for chunk in chunks] == [2, 1], reader
+        assert list(chunks[0].frame()["id"]) == ["001", ""], reader
+        assert chunks[0].row_dicts([1]) == [{"id": "", "note": "NA"}], reader
+
+
+def test_check_csv_file_readers_match_pandas(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n1,30,1990-01-01\n-1,200,not-a-date\n2,,1990-01-01\n",
+        encoding="utf-8",
+    )
+
+    for engine in ENGINES:
+        pandas_result = check_csv_file(
+            csv_path, SimpleModel, chunk_size=2, engine=engine
+        )
+        assert pandas_result.num_errors == 4
+
+        for reader in CSV_READERS:
+            result = check_csv_file(
+                csv_path, SimpleModel, chunk_size=2, engine=engine, reader=reader
+            )
+            assert result.errors == pandas_result.errors, (engine, reader)
+
+
+def test_csv_reader_reads_header_and_byte_ranges(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b'\xef\xbb\xbfid,note\n1,"a\nb"\n2,c\n')
+
+    assert read_csv_columns(csv_path, "csv") == ("id", "note")
+    assert read_csv_columns(csv_path) == ("id", "note")
+
+    start, end = csv_record_boundaries(csv_path, 1)
+    chunks = read_csv_range_chunks(
+        csv_path, start, end, columns=("id", "note"), reader="csv", usecols=["note"]
+    )
+    assert [row for chunk in chunks for row in chunk.row_dicts()] == [
+        {"note": "a\nb"},
+        {"note": "c"},
+    ]
+
+
+@pytest.mark.parametrize("reader", CSV_READERS)
+def test_csv_reader_pads_short_rows_like_pandas(tmp_path, reader):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        'id,note,extra\n1\n2,b,c\n \n3,"x\ny"\n4,d,e\n5\n', encoding="utf-8"
+    )
+
+    chunks = read_csv_chunks(
+        csv_path, reader=reader, usecols=["id", "extra"], chunksize=2
+    )
+    assert [row for chunk in chunks for row in chunk.row_dicts()] == [
+        {"id": "1", "extra": ""},
+        {"id": "2", "extra": "c"},
+        {"id": "3", "extra": ""},
+        {"id": "4", "extra": "e"},
+        {"id": "5", "extra": ""},
+    ]
+
+
+@pytest.mark.parametrize("reader", CSV_READERS)
+def test_short_rows_fail_validation_with_any_reader(tmp_path, reader):
+    csv_path = tmp_path / "data.csv"
+    rows = [f"{i},30" if i % 7 == 0 else f"{i},30,1990-01-01" for i in range(1, 100)]
+    csv_path.write_text("id,age,birthday\n" + "\n".join(rows), encoding="utf-8")
+
+    result = check_csv_file(csv_path, SimpleModel, chunk_size=10, reader=reader)
+
+    assert result.num_errors == 14
+    assert result == check_csv_file(csv_path, SimpleModel)
+
+
+def test_ranges_of_short_rows_match_the_serial_check(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n1,30\n2,40\n", encoding="utf-8")
+
+    start, end = csv_record_boundaries(csv_path, 1)
+    chunks = read_csv_range_chunks(
+        csv_path, start, end, columns=("id", "age", "birthday"), usecols=["age"]
+    )
+    serial = check_csv_file(csv_path, SimpleModel)
+    parallel = check_csv_file(csv_path, SimpleModel, workers=2)
+
+    assert [row for chunk in chunks for row in chunk.row_dicts()] == [
+        {"age": "30"},
+        {"age": "40"},
+    ]
+    assert serial.num_errors == 2
+    assert parallel == serial
+
+
+def test_prefetch_chunks_keeps_order_and_bounds_read_ahead():
+    produced = []
+
+    def chunks():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    consumed = []
+    for chunk in prefetch_chunks(chunks(), 2):
+        # One chunk being handed over, two in the queue, one being read.
+        assert len(produced) - len(consumed) <= 4
+        consumed.append(chunk)
+
+    assert consumed == list(range(10))
+
+
+def test_prefetch_chunks_reraises_reader_errors():
+    def chunks():
+        yield 1
+        raise ValueError("broken file")
+
+    iterator = prefetch_chunks(chunks(), 1)
+
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match="broken file"):
+        next(iterator)
+
+
+def test_check_csv_file_with_prefetch(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n1,20,1990-01-01\n2,21,1990-01-02\n-1,200,not-a-date\n",
+        encoding="utf-8",
+    )
+
+    result = check_csv_file(csv_path, SimpleModel, chunk_size=1, prefetch=2)
+
+    assert result.num_errors == 3
+    assert result.errors[0]["loc"] == (2, "id")
+
+
+def test_expand_csv_paths(tmp_path):
+    for name in ("b.csv", "a.csv", "notes.txt", "sub/c.csv"):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("id\n1\n", encoding="utf-8")
+
+    assert expand_csv_paths([tmp_path]) == [
+        tmp_path / "a.csv",
+        tmp_path / "b.csv",
+        tmp_path / "sub" / "c.csv",
+    ]
+    assert expand_csv_paths([tmp_path / "b.csv", tmp_path / "*.csv"]) == [
+        tmp_path / "b.csv",
+        tmp_path / "a.csv",
+    ]
+    with pytest.raises(FileNotFoundError):
+        expand_csv_paths([tmp_path / "*.parquet"])
+
+
+@pytest.mark.parametrize(
+    "compress,compression",
+    [(gzip.compress, "gzip"), (bz2.compress, "bz2"), (lzma.compress, "xz")],
+)
+@pytest.mark.parametrize("reader", CSV_READERS)
+def test_compressed_csv_is_read_like_the_plain_one(
+    tmp_path, compress, compression, reader
+):
+    text = 'id,"age",birthday\n' + "".join(
+        f"{i},{200 if i % 7 == 0 else 30},1990-01-01\n" for i in range(1, 50)
+    )
+    plain_path = tmp_path / "data.csv"
+    plain_path.write_text(text, encoding="utf-8")
+    # No telling suffix, compression is detected from the magic bytes.
+    compressed_path = tmp_path / "data.bin"
+    compressed_path.write_bytes(compress(text.encode("utf-8")))
+
+    assert csv_compression(plain_path) is None
+    assert csv_compression(compressed_path) == compression
+    assert read_csv_columns(compressed_path, reader) == ("id", "age", "birthday")
+
+    expected = check_csv_file(plain_path, SimpleModel, chunk_size=4, reader=reader)
+    result = check_csv_file(
+        compressed_path, SimpleModel, chunk_size=4, reader=reader, workers=2
+    )
+    assert result.errors == expected.errors
+    assert result.num_errors == expected.num_errors == 7
+
+    with pytest.raises(ValueError):
+        check_csv_file(compressed_path, SimpleModel, sample_rows=10)
+
+
+def test_csv_chunk_subclasses_must_implement_all_views():
+    class RowsOnly(CsvChunk):
+        def __len__(self) -> int:
+            return 0
+
+        def row_dicts(self, indices=None):
+            return []
+
+    with pytest.raises(TypeError, match="frame"):
+        RowsOnly()
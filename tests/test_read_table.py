@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pa_csv = pytest.importorskip("pyarrow.csv")
+feather = pytest.importorskip("pyarrow.feather")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from datavalgen.read_table import read_table_chunks, read_table_columns, table_format
+from datavalgen.validate import check_csv_file, check_table_file
+from .test_validate import SimpleModel
+
+TABLE = {
+    "id": [1, -1, 3, None, 5],
+    "age": [20, 200, 30, 40, 50],
+    "birthday": [date(1990, 1, 1)] * 4 + [None],
+    "extra": ["a", "b", "c", "d", "e"],
+}
+
+
+def _write_parquet(path, row_group_size=2):
+    pq.write_table(pa.table(TABLE), path, row_group_size=row_group_size)
+
+
+def test_table_format(tmp_path):
+    parquet_path = tmp_path / "data.bin"
+    _write_parquet(parquet_path)
+    arrow_path = tmp_path / "data.feather"
+    feather.write_feather(pa.table(TABLE), arrow_path)
+
+    assert table_format(parquet_path) == "parquet"
+    assert table_format(arrow_path) == "arrow"
+    assert table_format(tmp_path / "data.csv") is None
+
+
+def test_read_table_chunks_projects_columns(tmp_path):
+    path = tmp_path / "data.parquet"
+    _write_parquet(path)
+
+    chunks = list(read_table_chunks(path, usecols=["id", "age"], chunksize=2))
+
+    assert read_table_columns(path) == ("id", "age", "birthday", "extra")
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0].row_dicts() == [{"id": 1, "age": 20}, {"id": -1, "age": 200}]
+    assert chunks[1].frame()["id"].tolist() == [3, None]
+
+
+@pytest.mark.parametrize("engine", ["batch", "per-field"])
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_check_table_file_matches_csv(tmp_path, engine, suffix):
+    path = tmp_path / f"data{suffix}"
+    if suffix == ".parquet":
+        _write_parquet(path)
+    else:
+        feather.write_feather(pa.table(TABLE), path, chunksize=2)
+    csv_path = tmp_path / "data.csv"
+    pa_csv.write_csv(pa.table(TABLE), csv_path)
+
+    result = check_table_file(path, SimpleModel, chunk_size=2, engine=engine)
+
+    assert [error["loc"] for error in result.errors] == [
+        (1, "id"),
+        (1, "age"),
+        (3, "id"),
+        (4, "birthday"),
+    ]
+    assert result.num_errors == 4
+    assert result.warnings == ("Unexpected columns: {'extra'}",)
+    # Typed values are passed to pydantic as they are.
+    assert result.errors[0]["input"] == -1
+    # Same rows as the CSV (where the nulls are empty strings).
+    assert [error["loc"] for error in result.errors] == [
+        error["loc"] for error in check_csv_file(csv_path, SimpleModel).errors
+    ]
+
+
+def test_check_table_file_rejects_columnar_engine(tmp_path):
+    path = tmp_path / "data.parquet"
+    _write_parquet(path)
+
+    with pytest.raises(ValueError, match="columnar"):
+        check_table_file(path, SimpleModel, engine="columnar")
@@ -0,0 +1,75 @@
+from datavalgen.report_errors import format_val_errors
+from datavalgen.row_index import (
+    RowIndex,
+    build_row_index,
+    default_index_path,
+    get_row_index,
+)
+from datavalgen.validate import check_csv_file, check_csv_rows
+from .test_validate import SimpleModel
+
+CSV_TEXT = (
+    "id,age,birthday\n"
+    "1,30,1990-01-01\n"
+    "\n"
+    '2,"3\n0",1990-01-01\n'
+    "3,200,1990-01-01\r\n"
+    "4,30,nope"
+)
+
+
+def test_row_index_has_offsets_and_true_lines(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(CSV_TEXT.encode("utf-8"))
+    # Blocks smaller than a record exercise the state carried between blocks.
+    monkeypatch.setattr("datavalgen.row_index._INDEX_BLOCK_SIZE", 5)
+
+    index = build_row_index(csv_path)
+
+    data = csv_path.read_bytes()
+    assert len(index) == 4
+    assert index.lines.tolist() == [2, 4, 6, 7]
+    assert data[slice(*index.byte_range(1, 2))] == b'2,"3\n0",1990-01-01\n'
+    assert index.byte_range(3, 10) == (data.index(b"4,30"), len(data))
+
+
+def test_row_index_is_saved_and_reused(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(CSV_TEXT.encode("utf-8"))
+
+    index = get_row_index(csv_path)
+    saved = RowIndex.load(default_index_path(csv_path))
+
+    assert saved is not None
+    assert saved.stamp == index.stamp
+    assert saved.offsets.tolist() == index.offsets.tolist()
+    assert saved.lines.tolist() == index.lines.tolist()
+
+
+def test_corrupt_row_index_is_rebuilt(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(CSV_TEXT.encode("utf-8"))
+    index = get_row_index(csv_path)
+    index_path = default_index_path(csv_path)
+    index_path.write_bytes(index_path.read_bytes()[:-40])
+
+    assert RowIndex.load(index_path) is None
+    rebuilt = get_row_index(csv_path)
+    assert rebuilt.lines.tolist() == index.lines.tolist()
+    assert RowIndex.load(index_path) is not None
+
+
+def test_check_csv_rows_matches_full_check(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(CSV_TEXT.encode("utf-8"))
+    full = check_csv_file(csv_path, SimpleModel)
+
+    result = check_csv_rows(csv_path, SimpleModel, 2, 4)
+
+    # Row 1 has a newline in its age, which is an error too.
+    assert result.errors == full.errors[1:]
+    assert check_csv_rows(csv_path, SimpleModel, 0, 1).num_errors == 0
+    index = get_row_index(csv_path)
+    report = format_val_errors(result.errors, line_numbers=index.line_number)
+    assert "Line 6, column 'age'" in report
+    assert "Line 7, column 'birthday'" in report
@@ -3,6 +3,7 @@ import importlib
 
 import pytest
 
+from datavalgen.checkpoint import default_checkpoint_dir
 from datavalgen.safe_validate import safe_validate
 from datavalgen.validate import check_csv_file
 from .test_validate import SimpleModel
@@ -150,3 +151,75 @@ def test_safe_validate_errors_without_distribution_env(tmp_path, monkeypatch):
             output_path=out_path,
             pydantic_model_name="simple",
         )
+
+
+def test_safe_validate_aggregates_multiple_inputs(tmp_path, monkeypatch):
+    first_path = tmp_path / "2024-01.csv"
+    second_path = tmp_path / "2024-02.csv"
+    out_path = tmp_path / "out.json"
+    _write_text(first_path, "id,age,birthday\n-1,200,not-a-date\n")
+    _write_text(second_path, "id,age,birthday\n1,20,1990-01-01\n2,200,1990-01-01\n")
+    monkeypatch.setenv("DATAVALGEN_DISTRIBUTION", "example-dist")
+
+    safe_validate_module = importlib.import_module("datavalgen.safe_validate")
+    monkeypatch.setattr(
+        safe_validate_module,
+        "get_model",
+        lambda _, distribution=None: SimpleModel,
+    )
+    safe_validate(
+        dataset_path=[first_path, second_path],
+        output_path=out_path,
+        pydantic_model_name="simple",
+    )
+
+    payload = json.loads(out_path.read_text(encoding="utf-8"))
+    assert payload == {
+        "num_errors": 4,
+        "files": [{"num_errors": 3}, {"num_errors": 1}],
+    }
+
+
+def test_safe_validate_removes_checkpoints_when_done(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    out_path = tmp_path / "out.json"
+    _write_text(csv_path, "id,age,birthday\n-1,200,not-a-date\n")
+    monkeypatch.setenv("DATAVALGEN_DISTRIBUTION", "example-dist")
+
+    safe_validate_module = importlib.import_module("datavalgen.safe_validate")
+    monkeypatch.setattr(
+        safe_validate_module,
+        "get_model",
+        lambda _, distribution=None: SimpleModel,
+    )
+    safe_validate(
+        dataset_path=csv_path,
+        output_path=out_path,
+        pydantic_model_name="simple",
+    )
+
+    assert json.loads(out_path.read_text(encoding="utf-8")) == {"num_errors": 3}
+    assert not default_checkpoint_dir(out_path).exists()
+
+
+@pytest.mark.parametrize("checkpoints", [True, False])
+def test_safe_validate_counts_short_rows(tmp_path, monkeypatch, checkpoints):
+    csv_path = tmp_path / "data.csv"
+    out_path = tmp_path / "out.json"
+    _write_text(csv_path, "id,age,birthday\n1,30\n2,40,1990-01-01\n3\n")
+    monkeypatch.setenv("DATAVALGEN_DISTRIBUTION", "example-dist")
+
+    safe_validate_module = importlib.import_module("datavalgen.safe_validate")
+    monkeypatch.setattr(
+        safe_validate_module,
+        "get_model",
+        lambda _, distribution=None: SimpleModel,
+    )
+    safe_validate(
+        dataset_path=csv_path,
+        output_path=out_path,
+        pydantic_model_name="simple",
+        checkpoints=checkpoints,
+    )
+
+    assert json.loads(out_path.read_text(encoding="utf-8")) == {"num_errors": 3}
@@ -0,0 +1,97 @@
+import pytest
+
+from datavalgen.sampling import sample_csv_records, wilson_interval
+from datavalgen.validate import check_csv_file
+from .test_validate import SimpleModel
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(30, 100)
+
+    assert low == pytest.approx(0.2189, abs=1e-4)
+    assert high == pytest.approx(0.3958, abs=1e-4)
+    assert wilson_interval(0, 100)[0] == 0.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_sample_csv_records_are_whole_records(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    rows = [f'{i},"multi\nline ""{i}"""' for i in range(200)]
+    csv_path.write_text("id,note\n" + "\n".join(rows), encoding="utf-8")
+
+    sample = sample_csv_records(csv_path, 50, num_columns=2, seed=1)
+    records = sample.records
+
+    assert sample == sample_csv_records(csv_path, 50, num_columns=2, seed=1)
+    assert sample.num_malformed == 0
+    assert 0 < len(records) <= 50
+    assert len(set(records)) == len(records)
+    expected = {f"{row}\n".encode() for row in rows}
+    assert set(records) <= expected
+
+
+def test_check_csv_file_sample_estimates_error_rate(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    lines = ["id,age,birthday"]
+    for i in range(1, 5001):
+        age = 200 if i % 10 < 3 else 30
+        lines.append(f"{i},{age},1990-01-01")
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = check_csv_file(
+        csv_path,
+        SimpleModel,
+        chunk_size=100,
+        sample_rows=2000,
+        sample_head=True,
+        sample_seed=0,
+    )
+
+    estimate = result.estimate
+    assert estimate is not None
+    assert estimate.num_rows > 1000
+    assert estimate.low < 0.3 < estimate.high
+    assert estimate.high - estimate.low < 0.1
+    assert estimate.column_rates["age"] == estimate.error_rate
+    assert estimate.column_rates["birthday"] == 0.0
+    # Only the errors of the first chunk come with line numbers.
+    assert len(result.errors) == 10
+    assert result.errors[0]["loc"] == (0, "age")
+    assert result.num_errors == 30 + estimate.num_failing_rows
+    assert result.stop_reason is not None
+
+
+def test_sampled_rows_with_wrong_field_counts_fail(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    lines = ["id,age,birthday"]
+    lines += [f"{i},30,1990-01-01" if i % 2 else f"{i},30" for i in range(1, 501)]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    sample = sample_csv_records(csv_path, 200, num_columns=3, seed=0)
+    result = check_csv_file(csv_path, SimpleModel, sample_rows=200, sample_seed=0)
+
+    assert sample.num_malformed > 0 and sample.records
+    estimate = result.estimate
+    assert estimate is not None
+    assert estimate.num_rows == sample.num_rows
+    assert estimate.num_failing_rows == result.num_errors == sample.num_malformed
+
+
+def test_sample_head_rows_are_not_sampled_again(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    lines = ["id,age,birthday"] + [f"{i},200,1990-01-01" for i in range(1, 21)]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = check_csv_file(
+        csv_path,
+        SimpleModel,
+        chunk_size=15,
+        sample_rows=100,
+        sample_head=True,
+        sample_seed=0,
+    )
+
+    estimate = result.estimate
+    assert estimate is not None
+    assert 0 < estimate.num_rows <= 5
+    assert result.num_errors == 15 + estimate.num_failing_rows
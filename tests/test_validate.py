@@ -1,9 +1,18 @@
 from datetime import date
 
-from pydantic import BaseModel, ConfigDict, Field
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+import datavalgen.validate as validate_module
 from datavalgen.check_result import CheckResult
-from datavalgen.validate import check_column_names, check_csv_file
+from datavalgen.validate import (
+    ENGINES,
+    _validate_rows,
+    check_column_names,
+    check_csv_file,
+    check_csv_files,
+    iter_csv_errors,
+)
 
 
 class SimpleModel(BaseModel):
@@ -145,3 +154,297 @@ def test_check_csv_file_truncates_displayed_errors_but_counts_all_errors(tmp_pat
     assert result.truncated is True
     assert len(result.errors) == 1
     assert result.errors[0]["loc"] == (0, "id")
+
+
+class OrderedAgeModel(SimpleModel):
+    @model_validator(mode="after")
+    def check_id_below_age(self):
+        if self.id >= self.age:
+            raise ValueError("id must be smaller than age")
+        return self
+
+
+def test_check_csv_file_reports_model_errors_with_global_row_index(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n1,20,1990-01-01\n2,21,1990-01-02\n30,21,1990-01-03\n",
+        encoding="utf-8",
+    )
+
+    result = check_csv_file(csv_path, OrderedAgeModel, chunk_size=2)
+
+    assert result.num_errors == 1
+    assert result.errors[0]["loc"] == (2,)
+    assert "id must be smaller than age" in result.errors[0]["msg"]
+
+
+def test_check_csv_file_same_errors_for_any_chunk_size(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n"
+        "-1,20,1990-01-01\n"
+        "2,210,1990-01-02\n"
+        "3,22,bad\n"
+        "-4,230,worse\n",
+        encoding="utf-8",
+    )
+
+    expected = check_csv_file(csv_path, SimpleModel, chunk_size=5000, max_errors=None)
+
+    for chunk_size in (1, 2, 3):
+        result = check_csv_file(
+            csv_path, SimpleModel, chunk_size=chunk_size, max_errors=None
+        )
+        assert result.errors == expected.errors
+        assert result.num_errors == expected.num_errors == 6
+
+
+def test_check_csv_file_workers_match_serial_run(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    lines = ["id,age,birthday,note"]
+    for i in range(1, 301):
+        age = 200 if i % 7 == 0 else 30
+        birthday = "not-a-date" if i % 11 == 0 else "1990-01-01"
+        # Quoted newlines must not be mistaken for record boundaries.
+        lines.append(f'{i},{age},{birthday},"multi\nline ""note"""')
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    serial = check_csv_file(csv_path, SimpleModel, chunk_size=16, max_errors=5)
+    parallel = check_csv_file(
+        csv_path, SimpleModel, chunk_size=16, max_errors=5, workers=3
+    )
+
+    assert parallel.num_errors == serial.num_errors == 42 + 27
+    assert parallel.errors == serial.errors
+    assert parallel.truncated is serial.truncated is True
+    assert parallel.errors[0]["loc"] == (6, "age")
+
+
+def _write_mixed_rows(csv_path, num_rows: int) -> None:
+    lines = ["id,age,birthday"]
+    for i in range(1, num_rows + 1):
+        age = 200 if i % 3 == 0 else 30
+        lines.append(f"{i},{age},1990-01-01")
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_check_csv_file_threads_merge_in_file_order(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    _write_mixed_rows(csv_path, 50)
+    serial = check_csv_file(csv_path, SimpleModel, chunk_size=4, max_errors=3)
+
+    # Pretend we run on a free-threaded build so the thread pool is used.
+    monkeypatch.setattr("datavalgen.validate._free_threaded", lambda: True)
+    threaded = check_csv_file(
+        csv_path, SimpleModel, chunk_size=4, max_errors=3, threads=4
+    )
+
+    assert threaded.num_errors == serial.num_errors == 16
+    assert threaded.errors == serial.errors
+    assert [e["loc"] for e in threaded.errors] == [(2, "age"), (5, "age"), (8, "age")]
+
+
+def test_check_csv_file_threads_fall_back_with_gil(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    _write_mixed_rows(csv_path, 10)
+    monkeypatch.setattr("datavalgen.validate._free_threaded", lambda: False)
+
+    result = check_csv_file(csv_path, SimpleModel, chunk_size=4, threads=4)
+
+    assert result.num_errors == 3
+
+
+def test_check_csv_file_count_only_matches_full_count(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n"
+        "-1,200,not-a-date\n"
+        "1,20,1990-01-01\n"
+        "-2,201,1990-01-01\n"
+        "-1,200,not-a-date\n",
+        encoding="utf-8",
+    )
+
+    for engine in ENGINES:
+        full = check_csv_file(csv_path, SimpleModel, max_errors=None, engine=engine)
+        counted = check_csv_file(
+            csv_path, SimpleModel, chunk_size=2, max_errors=0, engine=engine
+        )
+
+        assert counted.num_errors == full.num_errors == 8, engine
+        assert counted.errors == ()
+        assert counted.truncated is True
+
+
+def test_check_csv_file_count_only_never_builds_error_details(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age,birthday\n-1,200,not-a-date\n", encoding="utf-8")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("error details should not be built")
+
+    monkeypatch.setattr("datavalgen.validate._validate_rows", fail)
+
+    assert check_csv_file(csv_path, SimpleModel, max_errors=0).num_errors == 3
+
+
+def test_iter_csv_errors_matches_check_csv_file(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n"
+        "1,20,1990-01-01\n"
+        "-1,200,not-a-date\n"
+        "3,30,1990-01-03\n"
+        "4,400,1990-01-04\n",
+        encoding="utf-8",
+    )
+
+    errors = list(iter_csv_errors(csv_path, SimpleModel, chunk_size=2))
+
+    assert errors == check_csv_file(csv_path, SimpleModel, max_errors=None).errors
+    assert [error["loc"] for error in errors] == [
+        (1, "id"),
+        (1, "age"),
+        (1, "birthday"),
+        (3, "age"),
+    ]
+
+
+def test_iter_csv_errors_stops_reading_when_closed(tmp_path, monkeypatch):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n" + "-1,20,1990-01-01\n" * 10, encoding="utf-8"
+    )
+    validated: list[int] = []
+    original = _validate_rows
+
+    def validate_rows(adapter, rows, row_offset, row_indices=None):
+        validated.append(row_offset)
+        return original(adapter, rows, row_offset, row_indices)
+
+    monkeypatch.setattr("datavalgen.validate._validate_rows", validate_rows)
+
+    errors = iter_csv_errors(csv_path, SimpleModel, chunk_size=2)
+    first = next(errors)
+    errors.close()
+
+    assert first["loc"] == (0, "id")
+    assert validated == [0]
+
+
+def test_iter_csv_errors_rejects_missing_columns(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,age\n1,20\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Missing expected columns"):
+        next(iter_csv_errors(csv_path, SimpleModel))
+
+
+def test_check_csv_file_stop_after_problem_cells(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_mixed_rows(csv_path, 30)
+
+    first = check_csv_file(csv_path, SimpleModel, chunk_size=4, stop_after=1)
+    some = check_csv_file(csv_path, SimpleModel, chunk_size=4, stop_after=3)
+    full = check_csv_file(csv_path, SimpleModel, chunk_size=4)
+
+    assert first.num_errors == 1
+    assert first.errors[0]["loc"] == (2, "age")
+    assert first.stop_reason is not None
+    assert some.num_errors == 3
+    assert [e["loc"] for e in some.errors] == [(2, "age"), (5, "age"), (8, "age")]
+    assert full.num_errors == 10
+    assert full.stop_reason is None
+
+
+def test_check_csv_file_stop_after_with_workers_matches_serial_run(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_mixed_rows(csv_path, 300)
+
+    serial = check_csv_file(csv_path, SimpleModel, max_errors=2, stop_after=40)
+    parallel = check_csv_file(
+        csv_path, SimpleModel, max_errors=2, stop_after=40, workers=3
+    )
+
+    assert parallel.num_errors == serial.num_errors == 40
+    assert parallel.errors == serial.errors
+    assert parallel.stop_reason == serial.stop_reason
+
+
+def test_check_csv_file_aborts_when_most_rows_fail(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text(
+        "id,age,birthday\n" + "1,1990-01-01,30\n" * 3000, encoding="utf-8"
+    )
+
+    result = check_csv_file(
+        csv_path, SimpleModel, chunk_size=500, abort_error_rate=0.9
+    )
+
+    assert result.stop_reason is not None
+    assert "1000 rows" in result.stop_reason
+    assert result.num_errors == 2000
+
+
+def test_check_csv_file_does_not_abort_on_scattered_errors(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    _write_mixed_rows(csv_path, 3000)
+
+    result = check_csv_file(
+        csv_path, SimpleModel, chunk_size=500, abort_error_rate=0.9
+    )
+
+    assert result.stop_reason is None
+    assert result.num_errors == 1000
+
+
+@pytest.mark.parametrize("bad_rows_first", [False, True])
+def test_abort_error_rate_only_looks_at_the_first_rows(tmp_path, bad_rows_first):
+    csv_path = tmp_path / "data.csv"
+    good = [f"{i},30,1990-01-01" for i in range(1, 6001)]
+    bad = ["1,1990-01-01,30"] * 6000
+    rows = bad + good if bad_rows_first else good + bad
+    csv_path.write_text(
+        "id,age,birthday\n" + "\n".join(rows) + "\n", encoding="utf-8"
+    )
+    options = {"chunk_size": 500, "max_errors": 5, "abort_error_rate": 0.9}
+
+    serial = check_csv_file(csv_path, SimpleModel, **options)
+    parallel = check_csv_file(csv_path, SimpleModel, workers=2, **options)
+
+    assert (serial.stop_reason is not None) == bad_rows_first
+    assert serial.num_errors == (2000 if bad_rows_first else 12000)
+    assert parallel.num_errors == serial.num_errors
+    assert parallel.stop_reason == serial.stop_reason
+
+
+def test_check_csv_files_returns_results_in_input_order(tmp_path):
+    small_path = tmp_path / "small.csv"
+    small_path.write_text("id,age,birthday\n-1,20,1990-01-01\n", encoding="utf-8")
+    large_path = tmp_path / "large.csv"
+    _write_mixed_rows(large_path, 300)
+    missing_path = tmp_path / "missing_column.csv"
+    missing_path.write_text("id,age\n1,20\n", encoding="utf-8")
+    paths = [small_path, large_path, missing_path]
+
+    serial = check_csv_files(paths, SimpleModel, max_errors=2)
+    parallel = check_csv_files(paths, SimpleModel, max_errors=2, workers=2)
+
+    assert [result.num_errors for result in serial] == [1, 100, 1]
+    for serial_result, parallel_result in zip(serial, parallel):
+        assert parallel_result == serial_result
+
+
+def _memory_budget_job(csv_path, model, options):
+    return options.get("memory_budget")
+
+
+def test_check_csv_files_shares_memory_budget_between_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_module, "_check_csv_file_job", _memory_budget_job)
+    paths = [tmp_path / f"{index}.csv" for index in range(3)]
+    for path in paths:
+        path.write_text("id,age,birthday\n1,20,1990-01-01\n", encoding="utf-8")
+
+    budgets = check_csv_files(paths, SimpleModel, workers=2, memory_budget=1000)
+
+    assert budgets == [500, 500, 500]
@@ -0,0 +1,80 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from datavalgen.cli import generate
+from datavalgen.write_table import TableWriter, open_table_writer
+from .test_generation import FlatModelFactory
+
+
+def test_iter_dataframes_splits_rows_into_chunks():
+    chunks = list(FlatModelFactory.iter_dataframes(25, chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    empty = list(FlatModelFactory.iter_dataframes(0, chunk_size=10))
+    assert [len(chunk) for chunk in empty] == [0]
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_chunks_are_written_as_one_table(tmp_path, file_format):
+    path = tmp_path / f"out.{file_format}"
+    chunks = list(FlatModelFactory.iter_dataframes(250, chunk_size=100))
+
+    with open_table_writer(path, file_format) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    assert writer.num_rows == 250
+    if file_format == "csv":
+        written = pd.read_csv(path, keep_default_na=False)
+        assert written["id"].tolist() == pd.concat(chunks)["id"].tolist()
+    else:
+        assert pq.ParquetFile(path).metadata.num_row_groups == 3
+        written = pd.read_parquet(path)
+        expected = pd.concat(chunks, ignore_index=True)
+        pd.testing.assert_frame_equal(written, expected, check_dtype=False)
+
+
+def test_parquet_columns_with_only_nones_in_the_first_chunk(tmp_path):
+    path = tmp_path / "out.parquet"
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "note": [None, None], "empty": [None, None]}),
+        pd.DataFrame({"id": [3, 4], "note": ["a", None], "empty": [None, None]}),
+    ]
+
+    with open_table_writer(path, "parquet") as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    schema = pq.read_schema(path)
+    assert str(schema.field("note").type) == "string"
+    assert str(schema.field("empty").type) == "null"
+    written = pd.read_parquet(path)
+    assert written["id"].tolist() == [1, 2, 3, 4]
+    assert written["note"].tolist() == [None, None, "a", None]
+
+
+def test_generate_cli_streams_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate, "get_factory", lambda *a, **kw: FlatModelFactory)
+    out_path = tmp_path / "out.csv"
+
+    generate.main(
+        [
+            "-f", "flat", "-n", "25", "--chunk-size", "10", "-o", str(out_path),
+            "--columns", "id,stage", "--replace", "stage=II",
+        ]
+    )  # fmt: skip
+
+    written = pd.read_csv(out_path)
+    assert list(written.columns) == ["id", "stage"]
+    assert len(written) == 25
+    assert set(written["stage"]) == {"II"}
+
+
+def test_table_writers_must_implement_close(tmp_path):
+    class NoClose(TableWriter):
+        def _write(self, df):
+            pass
+
+    with pytest.raises(TypeError, match="close"):
+        NoClose(tmp_path / "out.csv")